@@ -0,0 +1,57 @@
+# run from module02: python bench_country_columns.py [rows]
+import json
+import sys
+import time
+
+import numpy as np
+
+from country_columns import CountryTable, load_countries
+
+REPEAT = 10
+
+
+def loop_sum(countries):
+    # exercise01
+    total_population = 0
+    for country in countries:
+        if country["continent"] == "Asia":
+            total_population += country["population"]
+    return total_population
+
+
+def timed(fun, repeat=1):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fun()
+    return result, (time.perf_counter() - t0) / repeat
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    with open("resources/countries.json", encoding="utf-8") as file:
+        countries = json.load(file)
+    table = load_countries("resources/countries.json")
+    copies = -(-rows // len(table))
+    # the same countries repeated, as columns
+    table = CountryTable({name: np.tile(table.column(name), copies)[:rows] for name in
+                          ("continent", "region", "population", "lifeExpectancy")},
+                         {name: table.categories(name) for name in ("continent", "region")})
+    print(f"{len(table):,} rows")
+    dicts = (countries * copies)[:rows]
+    expected, loop_time = timed(lambda: loop_sum(dicts))
+    print(f"loop over dicts, Asia population     : {loop_time * 1e3:9.1f} ms")
+    by_continent, group_time = timed(lambda: table.group_by("continent"))
+    print(f"group_by('continent') (one-off sort) : {group_time * 1e3:9.1f} ms")
+    totals, first_time = timed(lambda: by_continent.sum("population"))
+    assert totals["Asia"] == expected
+    print(f"first sum('population')              : {first_time * 1e3:9.1f} ms")
+    _, repeated_time = timed(lambda: by_continent.sum("population"), REPEAT)
+    print(f"repeated sum('population')           : {repeated_time * 1e3:9.1f} ms")
+    _, mean_time = timed(lambda: by_continent.mean("lifeExpectancy"), REPEAT)
+    print(f"repeated mean('lifeExpectancy')      : {mean_time * 1e3:9.1f} ms")
+    _, count_time = timed(lambda: by_continent.count(), REPEAT)
+    print(f"count()                              : {count_time * 1e3:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
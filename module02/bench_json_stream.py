@@ -0,0 +1,62 @@
+# run from module02: python bench_json_stream.py [copies]
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import reduce
+
+from json_stream import iter_json_array
+
+if_asian = lambda country: country["continent"] == "Asia"
+to_population = lambda country: country["population"]
+to_sum = lambda x, y: x + y
+
+
+def with_json_load(path):
+    with open(path, encoding="utf-8") as file:
+        return reduce(to_sum, map(to_population, filter(if_asian, json.load(file))), 0)
+
+
+def with_stream(path):
+    return reduce(to_sum, map(to_population, filter(if_asian, iter_json_array(path))), 0)
+
+
+def first_with_json_load(path):
+    with open(path, encoding="utf-8") as file:
+        return next(filter(if_asian, json.load(file)))
+
+
+def first_with_stream(path):
+    return next(filter(if_asian, iter_json_array(path)))
+
+
+def measure(fun, path):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fun(path)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with open("resources/countries.json", encoding="utf-8") as file:
+        countries = json.load(file)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "countries.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(countries * copies, file, indent=2)
+        print(f"{len(countries) * copies:,} countries, {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        for name, fun in (("json.load + reduce", with_json_load), ("iter_json_array + reduce", with_stream),
+                          ("json.load, first match", first_with_json_load),
+                          ("iter_json_array, first match", first_with_stream)):
+            _, elapsed, peak = measure(fun, path)
+            print(f"{name:<30}: {elapsed:7.3f} sec, peak {peak / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# run from module02: python bench_map_reduce.py [copies] [max processes]
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from functools import reduce
+from itertools import chain
+
+from map_reduce import map_reduce
+
+
+def genres(movie):
+    return ((genre["name"], 1) for genre in movie["genres"])
+
+
+def continent_population(country):
+    return ((country["continent"], country["population"]),)
+
+
+def group_by_genre_and_sum(groups, element):
+    # exercise05
+    groups[element[0]] = groups.get(element[0], 0) + element[1]
+    return groups
+
+
+def sequential(movies):
+    return reduce(group_by_genre_and_sum, map(lambda genre: (genre["name"], 1),
+                                              chain.from_iterable(map(lambda movie: movie["genres"], movies))),
+                  defaultdict(int))
+
+
+def timed(fun):
+    t0 = time.perf_counter()
+    result = fun()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with open("resources/movies.json", encoding="utf-8") as file:
+        movies = json.load(file) * copies
+    with open("resources/countries.json", encoding="utf-8") as file:
+        countries = json.load(file) * copies
+    expected, elapsed = timed(lambda: sequential(movies))
+    print(f"{len(movies):,} movies, reduce(groupByGenreAndSum): {elapsed:6.2f} sec")
+    cores = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    processes = sorted({1, *(2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores), cores})
+    for n in processes:
+        counts, elapsed = timed(lambda: map_reduce(movies, genres, processes=n))
+        assert counts == expected
+        print(f"genre counts, {n:>3} processes: {elapsed:6.2f} sec")
+    for n in processes:
+        populations, elapsed = timed(lambda: map_reduce(countries, continent_population, processes=n))
+        print(f"continent populations ({len(countries):,} countries), {n:>3} processes: {elapsed:6.2f} sec, "
+              f"Asia {populations['Asia']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# run from module02: python bench_movie_catalog.py [copies]
+import json
+import os
+import sys
+import tempfile
+import time
+
+from movie_catalog import MovieCatalog
+
+QUERIES = 20
+
+_70s = lambda movie: 1970 <= movie["year"] < 1980
+is_drama = lambda movie: any(genre["name"] == "Drama" for genre in movie["genres"])
+
+
+def exercise04(movies):
+    return sorted(filter(_70s, filter(is_drama, movies)), key=lambda movie: movie["year"], reverse=True)
+
+
+def per_query(fun):
+    t0 = time.perf_counter()
+    for _ in range(QUERIES):
+        result = fun()
+    return result, (time.perf_counter() - t0) / QUERIES
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    with open("resources/movies.json", encoding="utf-8") as file:
+        movies = json.load(file) * copies
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "movies.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(movies, file)
+        catalog = MovieCatalog(path)
+        t0 = time.perf_counter()
+        len(catalog)
+        print(f"{len(movies):,} movies, index build {time.perf_counter() - t0:.2f} sec")
+        expected, scan_time = per_query(lambda: exercise04(movies))
+        found, index_time = per_query(lambda: catalog.find("Drama", 1970, 1979, reverse=True))
+        assert found == expected
+        print(f"filter + filter + sorted : {scan_time * 1e3:8.2f} ms/query, {len(expected):,} movies")
+        print(f"MovieCatalog.find        : {index_time * 1e3:8.2f} ms/query")
+        _, narrow_time = per_query(lambda: catalog.find("Drama", 1975, 1975))
+        print(f"MovieCatalog.find, 1975  : {narrow_time * 1e3:8.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
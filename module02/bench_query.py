@@ -0,0 +1,72 @@
+# run from module02: python bench_query.py [copies]
+import json
+import sys
+import time
+from functools import reduce
+
+from query import Query
+
+
+def bau_filter(filter_fun, items):
+    # exercise03's generators, without the prints
+    for item in items:
+        if filter_fun(item):
+            yield item
+
+
+def bau_map(map_fun, items):
+    for item in items:
+        yield map_fun(item)
+
+
+if_asian = lambda country: country["continent"] == "Asia"
+to_population = lambda country: country["population"]
+to_sum = lambda x, y: x + y
+is_large = lambda population: population > 100_000_000
+
+
+def nested_generators(countries):
+    return reduce(to_sum, bau_map(to_population, bau_filter(if_asian, countries)), 0)
+
+
+def reduce_map_filter(countries):
+    # as in exercise02
+    return reduce(to_sum, map(to_population, filter(if_asian, countries)), 0)
+
+
+def query_reduce(countries):
+    return Query(countries).filter(if_asian).map(to_population).reduce(to_sum, 0)
+
+
+def query_sum(countries):
+    return sum(Query(countries).filter(if_asian).map(to_population))
+
+
+def measure(fun, countries, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fun(countries)
+        timings.append(time.perf_counter() - t0)
+    return result, min(timings)
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000
+    with open("resources/countries.json", encoding="utf-8") as file:
+        countries = json.load(file) * copies
+    print(f"{len(countries):,} countries")
+    for name, fun in (("nested bau_filter/bau_map", nested_generators),
+                      ("reduce(map(filter(...)))", reduce_map_filter),
+                      ("Query ... reduce", query_reduce),
+                      ("sum(Query ...)", query_sum)):
+        result, elapsed = measure(fun, countries)
+        print(f"{name:<26}: {elapsed * 1e3:8.1f} ms, total population {result:,}")
+    # short-circuit: stops at the first match instead of filtering everything
+    t0 = time.perf_counter()
+    first = Query(countries).filter(if_asian).map(to_population).first(is_large)
+    print(f"{'Query ... first':<26}: {(time.perf_counter() - t0) * 1e6:8.1f} us, {first:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import numpy as np
+
+from json_stream import iter_json_array
+
+# string fields stored as int codes into a categories list
+CATEGORICAL = ("continent", "region", "governmentForm")
+# missing values are NaN in float columns
+NUMERIC = {"population": np.int64, "surfaceArea": np.float64, "gnp": np.float64,
+           "lifeExpectancy": np.float64, "indepYear": np.float64}
+
+
+def load_countries(source):
+    """
+    Reads countries.json (a path or a binary file) into a CountryTable.
+    """
+    categories = {name: {} for name in CATEGORICAL}
+    codes = {name: [] for name in CATEGORICAL}
+    values = {name: [] for name in NUMERIC}
+    for country in iter_json_array(source):
+        for name in CATEGORICAL:
+            known = categories[name]
+            codes[name].append(known.setdefault(country[name], len(known)))
+        for name in NUMERIC:
+            value = country.get(name)
+            values[name].append(np.nan if value is None else value)
+    columns = {name: np.array(codes[name], dtype=np.int32) for name in CATEGORICAL}
+    columns.update((name, np.array(values[name], dtype=dtype)) for name, dtype in NUMERIC.items())
+    return CountryTable(columns, {name: list(known) for name, known in categories.items()})
+
+
+class CountryTable:
+    """
+    Countries as typed NumPy columns: a code array per categorical field
+    (its values in categories[field]) and one array per numeric field.
+
+    table.group_by("continent").sum("population")["Asia"]
+    """
+
+    def __init__(self, columns, categories):
+        self._columns = columns
+        self._categories = categories
+
+    def __len__(self):
+        return len(next(iter(self._columns.values())))
+
+    def column(self, name):
+        return self._columns[name]
+
+    def categories(self, name):
+        return self._categories[name]
+
+    def group_by(self, *keys):
+        return GroupBy(self, keys)
+
+
+class GroupBy:
+    """
+    Aggregates per distinct combination of the categorical keys, returned
+    as {category: value} dicts ({(category, ...): value} for several keys).
+    Rows are put in group order once (a radix sort of small int codes);
+    every aggregate is then one np.add.reduceat over a group-ordered copy
+    of the column, which is cached, so repeated aggregates cost one pass.
+    """
+
+    def __init__(self, table, keys):
+        if not keys:
+            raise ValueError('At least one key is required')
+        self._table = table
+        self._keys = keys
+        # one code per combination of key codes
+        size = 1
+        codes = np.zeros(len(table), dtype=np.int64)
+        for key in keys:
+            size *= len(table.categories(key))
+            codes = codes * len(table.categories(key)) + table.column(key)
+        if size <= np.iinfo(np.int16).max:
+            # numpy sorts 16 bit ints with a stable radix sort
+            codes = codes.astype(np.int16)
+        self._order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=size)
+        groups = np.flatnonzero(counts)
+        self._counts = counts[groups]
+        self._starts = np.cumsum(self._counts) - self._counts
+        self._labels = [self._label(group) for group in groups.tolist()]
+        # column name -> (column in group order with NaN as 0, non-missing values per group)
+        self._sorted = {}
+
+    def count(self):
+        return dict(zip(self._labels, self._counts.tolist()))
+
+    def sum(self, name):
+        values, _ = self._sorted_column(name)
+        return dict(zip(self._labels, self._reduce(values).tolist()))
+
+    def mean(self, name):
+        # missing (NaN) values are left out, like pandas
+        values, counts = self._sorted_column(name)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return dict(zip(self._labels, (self._reduce(values) / counts).tolist()))
+
+    def _reduce(self, values):
+        if not len(values):
+            return values[:0]
+        return np.add.reduceat(values, self._starts)
+
+    def _sorted_column(self, name):
+        prepared = self._sorted.get(name)
+        if prepared is None:
+            values = self._table.column(name)[self._order]
+            counts = self._counts
+            if values.dtype.kind == "f":
+                missing = np.isnan(values)
+                values[missing] = 0.0
+                counts = counts - self._reduce(missing.astype(np.int64))
+            prepared = self._sorted[name] = (values, counts)
+        return prepared
+
+    def _label(self, group):
+        labels = []
+        for key in reversed(self._keys):
+            categories = self._table.categories(key)
+            group, code = divmod(group, len(categories))
+            labels.append(categories[code])
+        return labels[0] if len(labels) == 1 else tuple(reversed(labels))
@@ -1,7 +1,7 @@
-import json
+from json_stream import iter_json_array
 # imperative approach
-with open("resources/countries.json",encoding="utf-8") as file:
-    countries = json.load(file)
+with open("resources/countries.json","rb") as file:
+    countries = iter_json_array(file)
     total_population = 0
     for country in countries:
         if country["continent"] == "Asia":
@@ -1,10 +1,10 @@
-import json
 from functools import reduce
+from json_stream import iter_json_array
 def get_population(country):
     return country["population"]
 # imperative approach
-with open("resources/countries.json",encoding="utf-8") as file:
-    countries = json.load(file)
+with open("resources/countries.json","rb") as file:
+    countries = iter_json_array(file)
     if_asian = lambda country : country["continent"] == "Asia"
     to_population = lambda country : country["population"]
     to_sum = lambda x,y: x + y
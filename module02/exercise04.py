@@ -1,11 +1,11 @@
-import json
 from collections import defaultdict
 from functools import reduce
+from json_stream import iter_json_array
 _70s = lambda movie: 1970 <= movie["year"] < 1980
 is_drama = lambda movie : any(genre["name"] == "Drama" for genre in movie["genres"])
 # movies in 70s and in Drama
-with open("resources/movies.json","r",encoding="utf-8") as f:
-    movies = json.load(f)
+with open("resources/movies.json","rb") as f:
+    movies = iter_json_array(f)
     drama_movies_in_70s = sorted(filter(_70s,filter(is_drama,movies)),key=lambda movie: movie["year"],reverse=True)
     for movie in drama_movies_in_70s:
         print(movie)
\ No newline at end of file
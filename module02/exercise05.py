@@ -1,7 +1,7 @@
-import json
 from collections import defaultdict
 from functools import reduce
 from itertools import chain
+from json_stream import iter_json_array
 
 
 def groupByGenreAndSum(groups, element):
@@ -9,8 +9,8 @@ def groupByGenreAndSum(groups, element):
     return groups
 
 
-with open("resources/movies.json", "r", encoding="utf-8") as f:
-    movies = json.load(f)
+with open("resources/movies.json", "rb") as f:
+    movies = iter_json_array(f)
     genre_counts = reduce(groupByGenreAndSum, map(lambda genre: (genre["name"], 1),
                                                   chain.from_iterable(map(lambda movie: movie["genres"], movies))),
                           defaultdict(int))
@@ -0,0 +1,84 @@
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# characters that may continue a number cut by the end of a chunk, e.g. "2." + "5e3"
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
+
+
+def iter_json_array(source, chunk_size=1 << 16):
+    """
+    Yields the elements of a top-level JSON array one at a time, reading
+    source (a path or a binary file) in chunks, so memory is bounded by the
+    largest element instead of the whole file:
+
+    reduce(to_sum, map(to_population, filter(if_asian, iter_json_array(path))), 0)
+    """
+    if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+        with open(source, "rb") as file:
+            yield from iter_json_array(file, chunk_size)
+        return
+    reader = _Reader(source, chunk_size)
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        separator = reader.peek()
+        if separator == "]":
+            return
+        reader.expect(",")
+
+
+class _Reader:
+    __slots__ = ("_source", "_chunk_size", "_decoder", "_utf8", "_buffer", "_position", "_eof")
+
+    def __init__(self, source, chunk_size):
+        self._source = source
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def peek(self):
+        # next non-whitespace character, reading more as needed
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._eof:
+                raise ValueError("Unexpected end of JSON array")
+            self._read(self._chunk_size)
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise ValueError(f"Expected {character!r} at {self._buffer[self._position:self._position + 20]!r}")
+        self._position += 1
+
+    def value(self):
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                element, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                end = None
+            # a value touching the end of the buffer (e.g. a number) may go on in the next chunk
+            if end is not None and (self._eof or (end < len(self._buffer)
+                                                  and self._buffer[end] not in _NUMBER_CHARACTERS)):
+                self._position = end
+                return element
+            # larger reads each time, so a big value is re-parsed O(log size) times
+            self._read(size)
+            size *= 2
+
+    def _read(self, size):
+        data = self._source.read(size)
+        self._eof = not data
+        self._buffer = self._buffer[self._position:] + self._utf8.decode(data, final=self._eof)
+        self._position = 0
@@ -0,0 +1,54 @@
+from collections import Counter
+from functools import partial
+from itertools import islice
+from multiprocessing import Pool
+
+
+def map_reduce(items, mapper, processes=None, chunk_size=10_000):
+    """
+    Counter of every (key, value) pair mapper(item) yields, summed by key.
+    items are cut into chunks, each chunk is counted in a process pool, and
+    the per-chunk Counters are merged pairwise in a tree, again in the pool.
+    mapper must be picklable, i.e. a module level function, not a lambda.
+    processes=1 runs everything in this process.
+
+    map_reduce(movies, genres)  with  def genres(movie): return ((genre["name"], 1) for genre in movie["genres"])
+    """
+    chunks = _chunks(items, chunk_size)
+    count_chunk = partial(_count_chunk, mapper)
+    if processes == 1:
+        return _tree_reduce(list(map(count_chunk, chunks)), map)
+    with Pool(processes) as pool:
+        # unordered: addition does not care, and a slow chunk does not hold back the rest
+        counters = list(pool.imap_unordered(count_chunk, chunks))
+        return _tree_reduce(counters, pool.map)
+
+
+def _chunks(items, chunk_size):
+    items = iter(items)
+    while chunk := list(islice(items, chunk_size)):
+        yield chunk
+
+
+def _count_chunk(mapper, chunk):
+    counter = Counter()
+    for item in chunk:
+        for key, value in mapper(item):
+            counter[key] += value
+    return counter
+
+
+def _merge(counters):
+    merged = counters[0]
+    for counter in counters[1:]:
+        merged.update(counter)
+    return merged
+
+
+def _tree_reduce(counters, map_fun):
+    # log2(chunks) levels, each merging disjoint pairs independently
+    if not counters:
+        return Counter()
+    while len(counters) > 1:
+        counters = list(map_fun(_merge, [counters[i:i + 2] for i in range(0, len(counters), 2)]))
+    return counters[0]
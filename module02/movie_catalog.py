@@ -0,0 +1,89 @@
+import os
+from bisect import bisect_left
+
+from json_stream import iter_json_array
+
+
+class MovieCatalog:
+    """
+    Indexed view of a movies.json file. Movies are kept sorted by year, so
+    a year range is a slice of positions found with bisect, and every genre
+    maps to a bitset (a Python int) of the positions of its movies: "genre
+    in years A-B sorted by year" is one AND of two bitsets and a walk over
+    the set bits, instead of testing every movie. The indexes are built on
+    the first query and rebuilt when the file's size or mtime changes.
+
+    MovieCatalog("resources/movies.json").find("Drama", 1970, 1979, reverse=True)
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._version = None
+        self._movies = []
+        self._years = []
+        self._genres = {}
+
+    def __len__(self):
+        self._refresh()
+        return len(self._movies)
+
+    @property
+    def genres(self):
+        self._refresh()
+        return sorted(self._genres)
+
+    def find(self, genre=None, start_year=None, end_year=None, reverse=False):
+        """
+        Movies of genre (any genre if None) with start_year <= year <= end_year,
+        sorted by year, in file order within a year, like sorted(...).
+        """
+        self._refresh()
+        low = 0 if start_year is None else bisect_left(self._years, start_year)
+        high = len(self._years) if end_year is None else bisect_left(self._years, end_year + 1)
+        if low >= high:
+            return []
+        # positions low .. high - 1, shifted down so that bit 0 is position low
+        selected = (1 << (high - low)) - 1
+        if genre is not None:
+            selected &= self._genres.get(genre, 0) >> low
+        movies = [self._movies[low + position] for position in _positions(selected)]
+        if reverse:
+            # stable like sorted(..., reverse=True): equal years stay in file order
+            movies.sort(key=lambda movie: movie["year"], reverse=True)
+        return movies
+
+    def _refresh(self):
+        stat = os.stat(self._path)
+        version = (stat.st_size, stat.st_mtime_ns)
+        if version != self._version:
+            self._build()
+            self._version = version
+
+    def _build(self):
+        movies = sorted(iter_json_array(self._path), key=lambda movie: movie["year"])
+        genres = {}
+        for position, movie in enumerate(movies):
+            for genre in {genre["name"] for genre in movie["genres"]}:
+                genres.setdefault(genre, []).append(position)
+        self._movies = movies
+        self._years = [movie["year"] for movie in movies]
+        self._genres = {genre: _bitset(positions) for genre, positions in genres.items()}
+
+
+def _bitset(positions):
+    # through a bytearray: setting bits one by one in an int would copy it every time
+    bits = bytearray((positions[-1] >> 3) + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _positions(bits):
+    # set bits in increasing order, 64 at a time
+    words = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for offset in range(0, len(words), 8):
+        word = int.from_bytes(words[offset:offset + 8], "little")
+        while word:
+            lowest = word & -word
+            yield offset * 8 + lowest.bit_length() - 1
+            word ^= lowest
@@ -0,0 +1,94 @@
+from functools import reduce
+from itertools import islice
+
+_MISSING = object()
+# (stage kinds, terminal) -> compiled loop
+_loops = {}
+
+
+class Query:
+    """
+    Lazy filter/map pipeline, the bau_filter/bau_map stack of exercise03
+    without a generator per stage: consecutive stages are fused into a
+    single generated loop, so every element costs one generator frame and
+    one call per stage. Nothing runs until the query is iterated or reduced.
+
+    Query(countries).filter(if_asian).map(to_population).reduce(to_sum, 0)
+    """
+
+    def __init__(self, source, stages=()):
+        self._source = source
+        # ("map" | "filter", function) in order
+        self._stages = stages
+
+    def map(self, map_fun):
+        return Query(self._source, self._stages + (("map", map_fun),))
+
+    def filter(self, filter_fun):
+        return Query(self._source, self._stages + (("filter", filter_fun),))
+
+    def take(self, n):
+        # stops pulling from the source after n results
+        return Query(_Taken(self, n))
+
+    def first(self, filter_fun=None, default=None):
+        query = self if filter_fun is None else self.filter(filter_fun)
+        return next(iter(query), default)
+
+    def reduce(self, reduce_fun, initial=_MISSING):
+        # with an initial value, the reduction runs inside the fused loop: no generator at all
+        if initial is _MISSING:
+            return reduce(reduce_fun, self)
+        return _loop(self._stages, "reduce")(self._source, reduce_fun, initial,
+                                              *(fun for _, fun in self._stages))
+
+    def __iter__(self):
+        if not self._stages:
+            return iter(self._source)
+        return _loop(self._stages, "yield")(self._source, *(fun for _, fun in self._stages))
+
+
+class _Taken:
+    __slots__ = ("_query", "_n")
+
+    def __init__(self, query, n):
+        self._query = query
+        self._n = n
+
+    def __iter__(self):
+        return islice(self._query, self._n)
+
+
+def _loop(stages, terminal):
+    kinds = tuple(kind for kind, _ in stages)
+    loop = _loops.get((kinds, terminal))
+    if loop is None:
+        loop = _loops[(kinds, terminal)] = _compile(kinds, terminal)
+    return loop
+
+
+def _compile(kinds, terminal):
+    # e.g. filter, map, yield:
+    #   def loop(source, f0, f1):
+    #       for item in source:
+    #           if not f0(item):
+    #               continue
+    #           item = f1(item)
+    #           yield item
+    functions = [f"f{i}" for i in range(len(kinds))]
+    parameters = ["source"] + (["reduce_fun", "accumulator"] if terminal == "reduce" else []) + functions
+    lines = [f"def loop({', '.join(parameters)}):", "    for item in source:"]
+    for kind, function in zip(kinds, functions):
+        if kind == "map":
+            lines.append(f"        item = {function}(item)")
+        else:
+            lines.append(f"        if not {function}(item):")
+            lines.append("            continue")
+    if terminal == "reduce":
+        lines.append("        accumulator = reduce_fun(accumulator, item)")
+        lines.append("    return accumulator")
+    else:
+        lines.append("        yield item")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["loop"]
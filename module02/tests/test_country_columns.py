@@ -0,0 +1,66 @@
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from country_columns import load_countries
+
+COUNTRIES = Path(__file__).parent.parent / "resources" / "countries.json"
+KEYS = [("continent",), ("region",), ("continent", "governmentForm")]
+
+
+@pytest.fixture(scope="module")
+def countries():
+    with open(COUNTRIES, "rb") as file:
+        return json.load(file)
+
+
+@pytest.fixture(scope="module")
+def a_table():
+    return load_countries(COUNTRIES)
+
+
+def label(country, keys):
+    return country[keys[0]] if len(keys) == 1 else tuple(country[key] for key in keys)
+
+
+def groups(countries, keys, name):
+    # group -> non-missing values of name, in a plain dict loop
+    values = {}
+    for country in countries:
+        group = values.setdefault(label(country, keys), [])
+        if country.get(name) is not None:
+            group.append(country[name])
+    return values
+
+
+def test_load_countries(a_table, countries):
+    assert len(a_table) == len(countries)
+    codes = a_table.column("continent").tolist()
+    assert [a_table.categories("continent")[code] for code in codes] == [c["continent"] for c in countries]
+
+
+@pytest.mark.parametrize("keys", KEYS)
+def test_count_should_match_a_dict_loop(a_table, countries, keys):
+    expected = {}
+    for country in countries:
+        expected[label(country, keys)] = expected.get(label(country, keys), 0) + 1
+    assert a_table.group_by(*keys).count() == expected
+
+
+@pytest.mark.parametrize("keys", KEYS)
+@pytest.mark.parametrize("name", ["population", "surfaceArea", "gnp", "lifeExpectancy", "indepYear"])
+def test_sum_and_mean_should_match_a_dict_loop(a_table, countries, keys, name):
+    grouped = a_table.group_by(*keys)
+    values = groups(countries, keys, name)
+    assert grouped.sum(name) == pytest.approx({group: sum(v) for group, v in values.items()})
+    expected_means = {group: sum(v) / len(v) if v else math.nan for group, v in values.items()}
+    assert grouped.mean(name) == pytest.approx(expected_means, nan_ok=True)
+    # cached group-ordered columns give the same answer again
+    assert grouped.mean(name) == pytest.approx(expected_means, nan_ok=True)
+
+
+def test_group_by_without_keys_should_fail(a_table):
+    with pytest.raises(ValueError):
+        a_table.group_by()
@@ -0,0 +1,49 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from json_stream import iter_json_array
+
+RESOURCES = Path(__file__).parent.parent / "resources"
+DOCUMENTS = [
+    "[]",
+    " [ ] ",
+    "[1]",
+    "[12345, -0.5, 2.5e-3, 1E+10, -7]",
+    "[true, false, null, true]",
+    '[{"name": "İstanbul", "emoji": "\U0001F30D", "escaped": "\\u00e7\\"x"}, "çğüşö"]',
+    '[[1, [2, []]], {"a": {"b": null}}, "", {}]',
+    "\n[\n  1 ,\n  \"two\"\t,3.0\n]\n",
+]
+
+
+def stream(text, encoding="utf-8"):
+    return io.BytesIO(text.encode(encoding))
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_iter_json_array_should_match_json_loads(document, chunk_size):
+    assert list(iter_json_array(stream(document), chunk_size)) == json.loads(document)
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_iter_json_array_should_skip_bom(chunk_size):
+    document = '["ç", 10.25]'
+    assert list(iter_json_array(stream(document, "utf-8-sig"), chunk_size)) == json.loads(document)
+
+
+@pytest.mark.parametrize("name", ["countries.json", "movies.json"])
+def test_iter_json_array_should_match_json_load_on_resources(name):
+    with open(RESOURCES / name, "rb") as file:
+        expected = json.load(file)
+    assert list(iter_json_array(RESOURCES / name, chunk_size=1_000)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+@pytest.mark.parametrize("document", ["", "[", "[1", "[1,", "[1, 2", "[tru", "[1, nul", '["abc', "[1 2]", "{}"])
+def test_iter_json_array_should_reject_truncated_input(document, chunk_size):
+    with pytest.raises(ValueError):
+        list(iter_json_array(stream(document), chunk_size))
@@ -0,0 +1,62 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from movie_catalog import MovieCatalog
+
+MOVIES = Path(__file__).parent.parent / "resources" / "movies.json"
+
+
+@pytest.fixture(scope="module")
+def movies():
+    with open(MOVIES, "rb") as file:
+        return json.load(file)
+
+
+@pytest.fixture(scope="module")
+def a_catalog():
+    return MovieCatalog(MOVIES)
+
+
+def expected(movies, genre, start_year, end_year, reverse):
+    # exercise04: filter, then sorted by year
+    def selected(movie):
+        return ((genre is None or any(g["name"] == genre for g in movie["genres"]))
+                and (start_year is None or start_year <= movie["year"])
+                and (end_year is None or movie["year"] <= end_year))
+
+    return sorted(filter(selected, movies), key=lambda movie: movie["year"], reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("genre", ["Drama", "Comedy", "Horror", "No such genre", None])
+@pytest.mark.parametrize("start_year, end_year", [(1970, 1979), (1900, 2100), (1995, 1995), (1980, 1970),
+                                                  (None, 1960), (2000, None), (None, None)])
+def test_find_should_match_filter_and_sorted(a_catalog, movies, genre, start_year, end_year, reverse):
+    assert a_catalog.find(genre, start_year, end_year, reverse) == expected(movies, genre, start_year, end_year,
+                                                                            reverse)
+
+
+def test_genres(a_catalog, movies):
+    assert len(a_catalog) == len(movies)
+    assert a_catalog.genres == sorted({genre["name"] for movie in movies for genre in movie["genres"]})
+
+
+def test_catalog_should_rebuild_when_the_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "movies.json"
+    path.write_text(json.dumps([{"title": "a", "year": 1971, "genres": [{"name": "Drama"}]}]))
+    catalog = MovieCatalog(path)
+    builds = []
+    build = catalog._build
+    monkeypatch.setattr(catalog, "_build", lambda: builds.append(build()))
+    assert [movie["title"] for movie in catalog.find("Drama")] == ["a"]
+    assert catalog.find("Drama", 1972) == []
+    assert len(builds) == 1
+    # same size, new mtime
+    path.write_text(json.dumps([{"title": "b", "year": 1972, "genres": [{"name": "Drama"}]}]))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert [movie["title"] for movie in catalog.find("Drama", 1972)] == ["b"]
+    assert len(builds) == 2
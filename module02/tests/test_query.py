@@ -0,0 +1,64 @@
+from functools import reduce
+from itertools import count, product
+
+import pytest
+
+from query import Query
+
+# stage functions, different per position so that fusing them in the wrong order shows
+FUNCTIONS = {"map": [lambda x: x + 1, lambda x: x * 3, lambda x: x - 7],
+             "filter": [lambda x: x % 2 == 0, lambda x: x % 3 != 0, lambda x: x > 5]}
+PIPELINES = [kinds for size in range(4) for kinds in product(("map", "filter"), repeat=size)]
+
+
+def build(source, kinds):
+    query, expected = Query(source), source
+    for i, kind in enumerate(kinds):
+        fun = FUNCTIONS[kind][i]
+        query = getattr(query, kind)(fun)
+        expected = map(fun, expected) if kind == "map" else filter(fun, expected)
+    return query, expected
+
+
+@pytest.mark.parametrize("kinds", PIPELINES)
+def test_iteration_should_match_map_and_filter(kinds):
+    query, expected = build(range(50), kinds)
+    assert list(query) == list(expected)
+    # a query can be run again
+    assert list(query) == list(build(range(50), kinds)[1])
+
+
+@pytest.mark.parametrize("kinds", PIPELINES)
+def test_reduce_should_match_functools_reduce(kinds):
+    query, expected = build(range(50), kinds)
+    assert query.reduce(lambda a, b: a * 31 + b, 7) == reduce(lambda a, b: a * 31 + b, expected, 7)
+    query, expected = build(range(50), kinds)
+    assert query.reduce(lambda a, b: a * 31 + b) == reduce(lambda a, b: a * 31 + b, expected)
+
+
+def test_reduce_without_initial_value_on_empty_query_should_fail():
+    assert Query([]).reduce(lambda a, b: a + b, 0) == 0
+    with pytest.raises(TypeError):
+        Query(range(10)).filter(lambda x: x > 10).reduce(lambda a, b: a + b)
+
+
+def test_take_should_stop_pulling_from_the_source():
+    source = count()
+    query = Query(source).filter(lambda x: x % 2 == 0).take(5)
+    assert list(query) == [0, 2, 4, 6, 8]
+    assert next(source) == 9
+
+
+def test_chained_take_should_apply_every_limit():
+    query = Query(range(100)).map(lambda x: x * 2).take(10).filter(lambda x: x % 3 == 0).take(3)
+    assert list(query) == [0, 6, 12]
+    assert Query(range(100)).take(10).take(20).reduce(lambda a, b: a + b, 0) == sum(range(10))
+    assert list(Query(range(100)).take(0)) == []
+
+
+def test_first_should_return_the_default_when_nothing_matches():
+    query = Query(range(10)).map(lambda x: x * x)
+    assert query.first() == 0
+    assert query.first(lambda x: x > 10) == 16
+    assert query.first(lambda x: x > 100) is None
+    assert query.first(lambda x: x > 100, default=-1) == -1
@@ -1,5 +1,9 @@
 from enum import Enum
 
+from banking.locking import StripedLock
+from banking.money import ZERO, Money, to_cents
+from banking.transaction import DEPOSIT, OVERDRAFT, STATUS, WITHDRAW
+
 
 class InsufficientBalanceException(Exception):
     def __init__(self, message, deficit):
@@ -14,44 +18,78 @@ class AccountStatus(Enum):
     BLOCKED = 300
 
 
-class Account:
+class SlottedAccount:
+    # no per-instance __dict__: see Account for the dict-based variant
+    __slots__ = ("__iban", "_balance", "__status", "_listener")
+    # shared by all accounts; Bank.transfer takes the same locks
+    lock_pool = StripedLock()
+
     def __init__(self, iban, balance=5_000, status=AccountStatus.ACTIVE):
         # attributes/state/data: iban, balance
         self.__iban = iban
         # constraint: self.balance must be always positive or zero
-        self._balance = balance
+        # integer cents, no float rounding drift; handed out as Money
+        self._balance = to_cents(balance)
         self.__status = status
+        # set by the owning bank, told about every successful change
+        self._listener = None
 
     def deposit(self, amount):
-        # business rule
-        if self.__status != AccountStatus.ACTIVE:
-            raise ValueError('Account is not active')
-        # validation rule
-        if amount <= 0.0:
-            raise ValueError('Amount must be positive')
-        self._balance = self._balance + amount
-        return self._balance
+        amount = to_cents(amount)
+        with self.lock_pool.lock_for(self.iban):
+            # business rule
+            if self.status != AccountStatus.ACTIVE:
+                raise ValueError('Account is not active')
+            # validation rule
+            if amount <= 0:
+                raise ValueError('Amount must be positive')
+            self._balance += amount
+            if self._listener is not None:
+                self._listener.account_changed(self, DEPOSIT, Money(amount))
+            return Money(self._balance)
 
     # business method
     def withdraw(self, amount):
-        # business rule
-        if self.__status != AccountStatus.ACTIVE:
-            raise ValueError('Account is not active')
-        # validation rule
-        if amount <= 0.0:
-            raise ValueError('Amount must be positive')
-        # business rule
-        if amount > self._balance:
-            deficit = amount - self._balance
-            # business exception
-            raise InsufficientBalanceException("Your balance does not cover your expenses", deficit)
-        self._balance = self._balance - amount
-        return self._balance
+        amount = to_cents(amount)
+        with self.lock_pool.lock_for(self.iban):
+            # business rule
+            if self.status != AccountStatus.ACTIVE:
+                raise ValueError('Account is not active')
+            # validation rule
+            if amount <= 0:
+                raise ValueError('Amount must be positive')
+            # business rule
+            available_balance = self._available_cents()
+            if amount > available_balance:
+                deficit = Money(amount - available_balance)
+                # business exception
+                raise InsufficientBalanceException("Your balance does not cover your expenses", deficit)
+            self._balance -= amount
+            if self._listener is not None:
+                self._listener.account_changed(self, WITHDRAW, Money(amount))
+            return Money(self._balance)
 
     @property
     def balance(self):
+        return Money(self._balance)
+
+    @property
+    def available_balance(self):
+        # the most that can be withdrawn right now
+        return Money(self._available_cents())
+
+    def _available_cents(self):
         return self._balance
 
+    @property
+    def is_checking(self):
+        # True for accounts that may go overdrawn, down to -overdraft_balance
+        return False
+
+    @property
+    def overdraft_balance(self):
+        return ZERO
+
     @property
     def iban(self):
         return self.__iban
@@ -66,10 +104,18 @@ class Account:
             raise ValueError('Status cannot be None')
         if status not in [AccountStatus.ACTIVE, AccountStatus.CLOSED, AccountStatus.BLOCKED]:
             raise ValueError('Status must be either "Active", "Closed", "Blocked"')
-        self.__status = status
+        with self.lock_pool.lock_for(self.__iban):
+            self.__status = status
+            if self._listener is not None:
+                self._listener.account_changed(self, STATUS, status)
 
     def __str__(self):
-        return f"Account: iban: {self.__iban}, balance: {self._balance}, status: {self.__status}"
+        return f"Account: iban: {self.iban}, balance: {self.balance}, status: {self.status}"
+
+
+class Account(SlottedAccount):
+    # same behaviour as SlottedAccount, plus a __dict__ for ad hoc attributes
+    pass
 
 
 """
@@ -78,35 +124,38 @@ Account        : super class, base class
 """
 
 
-class CheckingAccount(Account):
+class SlottedCheckingAccount(SlottedAccount):
+    __slots__ = ("__overdraftAmount",)
+
     def __init__(self, iban, balance=5_000, status=AccountStatus.ACTIVE, overdraft_amount=1_000):
         super().__init__(iban, balance, status)
-        self.__overdraftAmount = overdraft_amount
+        self.__overdraftAmount = to_cents(overdraft_amount)
 
     # overriding
-    def withdraw(self, amount):
-        if self.__status != AccountStatus.ACTIVE:
-            raise ValueError('Account is not active')
-        # validation rule
-        if amount <= 0.0:
-            raise ValueError('Amount must be positive')
-        # business rule
-        if amount > (self._balance + self.__overdraftAmount):
-            deficit = amount - self._balance - self.__overdraftAmount
-            # business exception
-            raise InsufficientBalanceException("Your balance does not cover your expenses", deficit)
-        self._balance = self._balance - amount
-        return self._balance
+    def _available_cents(self):
+        return self._balance + self.__overdraftAmount
+
+    @property
+    def is_checking(self):
+        return True
 
     @property
     def overdraft_balance(self):
-        return self.__overdraftAmount
+        return Money(self.__overdraftAmount)
 
     @overdraft_balance.setter
     def overdraft_balance(self, overdraft_amount):
-        if overdraft_amount <= 0.0:
+        overdraft_amount = to_cents(overdraft_amount)
+        if overdraft_amount <= 0:
             raise ValueError('Overdraft amount must be positive')
-        self.__overdraftAmount = overdraft_amount
+        with self.lock_pool.lock_for(self.iban):
+            self.__overdraftAmount = overdraft_amount
+            if self._listener is not None:
+                self._listener.account_changed(self, OVERDRAFT, Money(overdraft_amount))
 
     def __str__(self):
-        return f"CheckingAccount: iban: {self.iban}, balance: {self.balance}, status: {self.status}, overdraftAmount: {self.__overdraftAmount}"
\ No newline at end of file
+        return f"CheckingAccount: iban: {self.iban}, balance: {self.balance}, status: {self.status}, overdraftAmount: {self.overdraft_balance}"
+
+
+class CheckingAccount(SlottedCheckingAccount, Account):
+    pass
@@ -0,0 +1,140 @@
+import heapq
+from collections import namedtuple
+from itertools import count
+from threading import Lock
+
+from banking.account import AccountStatus
+from banking.transaction import STATUS
+
+Aggregate = namedtuple("Aggregate", ["total", "count", "minimum", "maximum"])
+
+
+class BankAggregates:
+    """
+    Running balance aggregates of a Bank per AccountStatus and per customer,
+    kept up to date as a bank listener. total and count are maintained
+    exactly; minimum and maximum come from heaps with lazily dropped stale
+    entries, so every read is O(1) amortized instead of a walk over all accounts.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._by_status = {status: _Group() for status in AccountStatus}
+        self._by_customer = {}
+        # iban -> (status, customer identity) the account is currently counted under
+        self._memberships = {}
+
+    def attach(self, bank):
+        for customer in bank.customers:
+            for account in customer.accounts:
+                self.account_added(customer, account)
+        bank.add_listener(self)
+
+    def by_status(self, status):
+        with self._lock:
+            return self._by_status[status].aggregate()
+
+    def by_customer(self, identity):
+        with self._lock:
+            group = self._by_customer.get(identity)
+            return group.aggregate() if group is not None else _Group().aggregate()
+
+    def verify(self, bank):
+        """
+        Recomputes every aggregate from scratch and returns the differences
+        as (key, expected, actual) tuples; an empty list means consistent.
+        """
+        expected_by_status = {status: _Group() for status in AccountStatus}
+        expected_by_customer = {}
+        for customer in bank.customers:
+            group = expected_by_customer.setdefault(customer.identity, _Group())
+            for account in customer.accounts:
+                group.set(account.iban, account.balance)
+                expected_by_status[account.status].set(account.iban, account.balance)
+        differences = []
+        with self._lock:
+            for status in AccountStatus:
+                expected, actual = expected_by_status[status].aggregate(), self._by_status[status].aggregate()
+                if expected != actual:
+                    differences.append((status, expected, actual))
+            for identity in expected_by_customer.keys() | self._by_customer.keys():
+                expected = expected_by_customer.get(identity, _Group()).aggregate()
+                actual = self._by_customer.get(identity, _Group()).aggregate()
+                if expected != actual:
+                    differences.append((identity, expected, actual))
+        return differences
+
+    # bank listener
+    def account_added(self, customer, account):
+        with self._lock:
+            self._memberships[account.iban] = (account.status, customer.identity)
+            self._by_status[account.status].set(account.iban, account.balance)
+            self._by_customer.setdefault(customer.identity, _Group()).set(account.iban, account.balance)
+
+    def account_removed(self, customer, account):
+        with self._lock:
+            status, identity = self._memberships.pop(account.iban)
+            self._by_status[status].discard(account.iban)
+            self._by_customer[identity].discard(account.iban)
+
+    def account_changed(self, account, operation, value):
+        with self._lock:
+            status, identity = self._memberships[account.iban]
+            if operation == STATUS and value != status:
+                self._by_status[status].discard(account.iban)
+                status = value
+                self._memberships[account.iban] = (status, identity)
+            self._by_status[status].set(account.iban, account.balance)
+            self._by_customer[identity].set(account.iban, account.balance)
+
+
+class _Group:
+    __slots__ = ("_total", "_balances", "_minimums", "_maximums", "_versions")
+
+    def __init__(self):
+        self._total = 0
+        # iban -> (balance, version); heap entries with an older version are stale
+        self._balances = {}
+        self._minimums = []
+        self._maximums = []
+        self._versions = count()
+
+    def set(self, iban, balance):
+        current = self._balances.get(iban)
+        if current is not None:
+            if current[0] == balance:
+                return
+            self._total -= current[0]
+        version = next(self._versions)
+        self._balances[iban] = (balance, version)
+        self._total += balance
+        heapq.heappush(self._minimums, (balance, version, iban))
+        heapq.heappush(self._maximums, (-balance, version, iban))
+        if len(self._minimums) > 2 * len(self._balances) + 64:
+            self._compact()
+
+    def discard(self, iban):
+        current = self._balances.pop(iban, None)
+        if current is not None:
+            self._total -= current[0]
+
+    def aggregate(self):
+        if not self._balances:
+            return Aggregate(0, 0, None, None)
+        minimum = self._top(self._minimums)[0]
+        maximum = -self._top(self._maximums)[0]
+        return Aggregate(self._total, len(self._balances), minimum, maximum)
+
+    def _top(self, heap):
+        while True:
+            _, version, iban = top = heap[0]
+            current = self._balances.get(iban)
+            if current is not None and current[1] == version:
+                return top
+            heapq.heappop(heap)
+
+    def _compact(self):
+        self._minimums = [(balance, version, iban) for iban, (balance, version) in self._balances.items()]
+        self._maximums = [(-balance, version, iban) for balance, version, iban in self._minimums]
+        heapq.heapify(self._minimums)
+        heapq.heapify(self._maximums)
@@ -0,0 +1,97 @@
+import asyncio
+from collections import deque
+
+from banking.transaction import DEPOSIT, WITHDRAW
+
+
+class CommitFailedException(Exception):
+    # the operation was applied (result is what it returned), only its commit failed
+    def __init__(self, message, result):
+        super().__init__()
+        self.message = message
+        self.result = result
+
+
+class AsyncBank:
+    """
+    asyncio facade over a Bank: every IBAN gets a mailbox served by its own
+    task, so commands on one account run in submission order while commands
+    on different accounts interleave. A mailbox lives only while it has work.
+    commit, if given, is awaited after every successful deposit/withdraw
+    (e.g. to persist it) as commit(account, operation, amount). A failing
+    commit does not roll the operation back: the caller gets a
+    CommitFailedException with the operation's result, and the commit's
+    exception as its __cause__. Any other exception means nothing changed.
+    """
+
+    def __init__(self, bank, commit=None):
+        self._bank = bank
+        self._commit = commit
+        self._mailboxes = {}
+
+    @property
+    def active_mailboxes(self):
+        return len(self._mailboxes)
+
+    async def deposit(self, iban, amount):
+        return await self._submit(iban, DEPOSIT, amount)
+
+    async def withdraw(self, iban, amount):
+        return await self._submit(iban, WITHDRAW, amount)
+
+    async def balance(self, iban):
+        return await self._submit(iban, None, None)
+
+    def _submit(self, iban, operation, amount):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        mailbox = self._mailboxes.get(iban)
+        if mailbox is None:
+            mailbox = self._mailboxes[iban] = _Mailbox()
+            mailbox.task = loop.create_task(self._serve(iban, mailbox))
+        mailbox.commands.append((future, operation, amount))
+        return future
+
+    async def _serve(self, iban, mailbox):
+        account = self._bank.get_account(iban)
+        commands = mailbox.commands
+        try:
+            while commands:
+                future, operation, amount = commands.popleft()
+                if future.cancelled():
+                    continue
+                try:
+                    if account is None:
+                        raise ValueError('Account does not exist')
+                    if operation == DEPOSIT:
+                        result = account.deposit(amount)
+                    elif operation == WITHDRAW:
+                        result = account.withdraw(amount)
+                    else:
+                        result = account.balance
+                    if operation is not None and self._commit is not None:
+                        try:
+                            await self._commit(account, operation, amount)
+                        except Exception as exception:
+                            raise CommitFailedException('Operation applied but not committed', result) from exception
+                except Exception as exception:
+                    if not future.cancelled():
+                        future.set_exception(exception)
+                else:
+                    if not future.cancelled():
+                        future.set_result(result)
+        finally:
+            # nothing awaits between the empty check and this removal,
+            # so a later command always finds either this mailbox or none
+            del self._mailboxes[iban]
+            # only left over if this task itself was cancelled
+            for future, _, _ in commands:
+                future.cancel()
+
+
+class _Mailbox:
+    __slots__ = ("commands", "task")
+
+    def __init__(self):
+        self.commands = deque()
+        self.task = None
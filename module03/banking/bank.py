@@ -1,10 +1,47 @@
-from banking.customer import Customer
+from itertools import islice
 
+from banking.account import Account, AccountStatus, CheckingAccount, SlottedAccount, SlottedCheckingAccount
+from banking.customer import Customer, SlottedCustomer
+from banking.dump import BankImage, dump
+from banking.money import Money, to_cents
+from banking.transaction import DEPOSIT, WITHDRAW, TransactionResult
+
+
+class SlottedBank:
+    # no per-instance __dict__: see Bank for the dict-based variant
+    __slots__ = ("_name", "_customers", "_customers_by_identity", "_accounts_by_iban", "_listeners", "_image")
+    customer_class = SlottedCustomer
+    account_class = SlottedAccount
+    checking_account_class = SlottedCheckingAccount
 
-class Bank:
     def __init__(self, name):
         self._name = name
         self._customers = []
+        # indexes: identity -> customer, iban -> account
+        self._customers_by_identity = {}
+        self._accounts_by_iban = {}
+        # notified with account_added(customer, account), account_removed(customer, account)
+        # and account_changed(account, operation, value)
+        self._listeners = []
+        # set by a lazy load: customers not materialized yet are looked up there
+        self._image = None
+
+    @classmethod
+    def load(cls, path, lazy=False):
+        """
+        Loads a bank written by dump. With lazy=True the file is only mapped:
+        a customer and its accounts are materialized when first looked up,
+        and everything on the first walk over customers.
+        """
+        image = BankImage(path)
+        bank = cls(image.name)
+        bank._image = image
+        if not lazy:
+            bank._load_all()
+        return bank
+
+    def dump(self, path):
+        dump(self, path)
 
     @property
     def name(self):
@@ -12,16 +49,156 @@ class Bank:
 
     @property
     def customers(self):
+        if self._image is not None:
+            self._load_all()
         return self._customers
 
     def create_customer(self, identity, fullname):
-        customer = Customer(identity, fullname)
+        if self.get_customer(identity) is not None:
+            raise ValueError('Customer already exists')
+        customer = self.customer_class(identity, fullname, self)
         self._customers.append(customer)
+        self._customers_by_identity[identity] = customer
+        return customer
+
+    def get_customer(self, identity):
+        customer = self._customers_by_identity.get(identity)
+        # read once: another thread's _load_all may drop the image meanwhile
+        image = self._image
+        if customer is None and image is not None:
+            customer = image.load_customer(self, identity)
         return customer
 
     def get_account(self, iban):
-        for customer in self._customers:
-            account = customer.get_account(iban)
-            if account is not None:
-                return account
-        return None
\ No newline at end of file
+        account = self._accounts_by_iban.get(iban)
+        image = self._image
+        if account is None and image is not None:
+            account = image.load_account(self, iban)
+        return account
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def account_changed(self, account, operation, value):
+        for listener in self._listeners:
+            listener.account_changed(account, operation, value)
+
+    def transfer(self, from_iban, to_iban, amount):
+        if from_iban == to_iban:
+            raise ValueError('Cannot transfer to the same account')
+        from_account = self.get_account(from_iban)
+        to_account = self.get_account(to_iban)
+        if from_account is None or to_account is None:
+            raise ValueError('Account does not exist')
+        # both stripes are taken in a fixed order: no deadlock between opposite transfers
+        with SlottedAccount.lock_pool.locked((from_iban, to_iban)):
+            # checked before withdrawing so that a failing deposit never needs a rollback
+            if to_account.status != AccountStatus.ACTIVE:
+                raise ValueError('Account is not active')
+            from_account.withdraw(amount)
+            to_account.deposit(amount)
+
+    def apply_transactions(self, transactions, batch_size=65_536):
+        """
+        Applies a stream of (iban, operation, amount) records and yields one
+        TransactionResult per record, in input order, instead of raising.
+        At most batch_size records are held in memory at any time.
+        """
+        transactions = iter(transactions)
+        while batch := list(islice(transactions, batch_size)):
+            with SlottedAccount.lock_pool.locked({iban for iban, _, _ in batch}):
+                results = self._apply_batch(batch)
+            yield from results
+
+    def _apply_batch(self, batch):
+        # local aliases keep attribute lookups out of the hot loop
+        success = TransactionResult.SUCCESS
+        not_active = TransactionResult.ACCOUNT_NOT_ACTIVE
+        invalid_amount = TransactionResult.INVALID_AMOUNT
+        insufficient_balance = TransactionResult.INSUFFICIENT_BALANCE
+        find_account = self._accounts_by_iban.get if self._image is None else self.get_account
+        # bulk updates bypass deposit/withdraw, so listeners are told here
+        account_changed = self.account_changed if self._listeners else None
+        results = []
+        append = results.append
+        # iban -> [account, running balance, lowest allowed balance, is active], in cents
+        # each account is looked up and checked once per batch, written back once
+        states = {}
+        find_state = states.get
+        for iban, operation, amount in batch:
+            state = find_state(iban)
+            if state is None:
+                account = find_account(iban)
+                if account is None:
+                    append(TransactionResult.UNKNOWN_ACCOUNT)
+                    continue
+                balance = account._balance
+                # 0 for Account, -overdraft for CheckingAccount
+                floor = balance - account._available_cents()
+                state = states[iban] = [account, balance, floor, account.status == AccountStatus.ACTIVE]
+            if operation != DEPOSIT and operation != WITHDRAW:
+                append(TransactionResult.UNKNOWN_OPERATION)
+                continue
+            if not state[3]:
+                append(not_active)
+                continue
+            try:
+                cents = to_cents(amount)
+            except ValueError:
+                # not a number, NaN or infinite
+                cents = 0
+            if cents <= 0:
+                append(invalid_amount)
+            elif operation == DEPOSIT:
+                state[1] += cents
+                append(success)
+                if account_changed is not None:
+                    state[0]._balance = state[1]
+                    account_changed(state[0], DEPOSIT, Money(cents))
+            elif cents > state[1] - state[2]:
+                append(insufficient_balance)
+            else:
+                state[1] -= cents
+                append(success)
+                if account_changed is not None:
+                    state[0]._balance = state[1]
+                    account_changed(state[0], WITHDRAW, Money(cents))
+        for account, balance, _, _ in states.values():
+            account._balance = balance
+        return results
+
+    def _load_all(self):
+        image = self._image
+        if image is None:
+            # another thread got here first
+            return
+        # dump order first, then customers created since the load
+        loaded = image.load_all(self)
+        from_image = {id(customer) for customer in loaded}
+        self._customers = loaded + [customer for customer in self._customers if id(customer) not in from_image]
+        self._image = None
+
+    def _index_account(self, customer, account):
+        if self.get_account(account.iban) is not None:
+            raise ValueError('Account already exists')
+        # listeners hear about the account before any change to it
+        for listener in self._listeners:
+            listener.account_added(customer, account)
+        self._accounts_by_iban[account.iban] = account
+        account._listener = self
+
+    def _unindex_account(self, customer, account):
+        if self._accounts_by_iban.pop(account.iban, None) is not None:
+            account._listener = None
+            for listener in self._listeners:
+                listener.account_removed(customer, account)
+
+
+class Bank(SlottedBank):
+    # same behaviour as SlottedBank, plus a __dict__ for ad hoc attributes
+    customer_class = Customer
+    account_class = Account
+    checking_account_class = CheckingAccount
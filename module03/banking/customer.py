@@ -1,8 +1,13 @@
-class Customer:
-    def __init__(self, identity, fullname):
+class SlottedCustomer:
+    # no per-instance __dict__: see Customer for the dict-based variant
+    __slots__ = ("__identity", "__fullname", "__accounts", "__bank")
+
+    def __init__(self, identity, fullname, bank=None):
         self.__identity = identity
         self.__fullname = fullname
         self.__accounts = []
+        # owning bank keeps the bank-wide iban index in sync
+        self.__bank = bank
 
     @property
     def identity(self):
@@ -21,13 +26,22 @@ class Customer:
         return self.__accounts
 
     def add_account(self, account):
+        if self.__bank is not None:
+            self.__bank._index_account(self, account)
         self.__accounts.append(account)
 
     def remove_account(self, account):
         self.__accounts.remove(account)
+        if self.__bank is not None:
+            self.__bank._unindex_account(self, account)
 
     def get_account(self, iban):
         for account in self.__accounts:
             if account.iban == iban:
                 return account
-        return None
\ No newline at end of file
+        return None
+
+
+class Customer(SlottedCustomer):
+    # same behaviour as SlottedCustomer, plus a __dict__ for ad hoc attributes
+    pass
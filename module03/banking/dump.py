@@ -0,0 +1,197 @@
+import mmap
+import struct
+from bisect import bisect_left
+from threading import Lock
+
+import numpy as np
+
+from banking.account import AccountStatus
+from banking.money import Money
+
+MAGIC = b"BNKDUMP1"
+# magic, customers, accounts, strings, string bytes
+HEADER = struct.Struct("<8sQQQQ")
+# identity and fullname are string table indexes; a customer's accounts are
+# the rows first_account .. first_account + accounts - 1 of the account table
+CUSTOMER_DTYPE = np.dtype([("identity", "<u4"), ("fullname", "<u4"), ("first_account", "<u4"),
+                           ("accounts", "<u4")])
+# balance and overdraft in cents, kind 1 for checking accounts
+ACCOUNT_DTYPE = np.dtype([("balance", "<i8"), ("overdraft", "<i8"), ("iban", "<u4"), ("customer", "<u4"),
+                          ("status", "<i2"), ("kind", "u1"), ("padding", "V5")])
+
+
+def dump(bank, path):
+    """
+    Writes the bank as one file: a header, the customer and account tables
+    as packed columns, both tables' rows sorted by identity / iban for
+    lookups, and a string table holding the bank name, identities, names
+    and ibans once each (names repeat, so they are shared). These must all
+    be strings: anything else raises ValueError, before the file is written.
+    """
+    strings = {bank.name: 0}
+    intern = strings.setdefault
+    customers = bank.customers
+    accounts = [account for customer in customers for account in customer.accounts]
+    _check_strings("bank name", [bank.name])
+    _check_strings("customer identity", [customer.identity for customer in customers])
+    _check_strings("customer fullname", [customer.fullname for customer in customers])
+    _check_strings("iban", [account.iban for account in accounts])
+    customer_table = np.zeros(len(customers), dtype=CUSTOMER_DTYPE)
+    account_table = np.zeros(len(accounts), dtype=ACCOUNT_DTYPE)
+    customer_table["identity"] = [intern(customer.identity, len(strings)) for customer in customers]
+    customer_table["fullname"] = [intern(customer.fullname, len(strings)) for customer in customers]
+    counts = [len(customer.accounts) for customer in customers]
+    customer_table["accounts"] = counts
+    customer_table["first_account"] = np.cumsum(counts) - counts
+    account_table["customer"] = np.repeat(np.arange(len(customers)), counts)
+    account_table["iban"] = [intern(account.iban, len(strings)) for account in accounts]
+    account_table["balance"] = [account.balance.cents for account in accounts]
+    account_table["status"] = [account.status.value for account in accounts]
+    account_table["kind"] = [account.is_checking for account in accounts]
+    account_table["overdraft"] = [account.overdraft_balance.cents for account in accounts]
+    customer_order = np.array(sorted(range(len(customers)), key=lambda row: customers[row].identity),
+                              dtype="<u4")
+    account_order = np.array(sorted(range(len(accounts)), key=lambda row: accounts[row].iban), dtype="<u4")
+    encoded = [string.encode() for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(string) for string in encoded], out=offsets[1:])
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(customers), len(accounts), len(encoded), int(offsets[-1])))
+        for column in (customer_table, customer_order, account_table, account_order, offsets):
+            _write_aligned(file, column.tobytes())
+        file.write(b"".join(encoded))
+
+
+def _check_strings(field, values):
+    # the dump stores strings only: other types would come back as strings, or not encode at all
+    for value in values:
+        if type(value) is not str:
+            raise ValueError(f'Cannot dump {field} {value!r}: not a string')
+
+
+def _write_aligned(file, data):
+    # every column starts at a multiple of 8 bytes, so frombuffer views are aligned
+    file.write(data)
+    file.write(b"\0" * (-len(data) % 8))
+
+
+class BankImage:
+    """
+    A dump mapped into memory. Columns are NumPy views over the mmap and
+    strings are decoded on access, so opening is O(1); customers (with
+    their accounts) are materialized into a bank one at a time, when first
+    looked up, or all at once by load_all. Materializing is serialized by a
+    lock, so threads serving from a lazily loaded bank never load one
+    customer twice.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, customers, accounts, strings, string_bytes = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError('Not a bank dump')
+        offset = HEADER.size
+        columns = []
+        for dtype, count in ((CUSTOMER_DTYPE, customers), ("<u4", customers), (ACCOUNT_DTYPE, accounts),
+                             ("<u4", accounts), ("<u8", strings + 1)):
+            column = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+            offset += column.nbytes + (-column.nbytes % 8)
+            columns.append(column)
+        self._customers, self._customer_order, self._accounts, self._account_order, self._offsets = columns
+        self._strings = memoryview(self._mmap)[offset:offset + string_bytes]
+        # customer row -> materialized customer
+        self._loaded = {}
+        self._lock = Lock()
+
+    @property
+    def name(self):
+        return self.string(0)
+
+    def string(self, index):
+        offsets = self._offsets
+        return str(self._strings[offsets[index]:offsets[index + 1]], "utf-8")
+
+    def __len__(self):
+        return len(self._customers)
+
+    def load_customer(self, bank, identity):
+        if type(identity) is not str:
+            # a dump holds string identities only
+            return None
+        row = self._find(self._customer_order, self._customers["identity"], identity)
+        if row is None:
+            return None
+        with self._lock:
+            if row not in self._loaded:
+                self._materialize(bank, row)
+        # from the bank's index: materialized by another thread meanwhile, or since removed
+        return bank._customers_by_identity.get(identity)
+
+    def load_account(self, bank, iban):
+        if type(iban) is not str:
+            return None
+        row = self._find(self._account_order, self._accounts["iban"], iban)
+        if row is None:
+            return None
+        customer_row = int(self._accounts["customer"][row])
+        with self._lock:
+            if customer_row not in self._loaded:
+                self._materialize(bank, customer_row)
+        return bank._accounts_by_iban.get(iban)
+
+    def load_all(self, bank):
+        """
+        Materializes every customer not loaded yet and returns the dump's
+        customers in dump order.
+        """
+        loaded = self._loaded
+        with self._lock:
+            if len(loaded) < len(self._customers):
+                # whole columns at once: one tolist per column instead of one per customer
+                offsets = self._offsets.tolist()
+                blob = bytes(self._strings)
+                strings = [blob[start:end].decode() for start, end in zip(offsets, offsets[1:])]
+                accounts = list(zip(*(self._accounts[name].tolist() for name in _ACCOUNT_FIELDS)))
+                for row, (identity, fullname, first_account, number_of_accounts) in enumerate(
+                        self._customers.tolist()):
+                    if row not in loaded:
+                        self._add(bank, row, strings[identity], strings[fullname],
+                                  accounts[first_account:first_account + number_of_accounts], strings.__getitem__)
+            return [loaded[row] for row in range(len(self._customers))]
+
+    def _find(self, order, names, key):
+        # binary search over the rows sorted by their string, decoding only log(n) strings
+        index = bisect_left(order, key, key=lambda row: self.string(names[row]))
+        if index < len(order) and self.string(names[order[index]]) == key:
+            return int(order[index])
+        return None
+
+    def _materialize(self, bank, row):
+        identity, fullname, first_account, number_of_accounts = self._customers[row].tolist()
+        rows = self._accounts[first_account:first_account + number_of_accounts]
+        accounts = list(zip(*(rows[name].tolist() for name in _ACCOUNT_FIELDS)))
+        return self._add(bank, row, self.string(identity), self.string(fullname), accounts, self.string)
+
+    def _add(self, bank, row, identity, fullname, accounts, string):
+        customer = bank.customer_class(identity, fullname, bank)
+        # loaded accounts are not new to the bank: indexed directly, listeners are not told
+        for balance, overdraft, iban, status, kind in accounts:
+            iban = string(iban)
+            if kind:
+                account = bank.checking_account_class(iban, Money(balance), _STATUSES[status], Money(overdraft))
+            else:
+                account = bank.account_class(iban, Money(balance), _STATUSES[status])
+            customer.accounts.append(account)
+            bank._accounts_by_iban[iban] = account
+            account._listener = bank
+        bank._customers.append(customer)
+        bank._customers_by_identity[identity] = customer
+        self._loaded[row] = customer
+        return customer
+
+
+_ACCOUNT_FIELDS = ("balance", "overdraft", "iban", "status", "kind")
+# AccountStatus(value) goes through the Enum machinery, a dict lookup does not
+_STATUSES = {status.value: status for status in AccountStatus}
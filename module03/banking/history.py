@@ -0,0 +1,123 @@
+import time
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from threading import Lock
+
+from banking.money import Money
+from banking.transaction import DEPOSIT, WITHDRAW
+
+Entry = namedtuple("Entry", ["timestamp", "amount", "balance"])
+Statement = namedtuple("Statement", ["iban", "opening_balance", "closing_balance", "entries"])
+
+
+class TransactionHistory:
+    """
+    Deposits and withdrawals of a Bank's accounts, kept as a bank listener.
+    Every account has its own time-ordered columns in flat arrays:
+    timestamps (seconds, as from clock), signed amounts and the balance
+    after each entry (both in cents), so a time range is two bisects.
+    Removed accounts are forgotten.
+    """
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = Lock()
+        # iban -> _AccountHistory
+        self._histories = {}
+
+    def attach(self, bank):
+        for customer in bank.customers:
+            for account in customer.accounts:
+                self.account_added(customer, account)
+        bank.add_listener(self)
+
+    def __len__(self):
+        return len(self._histories)
+
+    def entries(self, iban, start=None, end=None):
+        """
+        Entries of the account with start <= timestamp < end, oldest first.
+        """
+        with self._lock:
+            history = self._histories.get(iban)
+            if history is None:
+                return []
+            return history.entries(*history.range(start, end))
+
+    def statement(self, iban, start, end):
+        with self._lock:
+            history = self._histories.get(iban)
+            if history is None:
+                return None
+            return history.statement(iban, start, end)
+
+    def statements(self, start, end, ibans=None):
+        """
+        Generator of one Statement per account (all known accounts if ibans
+        is None) for start <= timestamp < end. Statements are built one at
+        a time as they are consumed, never all in memory.
+        """
+        if ibans is None:
+            with self._lock:
+                ibans = list(self._histories)
+        for iban in ibans:
+            statement = self.statement(iban, start, end)
+            if statement is not None:
+                yield statement
+
+    # bank listener
+    def account_added(self, customer, account):
+        with self._lock:
+            self._histories[account.iban] = _AccountHistory(account.balance.cents)
+
+    def account_removed(self, customer, account):
+        with self._lock:
+            self._histories.pop(account.iban, None)
+
+    def account_changed(self, account, operation, value):
+        if operation == DEPOSIT:
+            amount = value.cents
+        elif operation == WITHDRAW:
+            amount = -value.cents
+        else:
+            return
+        with self._lock:
+            self._histories[account.iban].append(self._clock(), amount, account.balance.cents)
+
+
+class _AccountHistory:
+    __slots__ = ("_opening_balance", "_timestamps", "_amounts", "_balances")
+
+    def __init__(self, opening_balance):
+        self._opening_balance = opening_balance
+        self._timestamps = array("d")
+        self._amounts = array("q")
+        self._balances = array("q")
+
+    def append(self, timestamp, amount, balance):
+        timestamps = self._timestamps
+        # a clock stepping back must not break the ordering bisect relies on
+        if timestamps and timestamp < timestamps[-1]:
+            timestamp = timestamps[-1]
+        timestamps.append(timestamp)
+        self._amounts.append(amount)
+        self._balances.append(balance)
+
+    def range(self, start, end):
+        low = 0 if start is None else bisect_left(self._timestamps, start)
+        high = len(self._timestamps) if end is None else bisect_left(self._timestamps, end, low)
+        return low, high
+
+    def balance_before(self, index):
+        return self._balances[index - 1] if index > 0 else self._opening_balance
+
+    def entries(self, low, high):
+        return [Entry(timestamp, Money(amount), Money(balance))
+                for timestamp, amount, balance in zip(self._timestamps[low:high], self._amounts[low:high],
+                                                       self._balances[low:high])]
+
+    def statement(self, iban, start, end):
+        low, high = self.range(start, end)
+        return Statement(iban, Money(self.balance_before(low)), Money(self.balance_before(high)),
+                         self.entries(low, high))
@@ -0,0 +1,243 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+
+from banking.account import AccountStatus
+from banking.store import AccountStore
+from banking.transaction import DEPOSIT, OVERDRAFT, STATUS, WITHDRAW
+
+# journal record operation codes
+OPEN = 1
+DEPOSIT_CODE = 2
+WITHDRAW_CODE = 3
+STATUS_CODE = 4
+OVERDRAFT_CODE = 5
+REMOVE = 6
+_CODES = {DEPOSIT: DEPOSIT_CODE, WITHDRAW: WITHDRAW_CODE, STATUS: STATUS_CODE, OVERDRAFT: OVERDRAFT_CODE}
+
+MAGIC = b"BNKJRNL2"
+HEADER = struct.Struct("<8sQ48x")
+# seq, operation, account id, iban (ISO 13616: at most 34 characters), amount, aux, padding: 64 bytes;
+# amounts and overdrafts in cents
+RECORD = struct.Struct("<QBI34sqqx")
+RECORD_DTYPE = np.dtype([("seq", "<u8"), ("operation", "u1"), ("account", "<u4"), ("iban", "S34"),
+                         ("amount", "<i8"), ("aux", "<i8"), ("padding", "V1")])
+
+
+class Journal:
+    """
+    Append-only file of fixed-size records, written through mmap.
+    The record count in the header is updated after the record itself,
+    so a record torn by a crash is never read back.
+    """
+
+    def __init__(self, path, chunk_records=1 << 16):
+        self._path = Path(path)
+        self._chunk_size = chunk_records * RECORD.size
+        self._lock = Lock()
+        is_new = not self._path.exists()
+        self._file = open(self._path, "w+b" if is_new else "r+b")
+        if is_new:
+            self._file.write(HEADER.pack(MAGIC, 0))
+            self._file.truncate(HEADER.size + self._chunk_size)
+            self._file.flush()
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, self._count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError('Not a journal file')
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def lock(self):
+        return self._lock
+
+    def append(self, operation, account, iban, amount=0, aux=0):
+        with self._lock:
+            offset = HEADER.size + self._count * RECORD.size
+            if offset + RECORD.size > len(self._mmap):
+                self._grow()
+            seq = self._count + 1
+            RECORD.pack_into(self._mmap, offset, seq, operation, account, iban.encode(), amount, aux)
+            HEADER.pack_into(self._mmap, 0, MAGIC, seq)
+            self._count = seq
+            return seq
+
+    def records(self, after=0, until=None):
+        """
+        Zero-copy NumPy view of the records with after < seq <= until.
+        The view must be released before the journal grows or closes.
+        """
+        until = self._count if until is None else until
+        return np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=until - after,
+                             offset=HEADER.size + after * RECORD.size)
+
+    def sync(self):
+        self._mmap.flush()
+
+    def close(self):
+        if not self._mmap.closed:
+            self._mmap.flush()
+            self._mmap.close()
+        self._file.close()
+
+    def _grow(self):
+        size = len(self._mmap) + self._chunk_size
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+
+class Ledger:
+    """
+    Event-sourced persistence for the accounts of a Bank.
+    Every account change is journaled; snapshots fold the journal into
+    per-account columns, so recovery loads the latest snapshot and
+    replays only the journal tail, with vectorized NumPy passes.
+    Customers are not journaled.
+    """
+
+    def __init__(self, directory, snapshot_interval=1_000_000):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._journal = Journal(self._directory / "journal.bin")
+        self._snapshot_path = self._directory / "snapshot.npz"
+        self._snapshot_interval = snapshot_interval
+        # iban -> account id of live accounts (filled by recover); ids are never reused
+        self._ids = {}
+        self._next_id = 0
+        self._snapshot_seq = 0
+        if self._snapshot_path.exists():
+            with np.load(self._snapshot_path) as snapshot:
+                self._snapshot_seq = int(snapshot["seq"])
+                self._next_id = len(snapshot["live"])
+        # ids already used in the journal tail, so attach without recover cannot reuse them
+        tail = self._journal.records(after=self._snapshot_seq)
+        if len(tail):
+            self._next_id = max(self._next_id, int(tail["account"].max()) + 1)
+        del tail
+
+    @property
+    def journal(self):
+        return self._journal
+
+    def recover(self):
+        """
+        Rebuilds the account state as an AccountStore from the latest
+        snapshot plus the journal tail, and resumes id numbering from it.
+        """
+        state = self._load_state()
+        records = self._journal.records(after=int(state["seq"]))
+        state = _replay(state, records)
+        del records
+        live = np.flatnonzero(state["live"])
+        ibans = state["ibans"][live].astype(str).tolist()
+        self._ids = dict(zip(ibans, live.tolist()))
+        self._next_id = len(state["live"])
+        return AccountStore.from_columns(ibans, state["balances"][live], state["statuses"][live],
+                                         state["overdrafts"][live])
+
+    def attach(self, bank):
+        """
+        Journals every later change of the bank's accounts.
+        Accounts the ledger already knows (e.g. recovered ones) are not journaled again.
+        """
+        for customer in bank.customers:
+            for account in customer.accounts:
+                if account.iban not in self._ids:
+                    self.account_added(customer, account)
+        bank.add_listener(self)
+
+    def snapshot(self):
+        journal = self._journal
+        with journal.lock:
+            seq = len(journal)
+            state = self._load_state()
+            records = journal.records(after=int(state["seq"]), until=seq)
+            state = _replay(state, records)
+            del records
+        state["seq"] = np.uint64(seq)
+        temporary_path = self._snapshot_path.with_suffix(".tmp")
+        with open(temporary_path, "wb") as file:
+            np.savez(file, **state)
+        os.replace(temporary_path, self._snapshot_path)
+        self._snapshot_seq = seq
+
+    def close(self):
+        self._journal.close()
+
+    # bank listener
+    def account_added(self, customer, account):
+        account_id = self._next_id
+        self._next_id += 1
+        self._ids[account.iban] = account_id
+        self._journal.append(OPEN, account_id, account.iban, account.balance.cents, account.overdraft_balance.cents)
+        if account.status != AccountStatus.ACTIVE:
+            self._journal.append(STATUS_CODE, account_id, account.iban, aux=account.status.value)
+        self._snapshot_if_due()
+
+    def account_removed(self, customer, account):
+        account_id = self._ids.pop(account.iban)
+        self._journal.append(REMOVE, account_id, account.iban)
+        self._snapshot_if_due()
+
+    def account_changed(self, account, operation, value):
+        account_id = self._ids[account.iban]
+        if operation == STATUS:
+            self._journal.append(STATUS_CODE, account_id, account.iban, aux=value.value)
+        elif operation == OVERDRAFT:
+            self._journal.append(OVERDRAFT_CODE, account_id, account.iban, aux=value.cents)
+        else:
+            self._journal.append(_CODES[operation], account_id, account.iban, amount=value.cents)
+        self._snapshot_if_due()
+
+    def _snapshot_if_due(self):
+        if len(self._journal) - self._snapshot_seq >= self._snapshot_interval:
+            self.snapshot()
+
+    def _load_state(self):
+        if not self._snapshot_path.exists():
+            return {"seq": np.uint64(0), "ibans": np.empty(0, dtype="S34"),
+                    "balances": np.empty(0, dtype=np.int64), "statuses": np.empty(0, dtype=np.int16),
+                    "overdrafts": np.empty(0, dtype=np.int64), "live": np.empty(0, dtype=bool)}
+        with np.load(self._snapshot_path) as snapshot:
+            return {name: snapshot[name] for name in snapshot.files}
+
+
+def _replay(state, records):
+    # per-account-id columns; every record of an id comes after its OPEN record,
+    # so opens can be applied first, balances summed and status/overdraft last-wins
+    operations = np.ascontiguousarray(records["operation"])
+    accounts = np.ascontiguousarray(records["account"])
+    opens = records[operations == OPEN]
+    size = max(len(state["live"]), int(opens["account"].max()) + 1 if len(opens) else 0)
+    replayed = {"seq": state["seq"]}
+    for name in ("ibans", "balances", "statuses", "overdrafts", "live"):
+        column = np.zeros(size, dtype=state[name].dtype)
+        column[:len(state[name])] = state[name]
+        replayed[name] = column
+    opened = opens["account"]
+    replayed["ibans"][opened] = opens["iban"]
+    replayed["balances"][opened] = opens["amount"]
+    replayed["overdrafts"][opened] = opens["aux"]
+    replayed["statuses"][opened] = AccountStatus.ACTIVE.value
+    replayed["live"][opened] = True
+    # deposits count +amount, withdraws -amount, every other record 0
+    sign = (operations == DEPOSIT_CODE).astype(np.int8) - (operations == WITHDRAW_CODE)
+    # bincount sums in float64, exact for totals below 2**53 cents
+    replayed["balances"] += np.rint(np.bincount(accounts, records["amount"] * sign, minlength=size)).astype(np.int64)
+    # the latest record per account wins: the first occurrence in reversed order
+    for code, name in ((STATUS_CODE, "statuses"), (OVERDRAFT_CODE, "overdrafts")):
+        selected = np.flatnonzero(operations == code)[::-1]
+        if len(selected):
+            changed, latest = np.unique(accounts[selected], return_index=True)
+            replayed[name][changed] = records["aux"][selected[latest]]
+    replayed["live"][accounts[operations == REMOVE]] = False
+    return replayed
@@ -0,0 +1,43 @@
+from threading import RLock
+
+
+class StripedLock:
+    """
+    A fixed pool of re-entrant locks shared by many keys: key -> hash(key) % stripes.
+    10M accounts share `stripes` locks instead of owning 10M lock objects.
+    """
+
+    def __init__(self, stripes=1_024):
+        if stripes <= 0:
+            raise ValueError('Number of stripes must be positive')
+        self._locks = [RLock() for _ in range(stripes)]
+
+    @property
+    def stripes(self):
+        return len(self._locks)
+
+    def stripe(self, key):
+        return hash(key) % len(self._locks)
+
+    def lock_for(self, key):
+        return self._locks[self.stripe(key)]
+
+    def locked(self, keys):
+        return _MultiLock([self._locks[stripe] for stripe in sorted({self.stripe(key) for key in keys})])
+
+
+class _MultiLock:
+    # locks are always taken in ascending stripe order, so two threads
+    # locking overlapping key sets can never wait on each other in a cycle
+    def __init__(self, locks):
+        self._locks = locks
+
+    def __enter__(self):
+        for lock in self._locks:
+            lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for lock in reversed(self._locks):
+            lock.release()
+        return False
@@ -0,0 +1,142 @@
+import math
+from decimal import ROUND_HALF_EVEN, Decimal
+from fractions import Fraction
+
+
+def to_cents(amount):
+    """
+    Converts Money, int, float, Decimal or str amounts to integer cents,
+    rounding half to even below a cent. Raises ValueError for anything
+    else, and for NaN and infinite amounts.
+    """
+    amount_type = type(amount)
+    if amount_type is int:
+        return amount * 100
+    if amount_type is Money:
+        return amount._cents
+    if amount_type is float:
+        cents = amount * 100
+        if not math.isfinite(cents):
+            raise ValueError(f'Invalid amount: {amount!r}')
+        return round(cents)
+    try:
+        cents = (Decimal(str(amount)) * 100).to_integral_value(ROUND_HALF_EVEN)
+    except ArithmeticError:
+        raise ValueError(f'Invalid amount: {amount!r}') from None
+    if not cents.is_finite():
+        raise ValueError(f'Invalid amount: {amount!r}')
+    return int(cents)
+
+
+class Money:
+    """
+    Fixed-point amount stored as an int number of cents: exact like
+    Decimal, but arithmetic and comparisons are plain int operations.
+    Operations with another Money take the fast path; ints, floats and
+    Decimals are converted to cents first. Comparisons with numbers are
+    exact, e.g. Money.of(10) == 10 but Money(0) != 0.004, and strings
+    are never equal to Money.
+    """
+    __slots__ = ("_cents",)
+
+    def __init__(self, cents=0):
+        self._cents = cents
+
+    @classmethod
+    def of(cls, amount):
+        if type(amount) is Money:
+            return amount
+        return cls(to_cents(amount))
+
+    @property
+    def cents(self):
+        return self._cents
+
+    def __add__(self, other):
+        if type(other) is Money:
+            return Money(self._cents + other._cents)
+        return Money(self._cents + to_cents(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is Money:
+            return Money(self._cents - other._cents)
+        return Money(self._cents - to_cents(other))
+
+    def __rsub__(self, other):
+        return Money(to_cents(other) - self._cents)
+
+    def __mul__(self, factor):
+        # e.g. interest: rounded to the cent
+        return Money(round(self._cents * factor))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money(-self._cents)
+
+    def __abs__(self):
+        return Money(abs(self._cents))
+
+    def _operands(self, other):
+        # (self, other) as values that compare exactly, or None if other is not a number
+        other_type = type(other)
+        if other_type is Money:
+            return self._cents, other._cents
+        if other_type is int:
+            return self._cents, other * 100
+        if other_type is float or other_type is Decimal or other_type is Fraction:
+            return Fraction(self._cents, 100), other
+        return None
+
+    def __eq__(self, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        return operands[0] == operands[1]
+
+    def __lt__(self, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        return operands[0] < operands[1]
+
+    def __le__(self, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        return operands[0] <= operands[1]
+
+    def __gt__(self, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        return operands[0] > operands[1]
+
+    def __ge__(self, other):
+        operands = self._operands(other)
+        if operands is None:
+            return NotImplemented
+        return operands[0] >= operands[1]
+
+    def __hash__(self):
+        # the hash of the exact value, like int, float, Decimal and Fraction
+        return hash(Fraction(self._cents, 100))
+
+    def __bool__(self):
+        return self._cents != 0
+
+    def __float__(self):
+        return self._cents / 100
+
+    def __str__(self):
+        sign = "-" if self._cents < 0 else ""
+        units, cents = divmod(abs(self._cents), 100)
+        return f"{sign}{units}.{cents:02d}"
+
+    def __repr__(self):
+        return f"Money('{self}')"
+
+
+ZERO = Money(0)
@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+from weakref import WeakValueDictionary
+
+from pymongo import DeleteOne, UpdateOne
+
+from banking.account import Account, AccountStatus, CheckingAccount
+
+
+class AccountRepository:
+    """
+    MongoDB persistence for accounts, documents shaped as in module07:
+    {"_id": iban, "balance": ..., "status": "ACTIVE"} plus "overdraft" for
+    checking accounts. Recently used accounts stay in memory; changes are
+    written behind: dirty accounts are flushed with one unordered bulk_write
+    once batch_size of them pile up or every flush_interval seconds.
+    Attach it to a Bank to track the bank's accounts, and close() it to flush on shutdown.
+    Accounts loaded by find() are tracked by the repository itself; an
+    account evicted from the cache is found again as the same object for
+    as long as anyone still holds it. Slotted accounts cannot be tracked
+    that way: look those up through their Bank, not find().
+    """
+
+    def __init__(self, collection, batch_size=1_000, flush_interval=1.0, cache_size=100_000):
+        self._collection = collection
+        self._batch_size = batch_size
+        self._cache_size = cache_size
+        # iban -> account, least recently used first
+        self._cache = OrderedDict()
+        # evicted accounts someone still holds: find() must hand out the same object again
+        self._evicted = WeakValueDictionary()
+        # iban -> account to write, or None to delete
+        self._dirty = {}
+        self._lock = Lock()
+        self._last_error = None
+        self._wakeup = Event()
+        self._closed = Event()
+        self._flusher = None
+        if flush_interval is not None:
+            self._flusher = Thread(target=self._flush_periodically, args=(flush_interval,), daemon=True)
+            self._flusher.start()
+
+    @property
+    def dirty_count(self):
+        return len(self._dirty)
+
+    @property
+    def last_error(self):
+        return self._last_error
+
+    def find(self, iban):
+        with self._lock:
+            account = self._cached(iban)
+            if account is not None:
+                return account
+            if iban in self._dirty:
+                # not flushed yet: evicted from the cache or deleted (None)
+                return self._dirty[iban]
+        document = self._collection.find_one({"_id": iban})
+        if document is None:
+            return None
+        loaded = _to_account(document)
+        # changes of an account that belongs to no bank are saved through this listener
+        loaded._listener = self
+        with self._lock:
+            # another thread may have loaded it meanwhile
+            account = self._cached(iban)
+            if account is None:
+                account = self._cache[iban] = loaded
+                self._evict()
+        return account
+
+    def save(self, account):
+        with self._lock:
+            self._dirty[account.iban] = account
+            self._cache[account.iban] = account
+            self._cache.move_to_end(account.iban)
+            self._evict()
+            if len(self._dirty) >= self._batch_size:
+                self._wakeup.set()
+        if self._flusher is None and len(self._dirty) >= self._batch_size:
+            self.flush()
+
+    def delete(self, account):
+        with self._lock:
+            self._cache.pop(account.iban, None)
+            self._evicted.pop(account.iban, None)
+            self._dirty[account.iban] = None
+
+    def attach(self, bank):
+        for customer in bank.customers:
+            for account in customer.accounts:
+                self.save(account)
+        bank.add_listener(self)
+
+    def flush(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        operations = [DeleteOne({"_id": iban}) if account is None
+                      else UpdateOne({"_id": iban}, {"$set": _to_document(account)}, upsert=True)
+                      for iban, account in dirty.items()]
+        try:
+            for start in range(0, len(operations), self._batch_size):
+                self._collection.bulk_write(operations[start:start + self._batch_size], ordered=False)
+        except Exception:
+            with self._lock:
+                # keep anything changed since this flush started, retry the rest next time
+                for iban, account in dirty.items():
+                    self._dirty.setdefault(iban, account)
+            raise
+
+    def close(self):
+        self._closed.set()
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    # bank listener
+    def account_added(self, customer, account):
+        self.save(account)
+
+    def account_removed(self, customer, account):
+        self.delete(account)
+
+    def account_changed(self, account, operation, value):
+        self.save(account)
+
+    def _cached(self, iban):
+        # the live account for iban, if the cache has it or someone still holds it
+        account = self._cache.get(iban)
+        if account is not None:
+            self._cache.move_to_end(iban)
+            return account
+        account = self._evicted.pop(iban, None)
+        if account is not None:
+            self._cache[iban] = account
+            self._evict()
+        return account
+
+    def _evict(self):
+        # dirty accounts stay reachable through _dirty until they are flushed
+        while len(self._cache) > self._cache_size:
+            iban, account = self._cache.popitem(last=False)
+            try:
+                self._evicted[iban] = account
+            except TypeError:
+                # slotted accounts cannot be weakly referenced: dropped (see the class docstring)
+                pass
+
+    def _flush_periodically(self, flush_interval):
+        while not self._closed.is_set():
+            self._wakeup.wait(flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as error:
+                self._last_error = error
+
+
+def _to_document(account):
+    document = {"balance": float(account.balance), "status": account.status.name}
+    if account.is_checking:
+        document["overdraft"] = float(account.overdraft_balance)
+    return document
+
+
+def _to_account(document):
+    status = AccountStatus[document["status"]]
+    if "overdraft" in document:
+        return CheckingAccount(document["_id"], document["balance"], status, document["overdraft"])
+    return Account(document["_id"], document["balance"], status)
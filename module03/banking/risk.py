@@ -0,0 +1,108 @@
+from collections import namedtuple
+from threading import Lock
+
+import numpy as np
+
+from banking.money import Money
+from banking.transaction import DEPOSIT, OVERDRAFT, WITHDRAW
+
+# overdrawn: accounts with a negative balance; exposure: Money owed by them;
+# histogram: overdrawn account counts per utilization (owed / limit) bin in [0, 1];
+# top: (iban, owed) of the most overdrawn, largest first; alerts: ibans with utilization >= alert_ratio
+RiskReport = namedtuple("RiskReport", ["overdrawn", "exposure", "histogram", "top", "alerts"])
+
+
+def overdraft_risk(ibans, balances, overdrafts, bins=10, top_k=10, alert_ratio=0.9):
+    """
+    Risk figures of the accounts whose overdraft limit is positive, from
+    balance and overdraft columns in cents, in one set of vectorized passes.
+    """
+    checking = np.flatnonzero(overdrafts > 0)
+    owed = -balances[checking]
+    inside = owed > 0
+    rows, owed = checking[inside], owed[inside]
+    utilization = owed / overdrafts[rows]
+    # above 1 only if a limit was lowered after the withdraw: counted in the last bin
+    histogram, _ = np.histogram(np.minimum(utilization, 1.0), bins=bins, range=(0.0, 1.0))
+    if top_k <= 0:
+        largest = np.empty(0, dtype=np.intp)
+    elif len(owed) > top_k:
+        # O(n) selection of the k largest, then only those k are sorted
+        largest = np.argpartition(owed, len(owed) - top_k)[len(owed) - top_k:]
+    else:
+        largest = np.arange(len(owed))
+    largest = largest[np.argsort(owed[largest], kind="stable")[::-1]]
+    top = [(ibans[row], Money(amount)) for row, amount in zip(rows[largest].tolist(), owed[largest].tolist())]
+    alerts = [ibans[row] for row in rows[utilization >= alert_ratio].tolist()]
+    return RiskReport(len(owed), Money(int(owed.sum())), histogram, top, alerts)
+
+
+class OverdraftRisk:
+    """
+    Balances and overdraft limits of a Bank's checking accounts mirrored
+    into contiguous NumPy columns, kept up to date as a bank listener, so a
+    risk scan never walks Python objects. Removed accounts are swapped
+    with the last row.
+    """
+
+    def __init__(self, capacity=1_024):
+        self._lock = Lock()
+        self._rows_by_iban = {}
+        self._ibans = []
+        self._balances = np.zeros(capacity, dtype=np.int64)
+        self._overdrafts = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        return len(self._ibans)
+
+    def attach(self, bank):
+        for customer in bank.customers:
+            for account in customer.accounts:
+                self.account_added(customer, account)
+        bank.add_listener(self)
+
+    def scan(self, bins=10, top_k=10, alert_ratio=0.9):
+        with self._lock:
+            size = len(self._ibans)
+            return overdraft_risk(self._ibans, self._balances[:size], self._overdrafts[:size], bins, top_k,
+                                  alert_ratio)
+
+    # bank listener
+    def account_added(self, customer, account):
+        if not account.is_checking:
+            return
+        with self._lock:
+            row = len(self._ibans)
+            if row == len(self._balances):
+                capacity = max(2 * row, 1)
+                self._balances = np.resize(self._balances, capacity)
+                self._overdrafts = np.resize(self._overdrafts, capacity)
+            self._balances[row] = account.balance.cents
+            self._overdrafts[row] = account.overdraft_balance.cents
+            self._ibans.append(account.iban)
+            self._rows_by_iban[account.iban] = row
+
+    def account_removed(self, customer, account):
+        with self._lock:
+            row = self._rows_by_iban.pop(account.iban, None)
+            if row is None:
+                return
+            last = len(self._ibans) - 1
+            if row != last:
+                moved = self._ibans[row] = self._ibans[last]
+                self._rows_by_iban[moved] = row
+                self._balances[row] = self._balances[last]
+                self._overdrafts[row] = self._overdrafts[last]
+            self._ibans.pop()
+
+    def account_changed(self, account, operation, value):
+        if operation not in (DEPOSIT, WITHDRAW, OVERDRAFT):
+            return
+        with self._lock:
+            row = self._rows_by_iban.get(account.iban)
+            if row is None:
+                return
+            if operation == OVERDRAFT:
+                self._overdrafts[row] = value.cents
+            else:
+                self._balances[row] = account.balance.cents
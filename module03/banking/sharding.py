@@ -0,0 +1,208 @@
+import zlib
+from itertools import count, islice
+from multiprocessing import Pipe, Process
+from threading import Lock
+
+from banking.account import Account, AccountStatus, CheckingAccount, InsufficientBalanceException
+from banking.bank import Bank
+from banking.money import to_cents
+from banking.transaction import DEPOSIT, WITHDRAW, TransactionResult
+
+
+def shard_of(iban, shards):
+    # str hash() is salted per process, crc32 is the same in the router and every worker
+    return zlib.crc32(iban.encode()) % shards
+
+
+class ShardedBank:
+    """
+    Accounts partitioned over worker processes by IBAN hash, each worker
+    owning a plain Bank. The router sends each batch of operations as one
+    message per shard, so the shards work on their part in parallel, then
+    merges the results back into input order. Transfers between shards use
+    two-phase commit: both shards vote in prepare, then both commit or abort.
+    """
+
+    def __init__(self, shards=4):
+        self._connections = []
+        self._workers = []
+        for _ in range(shards):
+            router_end, worker_end = Pipe()
+            worker = Process(target=_serve, args=(worker_end,), daemon=True)
+            worker.start()
+            worker_end.close()
+            self._connections.append(router_end)
+            self._workers.append(worker)
+        self._lock = Lock()
+        self._transaction_ids = count()
+
+    @property
+    def shards(self):
+        return len(self._connections)
+
+    def open_account(self, identity, fullname, iban, balance=5_000, status=AccountStatus.ACTIVE, overdraft_amount=0):
+        # overdraft_amount > 0 opens a CheckingAccount
+        connection = self._connections[shard_of(iban, self.shards)]
+        with self._lock:
+            connection.send(("open", identity, fullname, iban, balance, status, overdraft_amount))
+            error = connection.recv()
+        if error is not None:
+            raise ValueError(error)
+
+    def balance(self, iban):
+        connection = self._connections[shard_of(iban, self.shards)]
+        with self._lock:
+            connection.send(("balance", iban))
+            return connection.recv()
+
+    def apply_transactions(self, transactions, batch_size=65_536):
+        """
+        Same contract as Bank.apply_transactions: one TransactionResult
+        per (iban, operation, amount) record, in input order.
+        """
+        shards = self.shards
+        transactions = iter(transactions)
+        while batch := list(islice(transactions, batch_size)):
+            records = [[] for _ in range(shards)]
+            positions = [[] for _ in range(shards)]
+            for position, record in enumerate(batch):
+                shard = zlib.crc32(record[0].encode()) % shards
+                records[shard].append(record)
+                positions[shard].append(position)
+            results = [None] * len(batch)
+            with self._lock:
+                for shard, connection in enumerate(self._connections):
+                    if records[shard]:
+                        connection.send(("apply", records[shard]))
+                for shard, connection in enumerate(self._connections):
+                    if records[shard]:
+                        for position, result in zip(positions[shard], connection.recv()):
+                            results[position] = result
+            yield from results
+
+    def transfer(self, from_iban, to_iban, amount):
+        """
+        Returns a TransactionResult instead of raising, like apply_transactions.
+        """
+        if from_iban == to_iban:
+            return TransactionResult.UNKNOWN_OPERATION
+        source = self._connections[shard_of(from_iban, self.shards)]
+        target = self._connections[shard_of(to_iban, self.shards)]
+        with self._lock:
+            if source is target:
+                source.send(("transfer", from_iban, to_iban, amount))
+                return source.recv()
+            transaction_id = next(self._transaction_ids)
+            # phase 1: the source reserves the amount, the target checks it can accept it
+            source.send(("prepare", transaction_id, from_iban, WITHDRAW, amount))
+            target.send(("prepare", transaction_id, to_iban, DEPOSIT, amount))
+            votes = [(source, source.recv()), (target, target.recv())]
+            # phase 2
+            decision = "commit" if all(vote == TransactionResult.SUCCESS for _, vote in votes) else "abort"
+            prepared = [connection for connection, vote in votes if vote == TransactionResult.SUCCESS]
+            for connection in prepared:
+                connection.send((decision, transaction_id))
+            for connection in prepared:
+                connection.recv()
+        for _, vote in votes:
+            if vote != TransactionResult.SUCCESS:
+                return vote
+        return TransactionResult.SUCCESS
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.send(("close",))
+                connection.close()
+        for worker in self._workers:
+            worker.join()
+
+
+def _serve(connection):
+    bank = Bank("shard")
+    # transaction id -> (account, operation, amount) voted for in prepare
+    prepared = {}
+    while True:
+        message = connection.recv()
+        command = message[0]
+        if command == "apply":
+            connection.send(list(bank.apply_transactions(message[1])))
+        elif command == "open":
+            _, identity, fullname, iban, balance, status, overdraft_amount = message
+            customer = bank.get_customer(identity) or bank.create_customer(identity, fullname)
+            account = (CheckingAccount(iban, balance, status, overdraft_amount) if overdraft_amount > 0
+                       else Account(iban, balance, status))
+            try:
+                customer.add_account(account)
+                connection.send(None)
+            except ValueError as error:
+                connection.send(str(error))
+        elif command == "balance":
+            account = bank.get_account(message[1])
+            connection.send(None if account is None else account.balance)
+        elif command == "transfer":
+            _, from_iban, to_iban, amount = message
+            connection.send(_transfer(bank, from_iban, to_iban, amount))
+        elif command == "prepare":
+            _, transaction_id, iban, operation, amount = message
+            connection.send(_prepare(bank, prepared, transaction_id, iban, operation, amount))
+        elif command == "commit":
+            account, operation, amount = prepared.pop(message[1])
+            # a yes vote promised that this cannot fail, so no rule is checked again
+            if operation == DEPOSIT:
+                account._balance += to_cents(amount)
+            connection.send(None)
+        elif command == "abort":
+            account, operation, amount = prepared.pop(message[1])
+            if operation == WITHDRAW:
+                account._balance += to_cents(amount)
+            connection.send(None)
+        elif command == "close":
+            connection.close()
+            return
+
+
+def _failure(account, amount):
+    if account.status != AccountStatus.ACTIVE:
+        return TransactionResult.ACCOUNT_NOT_ACTIVE
+    if not _positive(amount):
+        return TransactionResult.INVALID_AMOUNT
+    return TransactionResult.INSUFFICIENT_BALANCE
+
+
+def _positive(amount):
+    try:
+        return to_cents(amount) > 0
+    except ValueError:
+        return False
+
+
+def _transfer(bank, from_iban, to_iban, amount):
+    from_account = bank.get_account(from_iban)
+    to_account = bank.get_account(to_iban)
+    if from_account is None or to_account is None:
+        return TransactionResult.UNKNOWN_ACCOUNT
+    try:
+        bank.transfer(from_iban, to_iban, amount)
+    except InsufficientBalanceException:
+        return TransactionResult.INSUFFICIENT_BALANCE
+    except ValueError:
+        if to_account.status != AccountStatus.ACTIVE:
+            return TransactionResult.ACCOUNT_NOT_ACTIVE
+        return _failure(from_account, amount)
+    return TransactionResult.SUCCESS
+
+
+def _prepare(bank, prepared, transaction_id, iban, operation, amount):
+    account = bank.get_account(iban)
+    if account is None:
+        return TransactionResult.UNKNOWN_ACCOUNT
+    if operation == WITHDRAW:
+        try:
+            account.withdraw(amount)
+        except (ValueError, InsufficientBalanceException):
+            return _failure(account, amount)
+    elif account.status != AccountStatus.ACTIVE or not _positive(amount):
+        return _failure(account, amount)
+    prepared[transaction_id] = (account, operation, amount)
+    return TransactionResult.SUCCESS
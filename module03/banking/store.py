@@ -0,0 +1,183 @@
+import numpy as np
+
+from banking.account import AccountStatus, SlottedAccount
+from banking.money import Money, to_cents
+from banking.risk import overdraft_risk
+from banking.transaction import STATUS
+
+_STATUS_BY_CODE = {status.value: status for status in AccountStatus}
+
+
+class AccountStore:
+    """
+    Struct-of-arrays storage for many accounts: one row per account,
+    balances and overdraft limits (int64 cents) and status codes
+    (AccountStatus.value) live in contiguous NumPy arrays, iban -> row in a dict.
+    Plain accounts have an overdraft limit of 0.
+    """
+
+    def __init__(self, capacity=1_024):
+        self._rows_by_iban = {}
+        self._ibans = []
+        self._balances = np.zeros(capacity, dtype=np.int64)
+        self._statuses = np.zeros(capacity, dtype=np.int16)
+        self._overdrafts = np.zeros(capacity, dtype=np.int64)
+
+    @classmethod
+    def from_columns(cls, ibans, balances, statuses, overdrafts):
+        # balances and overdrafts in cents
+        store = cls(capacity=0)
+        store._ibans = list(ibans)
+        store._rows_by_iban = dict(zip(store._ibans, range(len(store._ibans))))
+        store._balances = np.array(balances, dtype=np.int64)
+        store._statuses = np.array(statuses, dtype=np.int16)
+        store._overdrafts = np.array(overdrafts, dtype=np.int64)
+        return store
+
+    def __len__(self):
+        return len(self._ibans)
+
+    def __contains__(self, iban):
+        return iban in self._rows_by_iban
+
+    @property
+    def ibans(self):
+        return self._ibans
+
+    @property
+    def balances(self):
+        return self._balances[:len(self._ibans)]
+
+    @property
+    def statuses(self):
+        return self._statuses[:len(self._ibans)]
+
+    @property
+    def overdrafts(self):
+        return self._overdrafts[:len(self._ibans)]
+
+    def add(self, iban, balance=5_000, status=AccountStatus.ACTIVE, overdraft_amount=0):
+        if iban in self._rows_by_iban:
+            raise ValueError('Account already exists')
+        row = len(self._ibans)
+        if row == len(self._balances):
+            self._grow()
+        self._balances[row] = to_cents(balance)
+        self._statuses[row] = status.value
+        self._overdrafts[row] = to_cents(overdraft_amount)
+        self._ibans.append(iban)
+        self._rows_by_iban[iban] = row
+        return AccountView(self, row)
+
+    def add_account(self, account):
+        return self.add(account.iban, account.balance, account.status, account.overdraft_balance)
+
+    def get_account(self, iban):
+        row = self._rows_by_iban.get(iban)
+        if row is None:
+            return None
+        return AccountView(self, row)
+
+    def status_mask(self, status):
+        return self.statuses == status.value
+
+    def accrue_interest(self, rate, mask=None):
+        """
+        Credits balance * rate, rounded to the cent, to every active account
+        with a positive balance (restricted to mask if given).
+        Returns the total interest credited as Money.
+        """
+        if rate <= 0.0:
+            raise ValueError('Rate must be positive')
+        balances = self.balances
+        selected = self.status_mask(AccountStatus.ACTIVE) & (balances > 0)
+        if mask is not None:
+            selected &= mask
+        interest = np.rint(balances[selected] * rate).astype(np.int64)
+        balances[selected] += interest
+        return Money(int(interest.sum()))
+
+    def charge_fee(self, amount, mask=None):
+        """
+        Withdraws amount from every active account that can cover it with its
+        balance plus overdraft limit, the same rule as withdraw.
+        Returns the boolean mask of the accounts that were charged.
+        """
+        amount = to_cents(amount)
+        if amount <= 0:
+            raise ValueError('Amount must be positive')
+        balances = self.balances
+        charged = self.status_mask(AccountStatus.ACTIVE) & (amount <= balances + self.overdrafts)
+        if mask is not None:
+            charged &= mask
+        balances[charged] -= amount
+        return charged
+
+    def overdraft_risk(self, bins=10, top_k=10, alert_ratio=0.9):
+        # see banking.risk.overdraft_risk
+        return overdraft_risk(self._ibans, self.balances, self.overdrafts, bins, top_k, alert_ratio)
+
+    def _grow(self):
+        capacity = max(2 * len(self._balances), 1)
+        self._balances = np.resize(self._balances, capacity)
+        self._statuses = np.resize(self._statuses, capacity)
+        self._overdrafts = np.resize(self._overdrafts, capacity)
+
+
+class AccountView(SlottedAccount):
+    """
+    A SlottedAccount that owns no state: every attribute reads and writes
+    one row of an AccountStore, so deposit/withdraw keep their rules.
+    """
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+        self._listener = None
+
+    @property
+    def _balance(self):
+        return self._store._balances[self._row].item()
+
+    @_balance.setter
+    def _balance(self, balance):
+        # cents
+        self._store._balances[self._row] = balance
+
+    def _available_cents(self):
+        return self._store._balances[self._row].item() + self._store._overdrafts[self._row].item()
+
+    @property
+    def is_checking(self):
+        # the store keeps no account kind: a row with an overdraft limit is a checking account
+        return self._store._overdrafts[self._row].item() > 0
+
+    @property
+    def overdraft_balance(self):
+        return Money(self._store._overdrafts[self._row].item())
+
+    @property
+    def iban(self):
+        return self._store._ibans[self._row]
+
+    @property
+    def status(self):
+        return _STATUS_BY_CODE[int(self._store._statuses[self._row])]
+
+    @status.setter
+    def status(self, status):
+        if status is None:
+            raise ValueError('Status cannot be None')
+        if status not in [AccountStatus.ACTIVE, AccountStatus.CLOSED, AccountStatus.BLOCKED]:
+            raise ValueError('Status must be either "Active", "Closed", "Blocked"')
+        with self.lock_pool.lock_for(self.iban):
+            self._store._statuses[self._row] = status.value
+            if self._listener is not None:
+                self._listener.account_changed(self, STATUS, status)
+
+    def __eq__(self, other):
+        return isinstance(other, AccountView) and self._store is other._store and self._row == other._row
+
+    def __hash__(self):
+        return hash((id(self._store), self._row))
@@ -0,0 +1,16 @@
+from enum import Enum
+
+DEPOSIT = "deposit"
+WITHDRAW = "withdraw"
+# account changes reported to bank listeners besides deposit/withdraw
+STATUS = "status"
+OVERDRAFT = "overdraft"
+
+
+class TransactionResult(Enum):
+    SUCCESS = 0
+    UNKNOWN_ACCOUNT = 100
+    UNKNOWN_OPERATION = 200
+    ACCOUNT_NOT_ACTIVE = 300
+    INVALID_AMOUNT = 400
+    INSUFFICIENT_BALANCE = 500
@@ -0,0 +1,41 @@
+# run from module03: python -m benchmarks.bench_account_store
+import time
+
+from banking.account import AccountStatus, CheckingAccount, InsufficientBalanceException
+from banking.store import AccountStore
+
+NUMBER_OF_ACCOUNTS = 1_000_000
+RATE = 0.01
+FEE = 15
+
+
+def month_end_with_objects(accounts):
+    for account in accounts:
+        if account.status == AccountStatus.ACTIVE and account.balance > 0:
+            account.deposit(account.balance * RATE)
+    for account in accounts:
+        try:
+            account.withdraw(FEE)
+        except (ValueError, InsufficientBalanceException):
+            pass
+
+
+def month_end_with_store(store):
+    store.accrue_interest(RATE)
+    store.charge_fee(FEE)
+
+
+def main():
+    accounts = [CheckingAccount(f"TR{i}", i % 2_000 - 500) for i in range(NUMBER_OF_ACCOUNTS)]
+    store = AccountStore(NUMBER_OF_ACCOUNTS)
+    for account in accounts:
+        store.add_account(account)
+    for name, fun, argument in (("objects", month_end_with_objects, accounts),
+                                ("AccountStore", month_end_with_store, store)):
+        t0 = time.perf_counter()
+        fun(argument)
+        print(f"{name:<12}: interest + fee run over {NUMBER_OF_ACCOUNTS:,} accounts in {time.perf_counter() - t0:8.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# run from module03: python -m benchmarks.bench_apply_transactions
+import random
+import time
+import tracemalloc
+
+from banking.account import Account, CheckingAccount, InsufficientBalanceException
+from banking.bank import Bank
+from banking.transaction import DEPOSIT, WITHDRAW
+
+NUMBER_OF_ACCOUNTS = 10_000
+NUMBER_OF_TRANSACTIONS = 1_000_000
+REPEAT = 5
+
+
+def create_bank():
+    bank = Bank("isbankasi")
+    for i in range(NUMBER_OF_ACCOUNTS):
+        customer = bank.create_customer(str(i), f"customer {i}")
+        if i % 2:
+            customer.add_account(CheckingAccount(f"TR{i}", 1_000))
+        else:
+            customer.add_account(Account(f"TR{i}", 1_000))
+    return bank
+
+
+def transactions(n, seed=42):
+    rnd = random.Random(seed)
+    for _ in range(n):
+        yield f"TR{rnd.randrange(NUMBER_OF_ACCOUNTS)}", rnd.choice((DEPOSIT, WITHDRAW)), rnd.randint(-100, 2_000)
+
+
+def one_by_one(bank, records):
+    for iban, operation, amount in records:
+        account = bank.get_account(iban)
+        try:
+            if operation == DEPOSIT:
+                account.deposit(amount)
+            else:
+                account.withdraw(amount)
+        except (ValueError, InsufficientBalanceException):
+            pass
+
+
+def bulk(bank, records):
+    for _ in bank.apply_transactions(records):
+        pass
+
+
+def measure(fun, records):
+    timings = []
+    for _ in range(REPEAT):
+        bank = create_bank()
+        t0 = time.perf_counter()
+        fun(bank, records)
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def peak_memory(fun):
+    bank = create_bank()
+    tracemalloc.start()
+    fun(bank, transactions(NUMBER_OF_TRANSACTIONS))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    records = list(transactions(NUMBER_OF_TRANSACTIONS))
+    for name, fun in (("deposit/withdraw + except", one_by_one), ("Bank.apply_transactions", bulk)):
+        elapsed = measure(fun, records)
+        print(f"{name:<26}: {NUMBER_OF_TRANSACTIONS / elapsed:12,.0f} ops/sec")
+    # memory stays bounded by batch_size no matter how long the stream is
+    print(f"apply_transactions peak memory over a generator: {peak_memory(bulk) / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
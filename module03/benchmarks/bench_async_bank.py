@@ -0,0 +1,70 @@
+# run from module03: python -m benchmarks.bench_async_bank
+import asyncio
+import random
+import time
+
+from banking.account import Account
+from banking.async_bank import AsyncBank
+from banking.bank import Bank
+from banking.transaction import DEPOSIT, WITHDRAW
+
+NUMBER_OF_ACCOUNTS = 10_000
+NUMBER_OF_CLIENTS = 100_000
+# simulated I/O done for every change, e.g. persisting it
+COMMIT_LATENCY = 0.000_1
+
+
+async def commit(account, operation, amount):
+    await asyncio.sleep(COMMIT_LATENCY)
+
+
+class LockedBank:
+    # the current approach: the synchronous API behind one global asyncio.Lock
+    def __init__(self, bank):
+        self._bank = bank
+        self._lock = asyncio.Lock()
+
+    async def deposit(self, iban, amount):
+        async with self._lock:
+            balance = self._bank.get_account(iban).deposit(amount)
+            await commit(self._bank.get_account(iban), DEPOSIT, amount)
+            return balance
+
+    async def withdraw(self, iban, amount):
+        async with self._lock:
+            balance = self._bank.get_account(iban).withdraw(amount)
+            await commit(self._bank.get_account(iban), WITHDRAW, amount)
+            return balance
+
+
+def create_bank():
+    bank = Bank("isbankasi")
+    for i in range(NUMBER_OF_ACCOUNTS):
+        bank.create_customer(str(i), f"customer {i}").add_account(Account(f"TR{i}", 1_000_000))
+    return bank
+
+
+async def client(facade, rnd):
+    iban = f"TR{rnd.randrange(NUMBER_OF_ACCOUNTS)}"
+    if rnd.random() < 0.5:
+        await facade.deposit(iban, 10)
+    else:
+        await facade.withdraw(iban, 10)
+
+
+async def measure(facade):
+    rnd = random.Random(42)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(facade, rnd) for _ in range(NUMBER_OF_CLIENTS)))
+    return NUMBER_OF_CLIENTS / (time.perf_counter() - t0)
+
+
+def main():
+    for name, facade_class in (("global asyncio.Lock", LockedBank), ("AsyncBank mailboxes", None)):
+        bank = create_bank()
+        facade = AsyncBank(bank, commit) if facade_class is None else facade_class(bank)
+        print(f"{name:<20}: {asyncio.run(measure(facade)):10,.0f} ops/sec with {NUMBER_OF_CLIENTS:,} clients")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# run from module03: python -m benchmarks.bench_dump [accounts]
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from banking.account import Account, CheckingAccount
+from banking.bank import Bank
+
+ACCOUNTS_PER_CUSTOMER = 10
+LOOKUPS = 1_000
+
+
+def create_bank(number_of_accounts):
+    bank = Bank("isbankasi")
+    for i in range(number_of_accounts // ACCOUNTS_PER_CUSTOMER):
+        customer = bank.create_customer(str(i), f"customer {i % 1_000}")
+        for j in range(ACCOUNTS_PER_CUSTOMER):
+            iban = f"TR{i * ACCOUNTS_PER_CUSTOMER + j}"
+            customer.add_account(CheckingAccount(iban, 1_000, overdraft_amount=500) if j % 2
+                                 else Account(iban, 1_000))
+    return bank
+
+
+def timed(fun):
+    t0 = time.perf_counter()
+    result = fun()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    number_of_accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bank = create_bank(number_of_accounts)
+    ibans = [f"TR{random.randrange(number_of_accounts)}" for _ in range(LOOKUPS)]
+    with tempfile.TemporaryDirectory() as directory:
+        pickle_path = os.path.join(directory, "bank.pickle")
+        dump_path = os.path.join(directory, "bank.dump")
+
+        def pickle_dump():
+            with open(pickle_path, "wb") as file:
+                pickle.dump(bank, file, protocol=5)
+
+        def pickle_load():
+            with open(pickle_path, "rb") as file:
+                return pickle.load(file)
+
+        _, pickle_dump_time = timed(pickle_dump)
+        _, pickle_load_time = timed(pickle_load)
+        _, dump_time = timed(lambda: bank.dump(dump_path))
+        _, load_time = timed(lambda: Bank.load(dump_path))
+        lazy_bank, open_time = timed(lambda: Bank.load(dump_path, lazy=True))
+        _, lookup_time = timed(lambda: [lazy_bank.get_account(iban) for iban in ibans])
+        print(f"{number_of_accounts:,} accounts")
+        print(f"pickle : dump {pickle_dump_time:6.2f} sec, load {pickle_load_time:6.2f} sec, "
+              f"{os.path.getsize(pickle_path) / 2 ** 20:7.1f} MiB")
+        print(f"dump   : dump {dump_time:6.2f} sec, load {load_time:6.2f} sec, "
+              f"{os.path.getsize(dump_path) / 2 ** 20:7.1f} MiB")
+        print(f"lazy   : ready to serve in {open_time * 1e3:6.2f} ms, "
+              f"first lookups {lookup_time / LOOKUPS * 1e6:6.1f} us/lookup")
+        del lazy_bank
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# run from module03: python -m benchmarks.bench_get_account
+import random
+import time
+
+from banking.account import Account
+from banking.bank import Bank
+
+ACCOUNTS_PER_CUSTOMER = 10
+LOOKUPS = 100_000
+SCAN_LOOKUPS = 20
+
+
+def create_bank(number_of_accounts):
+    bank = Bank("isbankasi")
+    for i in range(number_of_accounts // ACCOUNTS_PER_CUSTOMER):
+        customer = bank.create_customer(str(i), f"customer {i}")
+        for j in range(ACCOUNTS_PER_CUSTOMER):
+            customer.add_account(Account(f"TR{i * ACCOUNTS_PER_CUSTOMER + j}"))
+    return bank
+
+
+def linear_scan(bank, iban):
+    # the lookup Bank.get_account used to do: O(customers x accounts)
+    for customer in bank.customers:
+        account = customer.get_account(iban)
+        if account is not None:
+            return account
+    return None
+
+
+def measure(lookup, ibans):
+    t0 = time.perf_counter()
+    for iban in ibans:
+        lookup(iban)
+    return (time.perf_counter() - t0) / len(ibans)
+
+
+def main():
+    for number_of_accounts in (10_000, 100_000, 1_000_000):
+        bank = create_bank(number_of_accounts)
+        ibans = [f"TR{random.randrange(number_of_accounts)}" for _ in range(LOOKUPS)]
+        indexed = measure(bank.get_account, ibans)
+        scanned = measure(lambda iban: linear_scan(bank, iban), ibans[:SCAN_LOOKUPS])
+        print(f"{number_of_accounts:>9,} accounts: "
+              f"index {indexed * 1e9:8.1f} ns/lookup, "
+              f"linear scan {scanned * 1e6:10.1f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
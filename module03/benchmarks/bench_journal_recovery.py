@@ -0,0 +1,50 @@
+# run from module03: python -m benchmarks.bench_journal_recovery [number of journal entries]
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from banking.journal import DEPOSIT_CODE, HEADER, MAGIC, OPEN, RECORD_DTYPE, WITHDRAW_CODE, Ledger
+
+NUMBER_OF_ACCOUNTS = 1_000_000
+CHUNK = 1_000_000
+
+
+def write_journal(path, number_of_entries):
+    # written with NumPy rather than Journal.append, so that the setup itself takes seconds
+    rng = np.random.default_rng(42)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, number_of_entries))
+        for start in range(0, number_of_entries, CHUNK):
+            records = np.zeros(min(CHUNK, number_of_entries - start), dtype=RECORD_DTYPE)
+            seqs = np.arange(start, start + len(records))
+            records["seq"] = seqs + 1
+            opening = seqs < NUMBER_OF_ACCOUNTS
+            records["account"] = np.where(opening, seqs, rng.integers(0, NUMBER_OF_ACCOUNTS, len(records)))
+            records["operation"] = np.where(opening, OPEN, rng.choice([DEPOSIT_CODE, WITHDRAW_CODE], len(records)))
+            records["iban"] = np.char.add(b"TR", records["account"].astype("S10"))
+            records["amount"] = np.where(opening, 100_000, rng.integers(100, 10_000, len(records)))
+            file.write(records.tobytes())
+
+
+def main():
+    number_of_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        write_journal(Path(directory) / "journal.bin", number_of_entries)
+        ledger = Ledger(directory)
+        t0 = time.perf_counter()
+        store = ledger.recover()
+        print(f"full replay of {number_of_entries:,} entries: {time.perf_counter() - t0:6.2f} sec, {len(store):,} accounts")
+        t0 = time.perf_counter()
+        ledger.snapshot()
+        print(f"snapshot: {time.perf_counter() - t0:6.2f} sec")
+        t0 = time.perf_counter()
+        Ledger(directory).recover()
+        print(f"snapshot + empty tail: {time.perf_counter() - t0:6.2f} sec")
+        ledger.close()
+
+
+if __name__ == "__main__":
+    main()
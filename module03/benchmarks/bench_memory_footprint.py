@@ -0,0 +1,44 @@
+# run from module03: python -m benchmarks.bench_memory_footprint
+import tracemalloc
+
+from banking.account import Account, CheckingAccount, SlottedAccount, SlottedCheckingAccount
+from banking.bank import Bank, SlottedBank
+
+NUMBER_OF_OBJECTS = 1_000_000
+
+
+def bytes_per_object(create):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = create()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def accounts(account_class):
+    # ibans are created up front so that only the account objects are measured
+    ibans = [f"TR{i}" for i in range(NUMBER_OF_OBJECTS)]
+    return bytes_per_object(lambda: [account_class(iban, 1_000) for iban in ibans])
+
+
+def customers(bank_class):
+    identities = [str(i) for i in range(NUMBER_OF_OBJECTS)]
+    bank = bank_class("isbankasi")
+    create_customer = bank.create_customer
+    # includes the bank's identity index entry and the empty accounts list
+    return bytes_per_object(lambda: [create_customer(identity, "jack bauer") for identity in identities])
+
+
+def main():
+    for name, measure, argument in (("Account", accounts, Account),
+                                    ("SlottedAccount", accounts, SlottedAccount),
+                                    ("CheckingAccount", accounts, CheckingAccount),
+                                    ("SlottedCheckingAccount", accounts, SlottedCheckingAccount),
+                                    ("Customer", customers, Bank),
+                                    ("SlottedCustomer", customers, SlottedBank)):
+        print(f"{name:<23}: {measure(argument):6.1f} bytes/object at {NUMBER_OF_OBJECTS:,} objects")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# run from module03: python -m benchmarks.bench_money [operations]
+import sys
+import time
+from decimal import Decimal
+
+from banking.account import Account
+from banking.money import Money
+
+ACCOUNT_OPERATIONS = 1_000_000
+
+
+def deposit_withdraw(balance, amount, zero, operations):
+    # the validation and arithmetic of Account.deposit/withdraw, without the locking
+    for _ in range(operations // 2):
+        if amount <= zero:
+            raise ValueError('Amount must be positive')
+        balance = balance + amount
+        if amount <= zero or amount > balance:
+            raise ValueError('Insufficient balance')
+        balance = balance - amount
+    return balance
+
+
+def account_deposit_withdraw(operations):
+    account = Account("tr1", 1_000)
+    amount = Money.of("12.34")
+    for _ in range(operations // 2):
+        account.deposit(amount)
+        account.withdraw(amount)
+    return account.balance
+
+
+def measure(name, run, operations):
+    t0 = time.perf_counter()
+    balance = run()
+    elapsed = time.perf_counter() - t0
+    print(f"{name:>22}: {operations / elapsed / 1e6:6.2f} M ops/sec, balance {balance}")
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    measure("float", lambda: deposit_withdraw(1_000.0, 12.34, 0.0, operations), operations)
+    measure("Decimal", lambda: deposit_withdraw(Decimal("1000"), Decimal("12.34"), Decimal(0), operations),
+            operations)
+    measure("int cents", lambda: deposit_withdraw(100_000, 1_234, 0, operations), operations)
+    measure("Money", lambda: deposit_withdraw(Money(100_000), Money(1_234), Money(0), operations), operations)
+    account_operations = min(operations, ACCOUNT_OPERATIONS)
+    measure("Account with Money", lambda: account_deposit_withdraw(account_operations), account_operations)
+    # the drift Money avoids: 0.1 deposited ten times
+    print(f"float: {sum([0.1] * 10)!r}, Money: {sum([Money.of(0.1)] * 10, Money())!r}")
+
+
+if __name__ == "__main__":
+    main()
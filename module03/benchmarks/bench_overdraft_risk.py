@@ -0,0 +1,63 @@
+# run from module03: python -m benchmarks.bench_overdraft_risk [accounts]
+import heapq
+import random
+import sys
+import time
+
+from banking.account import CheckingAccount
+from banking.bank import Bank
+from banking.risk import OverdraftRisk
+
+ACCOUNTS_PER_CUSTOMER = 10
+TOP_K = 100
+
+
+def create_bank(number_of_accounts):
+    rnd = random.Random(42)
+    bank = Bank("isbankasi")
+    for i in range(number_of_accounts // ACCOUNTS_PER_CUSTOMER):
+        customer = bank.create_customer(str(i), f"customer {i}")
+        for j in range(ACCOUNTS_PER_CUSTOMER):
+            customer.add_account(CheckingAccount(f"TR{i * ACCOUNTS_PER_CUSTOMER + j}", rnd.randint(-1_000, 5_000),
+                                                 overdraft_amount=1_000))
+    return bank
+
+
+def object_scan(bank, bins=10, top_k=TOP_K, alert_ratio=0.9):
+    # the same figures from a walk over the account objects
+    histogram = [0] * bins
+    exposure, owed_by_iban, alerts = 0, [], []
+    for customer in bank.customers:
+        for account in customer.accounts:
+            if isinstance(account, CheckingAccount) and account.balance < 0:
+                owed = -account.balance
+                utilization = min(float(owed) / float(account.overdraft_balance), 1.0)
+                histogram[min(int(utilization * bins), bins - 1)] += 1
+                exposure += owed.cents
+                owed_by_iban.append((owed, account.iban))
+                if utilization >= alert_ratio:
+                    alerts.append(account.iban)
+    return len(owed_by_iban), exposure, histogram, heapq.nlargest(top_k, owed_by_iban), alerts
+
+
+def timed(fun):
+    t0 = time.perf_counter()
+    result = fun()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    number_of_accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bank = create_bank(number_of_accounts)
+    risk = OverdraftRisk()
+    _, attach_time = timed(lambda: risk.attach(bank))
+    objects, object_time = timed(lambda: object_scan(bank))
+    report, scan_time = timed(lambda: risk.scan(top_k=TOP_K))
+    assert (objects[0], objects[1]) == (report.overdrawn, report.exposure.cents)
+    print(f"{number_of_accounts:,} checking accounts, {report.overdrawn:,} overdrawn, exposure {report.exposure}")
+    print(f"object walk     : {object_time * 1e3:8.1f} ms")
+    print(f"vectorized scan : {scan_time * 1e3:8.1f} ms (one-off attach {attach_time:.2f} sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# run from module03: python -m benchmarks.bench_sharding
+import os
+import random
+import time
+
+from banking.account import Account
+from banking.bank import Bank
+from banking.sharding import ShardedBank
+from banking.transaction import DEPOSIT, WITHDRAW
+
+NUMBER_OF_ACCOUNTS = 100_000
+NUMBER_OF_TRANSACTIONS = 2_000_000
+
+
+def transactions():
+    rnd = random.Random(42)
+    return [(f"TR{rnd.randrange(NUMBER_OF_ACCOUNTS)}", rnd.choice((DEPOSIT, WITHDRAW)), rnd.randint(1, 100))
+            for _ in range(NUMBER_OF_TRANSACTIONS)]
+
+
+def measure(bank, records):
+    t0 = time.perf_counter()
+    for _ in bank.apply_transactions(records):
+        pass
+    return NUMBER_OF_TRANSACTIONS / (time.perf_counter() - t0)
+
+
+def main():
+    records = transactions()
+    bank = Bank("isbankasi")
+    for i in range(NUMBER_OF_ACCOUNTS):
+        bank.create_customer(str(i), f"customer {i}").add_account(Account(f"TR{i}", 1_000))
+    print(f"single process Bank: {measure(bank, records):12,.0f} ops/sec")
+    shard_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for shards in shard_counts:
+        sharded_bank = ShardedBank(shards)
+        for i in range(NUMBER_OF_ACCOUNTS):
+            sharded_bank.open_account(str(i), f"customer {i}", f"TR{i}", 1_000)
+        print(f"{shards:>2} shard(s)         : {measure(sharded_bank, records):12,.0f} ops/sec")
+        sharded_bank.close()
+
+
+if __name__ == "__main__":
+    main()
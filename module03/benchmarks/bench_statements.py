@@ -0,0 +1,68 @@
+# run from module03: python -m benchmarks.bench_statements [accounts]
+import random
+import sys
+import time
+import tracemalloc
+from itertools import count
+
+from banking.account import Account
+from banking.bank import Bank
+from banking.history import TransactionHistory
+from banking.transaction import DEPOSIT, WITHDRAW
+
+ACCOUNTS_PER_CUSTOMER = 10
+ENTRIES_PER_ACCOUNT = 20
+RANGE_QUERIES = 100_000
+
+
+def create_bank(number_of_accounts):
+    bank = Bank("isbankasi")
+    for i in range(number_of_accounts // ACCOUNTS_PER_CUSTOMER):
+        customer = bank.create_customer(str(i), f"customer {i}")
+        for j in range(ACCOUNTS_PER_CUSTOMER):
+            customer.add_account(Account(f"TR{i * ACCOUNTS_PER_CUSTOMER + j}", 1_000_000))
+    return bank
+
+
+def peak_memory(consume):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    statements = consume()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statements, elapsed, peak
+
+
+def main():
+    number_of_accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bank = create_bank(number_of_accounts)
+    # one tick per entry, entries spread over [0, number_of_entries)
+    history = TransactionHistory(clock=count().__next__)
+    history.attach(bank)
+    number_of_entries = number_of_accounts * ENTRIES_PER_ACCOUNT
+    ibans = [f"TR{i}" for i in range(number_of_accounts)]
+    transactions = ((random.choice(ibans), random.choice((DEPOSIT, WITHDRAW)), random.randint(1, 100))
+                    for _ in range(number_of_entries))
+    for _ in bank.apply_transactions(transactions):
+        pass
+    start, end = number_of_entries // 4, number_of_entries * 3 // 4
+
+    t0 = time.perf_counter()
+    for iban in random.choices(ibans, k=RANGE_QUERIES):
+        history.entries(iban, start, end)
+    print(f"range query: {(time.perf_counter() - t0) / RANGE_QUERIES * 1e6:6.2f} us/query")
+
+    def stream():
+        statements = 0
+        for _ in history.statements(start, end):
+            statements += 1
+        return statements
+
+    for name, consume in (("streamed", stream), ("materialized", lambda: len(list(history.statements(start, end))))):
+        statements, elapsed, peak = peak_memory(consume)
+        print(f"{name:>12}: {statements:,} statements in {elapsed:6.2f} sec, peak {peak / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
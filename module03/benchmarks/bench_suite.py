@@ -0,0 +1,134 @@
+# run from module03:
+#   python -m benchmarks.bench_suite --save benchmarks/baseline.json     record a baseline
+#   python -m benchmarks.bench_suite --compare benchmarks/baseline.json  exit 1 on a regression
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from itertools import count
+
+from banking.account import Account, CheckingAccount
+from banking.bank import Bank
+
+POPULATION_SIZES = (1_000, 10_000, 100_000)
+ACCOUNTS_PER_CUSTOMER = 10
+OPERATIONS = 20_000
+REPEAT = 7
+THRESHOLD = 0.25
+
+
+def create_bank(number_of_accounts):
+    bank = Bank("isbankasi")
+    for i in range(number_of_accounts // ACCOUNTS_PER_CUSTOMER):
+        customer = bank.create_customer(str(i), f"customer {i}")
+        for j in range(ACCOUNTS_PER_CUSTOMER):
+            iban = f"TR{i * ACCOUNTS_PER_CUSTOMER + j}"
+            # large balances and overdrafts, so that no withdraw fails during a run
+            customer.add_account(CheckingAccount(iban, 10 ** 9, overdraft_amount=10 ** 9) if j % 2
+                                 else Account(iban, 10 ** 9))
+    return bank
+
+
+def cases(number_of_accounts):
+    """
+    Yields (name, run, parity); run(ibans) performs one operation per iban
+    on a bank with number_of_accounts accounts.
+    """
+    bank = create_bank(number_of_accounts)
+    get_account = bank.get_account
+
+    def deposit(ibans):
+        for iban in ibans:
+            get_account(iban).deposit(1)
+
+    def withdraw(ibans):
+        for iban in ibans:
+            get_account(iban).withdraw(1)
+
+    def get(ibans):
+        for iban in ibans:
+            get_account(iban)
+
+    identities = count(number_of_accounts)
+
+    def create_customer(ibans):
+        for _ in ibans:
+            bank.create_customer(f"new {next(identities)}", "jack bauer")
+
+    yield "Account.deposit", deposit, 0
+    yield "Account.withdraw", withdraw, 0
+    yield "CheckingAccount.withdraw", withdraw, 1
+    yield "Bank.get_account", get, None
+    yield "Bank.create_customer", create_customer, None
+
+
+def measure(run, ibans):
+    # per-operation latency of every repeat, in ns
+    run(ibans)  # warm-up
+    latencies = []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        run(ibans)
+        latencies.append((time.perf_counter() - t0) / len(ibans) * 1e9)
+    return {"best_ns": min(latencies), "median_ns": statistics.median(latencies),
+            "ops_per_sec": 1e9 / min(latencies)}
+
+
+def run_suite(population_sizes):
+    results = {}
+    rnd = random.Random(42)
+    for number_of_accounts in population_sizes:
+        for name, run, parity in cases(number_of_accounts):
+            # parity selects plain (even) or checking (odd) accounts
+            ibans = [f"TR{i}" for i in (rnd.randrange(number_of_accounts) for _ in range(OPERATIONS))
+                     if parity is None or i % 2 == parity]
+            key = f"{name}[{number_of_accounts}]"
+            results[key] = measure(run, ibans)
+            result = results[key]
+            print(f"{key:<36}: {result['best_ns']:9.1f} ns/op best, {result['median_ns']:9.1f} ns/op median, "
+                  f"{result['ops_per_sec']:12,.0f} ops/sec")
+    return results
+
+
+def regressions(baseline, results, threshold):
+    """
+    (key, baseline ns, current ns) of every benchmark whose best latency
+    grew by more than threshold (a fraction) over the baseline.
+    """
+    slower = []
+    for key, result in results.items():
+        expected = baseline.get(key)
+        if expected is not None and result["best_ns"] > expected["best_ns"] * (1 + threshold):
+            slower.append((key, expected["best_ns"], result["best_ns"]))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banking hot path benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=POPULATION_SIZES, help="account populations")
+    parser.add_argument("--save", metavar="JSON", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="fail if slower than this baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown, e.g. 0.25 = 25%%")
+    arguments = parser.parse_args()
+
+    results = run_suite(arguments.sizes)
+    if arguments.save:
+        with open(arguments.save, "w") as file:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": results}, file, indent=2, sort_keys=True)
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)["results"]
+        slower = regressions(baseline, results, arguments.threshold)
+        for key, expected, actual in slower:
+            print(f"REGRESSION {key}: {expected:.1f} -> {actual:.1f} ns/op (+{actual / expected - 1:.0%})")
+        if slower:
+            sys.exit(1)
+        print(f"no regression above {arguments.threshold:.0%} against {arguments.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# run from module03: python -m benchmarks.bench_transfer
+import random
+import time
+from threading import Thread
+
+from banking.account import Account, InsufficientBalanceException, SlottedAccount
+from banking.bank import Bank
+from banking.locking import StripedLock
+
+NUMBER_OF_ACCOUNTS = 100_000
+TRANSFERS_PER_THREAD = 50_000
+
+
+def create_bank():
+    bank = Bank("isbankasi")
+    for i in range(NUMBER_OF_ACCOUNTS):
+        bank.create_customer(str(i), f"customer {i}").add_account(Account(f"TR{i}", 1_000))
+    return bank
+
+
+def transfer_randomly(bank, seed):
+    rnd = random.Random(seed)
+    for _ in range(TRANSFERS_PER_THREAD):
+        from_iban = f"TR{rnd.randrange(NUMBER_OF_ACCOUNTS)}"
+        to_iban = f"TR{rnd.randrange(NUMBER_OF_ACCOUNTS)}"
+        try:
+            bank.transfer(from_iban, to_iban, rnd.randint(1, 100))
+        except (ValueError, InsufficientBalanceException):
+            pass
+
+
+def measure(bank, number_of_threads):
+    threads = [Thread(target=transfer_randomly, args=(bank, seed)) for seed in range(number_of_threads)]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return number_of_threads * TRANSFERS_PER_THREAD / (time.perf_counter() - t0)
+
+
+def main():
+    bank = create_bank()
+    for name, lock_pool in (("global lock", StripedLock(1)), ("striped locks", StripedLock(1_024))):
+        SlottedAccount.lock_pool = lock_pool
+        for number_of_threads in (1, 2, 4, 8):
+            print(f"{name:<14} {number_of_threads} thread(s): {measure(bank, number_of_threads):12,.0f} transfers/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ Unit test should follow four test phases:
 """
 import pytest
 
-from banking.account import Account, AccountStatus
+from banking.account import Account, AccountStatus, CheckingAccount, InsufficientBalanceException, \
+    SlottedAccount, SlottedCheckingAccount
 
 deposit_failure_values =  [-1, -1.10, -0.10, -10]
 
@@ -25,3 +26,37 @@ def test_deposit_with_negative_amount_should_fail(an_active_account,amount):
     with pytest.raises(ValueError):
         # 2. call exercise method
         an_active_account.deposit(amount)
+
+
+@pytest.fixture
+def an_active_checking_account():
+    return CheckingAccount("TR2", 1_000, AccountStatus.ACTIVE, 500)
+
+
+def test_checking_account_withdraw_within_overdraft_should_success(an_active_checking_account):
+    balance = an_active_checking_account.withdraw(1_500)
+    assert balance == -500
+    assert an_active_checking_account.available_balance == 0
+
+
+def test_checking_account_withdraw_beyond_overdraft_should_fail(an_active_checking_account):
+    with pytest.raises(InsufficientBalanceException) as exception_info:
+        an_active_checking_account.withdraw(1_600)
+    assert exception_info.value.deficit == 100
+    assert an_active_checking_account.balance == 1_000
+
+
+def test_slotted_accounts_should_have_no_dict():
+    account = SlottedAccount("TR3", 1_000)
+    checking_account = SlottedCheckingAccount("TR4", 1_000, overdraft_amount=500)
+    assert not hasattr(account, "__dict__")
+    assert not hasattr(checking_account, "__dict__")
+    assert account.withdraw(400) == 600
+    assert checking_account.withdraw(1_500) == -500
+    assert checking_account.overdraft_balance == 500
+
+
+def test_dict_based_accounts_should_be_slotted_accounts():
+    assert isinstance(Account("TR5"), SlottedAccount)
+    assert isinstance(CheckingAccount("TR6"), SlottedCheckingAccount)
+    assert isinstance(CheckingAccount("TR6"), Account)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from banking.account import Account, AccountStatus, CheckingAccount, InsufficientBalanceException
+from banking.aggregates import Aggregate, BankAggregates
+from banking.bank import Bank
+from banking.transaction import DEPOSIT, WITHDRAW
+
+
+@pytest.fixture
+def a_bank():
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 1_000))
+    jack.add_account(CheckingAccount("tr2", 500))
+    bank.create_customer("2", "kate austen").add_account(Account("tr3", 300, AccountStatus.BLOCKED))
+    return bank
+
+
+@pytest.fixture
+def aggregates(a_bank):
+    aggregates = BankAggregates()
+    aggregates.attach(a_bank)
+    return aggregates
+
+
+def test_attach_should_aggregate_existing_accounts(aggregates):
+    assert aggregates.by_status(AccountStatus.ACTIVE) == Aggregate(1_500, 2, 500, 1_000)
+    assert aggregates.by_status(AccountStatus.BLOCKED) == Aggregate(300, 1, 300, 300)
+    assert aggregates.by_status(AccountStatus.CLOSED) == Aggregate(0, 0, None, None)
+    assert aggregates.by_customer("1") == Aggregate(1_500, 2, 500, 1_000)
+    assert aggregates.by_customer("3") == Aggregate(0, 0, None, None)
+
+
+def test_changes_should_update_aggregates(a_bank, aggregates):
+    a_bank.get_account("tr1").withdraw(900)
+    assert aggregates.by_status(AccountStatus.ACTIVE) == Aggregate(600, 2, 100, 500)
+    a_bank.get_account("tr3").status = AccountStatus.ACTIVE
+    assert aggregates.by_status(AccountStatus.ACTIVE) == Aggregate(900, 3, 100, 500)
+    assert aggregates.by_status(AccountStatus.BLOCKED) == Aggregate(0, 0, None, None)
+    a_bank.get_customer("2").add_account(Account("tr4", 2_000))
+    assert aggregates.by_customer("2") == Aggregate(2_300, 2, 300, 2_000)
+    a_bank.get_customer("1").remove_account(a_bank.get_account("tr2"))
+    assert aggregates.by_customer("1") == Aggregate(100, 1, 100, 100)
+    assert aggregates.verify(a_bank) == []
+
+
+def test_random_operations_should_stay_consistent(a_bank, aggregates):
+    rnd = random.Random(7)
+    ibans = ["tr1", "tr2", "tr3"]
+    for _ in range(2_000):
+        account = a_bank.get_account(rnd.choice(ibans))
+        choice = rnd.random()
+        try:
+            if choice < 0.4:
+                account.deposit(rnd.randint(1, 100))
+            elif choice < 0.8:
+                account.withdraw(rnd.randint(1, 100))
+            elif choice < 0.9:
+                account.status = rnd.choice(list(AccountStatus))
+            else:
+                list(a_bank.apply_transactions([(iban, rnd.choice((DEPOSIT, WITHDRAW)), 10) for iban in ibans]))
+        except (ValueError, InsufficientBalanceException):
+            pass
+    assert aggregates.verify(a_bank) == []
+
+
+def test_verify_should_report_differences(a_bank, aggregates):
+    # a change the aggregates cannot see
+    a_bank.get_account("tr1")._balance = 0
+    differences = aggregates.verify(a_bank)
+    assert (AccountStatus.ACTIVE, Aggregate(500, 2, 0, 500), Aggregate(1_500, 2, 500, 1_000)) in differences
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from banking.account import Account, InsufficientBalanceException
+from banking.async_bank import AsyncBank, CommitFailedException
+from banking.bank import Bank
+
+
+@pytest.fixture
+def a_bank():
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 1_000))
+    jack.add_account(Account("tr2", 1_000))
+    return bank
+
+
+def test_operations_on_same_iban_should_keep_order(a_bank):
+    async def exercise():
+        async_bank = AsyncBank(a_bank)
+        return await asyncio.gather(async_bank.withdraw("tr1", 1_000),
+                                    async_bank.deposit("tr1", 10),
+                                    async_bank.withdraw("tr1", 5),
+                                    async_bank.balance("tr1"))
+
+    assert asyncio.run(exercise()) == [0, 10, 5, 5]
+
+
+def test_failures_should_be_raised_to_caller_only(a_bank):
+    async def exercise():
+        async_bank = AsyncBank(a_bank)
+        results = await asyncio.gather(async_bank.withdraw("tr1", 2_000),
+                                       async_bank.deposit("tr1", 10),
+                                       async_bank.deposit("tr7", 10),
+                                       return_exceptions=True)
+        return async_bank, results
+
+    async_bank, results = asyncio.run(exercise())
+    assert isinstance(results[0], InsufficientBalanceException)
+    assert results[1] == 1_010
+    assert isinstance(results[2], ValueError)
+    # drained mailboxes are removed
+    assert async_bank.active_mailboxes == 0
+
+
+def test_different_ibans_should_interleave(a_bank):
+    events = []
+
+    async def commit(account, operation, amount):
+        events.append((account.iban, "start"))
+        await asyncio.sleep(0.01)
+        events.append((account.iban, "end"))
+
+    async def exercise():
+        async_bank = AsyncBank(a_bank, commit)
+        await asyncio.gather(async_bank.deposit("tr1", 1), async_bank.deposit("tr2", 1),
+                             async_bank.deposit("tr1", 1))
+
+    asyncio.run(exercise())
+    assert events[:2] == [("tr1", "start"), ("tr2", "start")]
+    # the second tr1 command waits for the first tr1 commit
+    assert events.index(("tr1", "end")) < events.index(("tr1", "start"), 1)
+    assert a_bank.get_account("tr1").balance == 1_002
+
+
+def test_failed_commit_should_be_told_apart_from_failed_operation(a_bank):
+    async def commit(account, operation, amount):
+        raise OSError("disk full")
+
+    async def exercise():
+        async_bank = AsyncBank(a_bank, commit)
+        return await asyncio.gather(async_bank.withdraw("tr1", 400),
+                                    async_bank.withdraw("tr1", 2_000),
+                                    return_exceptions=True)
+
+    committed, failed = asyncio.run(exercise())
+    assert isinstance(committed, CommitFailedException)
+    assert committed.result == 600
+    assert isinstance(committed.__cause__, OSError)
+    assert isinstance(failed, InsufficientBalanceException)
+    assert a_bank.get_account("tr1").balance == 600
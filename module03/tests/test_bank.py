@@ -1,7 +1,12 @@
+from decimal import Decimal
+from threading import Thread
+
 import pytest
 
-from banking.account import Account
-from banking.bank import Bank
+from banking.account import Account, AccountStatus, CheckingAccount, InsufficientBalanceException, SlottedAccount
+from banking.bank import Bank, SlottedBank
+from banking.money import Money
+from banking.transaction import DEPOSIT, WITHDRAW, TransactionResult
 
 #region accounts
 accounts_jack = {
@@ -42,14 +47,20 @@ def a_bank():
     return bank
 
 
-def test_get_account_should_success(mocker):
+def add_accounts(customer, accounts):
+    for account in accounts.values():
+        if account is not None:
+            customer.add_account(account)
+
+
+def test_get_account_should_success():
     bank = Bank("isbankasi")
     jack = bank.create_customer("1", "jack bauer")
     kate = bank.create_customer("2", "kate austen")
     james = bank.create_customer("3", "james sawyer")
-    mocker.patch.object(jack, "get_account", side_effect=lambda iban: accounts_jack[iban])
-    mocker.patch.object(kate, "get_account", side_effect=lambda iban: accounts_kate[iban])
-    mocker.patch.object(james, "get_account", side_effect=lambda iban: accounts_james[iban])
+    add_accounts(jack, accounts_jack)
+    add_accounts(kate, accounts_kate)
+    add_accounts(james, accounts_james)
     # 2. call exercise method
     found_account = bank.get_account("tr4")
     # 3. verification
@@ -58,15 +69,171 @@ def test_get_account_should_success(mocker):
     assert found_account == accounts_kate["tr4"]
 
 
-def test_get_account_should_return_none(mocker):
+def test_get_account_should_return_none():
     bank = Bank("isbankasi")
     jack = bank.create_customer("1", "jack bauer")
     kate = bank.create_customer("2", "kate austen")
     james = bank.create_customer("3", "james sawyer")
-    mocker.patch.object(jack, "get_account", side_effect=lambda iban: accounts_jack[iban])
-    mocker.patch.object(kate, "get_account", side_effect=lambda iban: accounts_kate[iban])
-    mocker.patch.object(james, "get_account", side_effect=lambda iban: accounts_james[iban])
+    add_accounts(jack, accounts_jack)
+    add_accounts(kate, accounts_kate)
+    add_accounts(james, accounts_james)
     # 2. call exercise method
     found_account = bank.get_account("tr7")
     # 3. verification
-    assert found_account is None
\ No newline at end of file
+    assert found_account is None
+
+
+def test_get_account_after_remove_account_should_return_none(a_bank):
+    jack = a_bank.get_customer("1")
+    account = Account("tr8", 1_000)
+    jack.add_account(account)
+    assert a_bank.get_account("tr8") is account
+    jack.remove_account(account)
+    assert a_bank.get_account("tr8") is None
+    assert account not in jack.accounts
+
+
+def test_add_account_with_existing_iban_should_fail(a_bank):
+    a_bank.get_customer("1").add_account(Account("tr9", 1_000))
+    with pytest.raises(ValueError):
+        a_bank.get_customer("2").add_account(Account("tr9", 2_000))
+    assert a_bank.get_customer("2").accounts == []
+
+
+def test_get_customer_should_success(a_bank):
+    customer = a_bank.get_customer("2")
+    assert customer is not None
+    assert customer.fullname == "kate austen"
+    assert a_bank.get_customer("4") is None
+
+
+def test_create_customer_with_existing_identity_should_fail(a_bank):
+    with pytest.raises(ValueError):
+        a_bank.create_customer("1", "jack shephard")
+    assert len(a_bank.customers) == 3
+
+
+def test_apply_transactions_should_return_result_per_record(a_bank):
+    jack = a_bank.get_customer("1")
+    jack.add_account(Account("tr1", 1_000))
+    jack.add_account(CheckingAccount("tr2", 1_000, overdraft_amount=500))
+    jack.add_account(Account("tr3", 1_000, AccountStatus.BLOCKED))
+    transactions = [
+        ("tr1", WITHDRAW, 600),
+        ("tr2", WITHDRAW, 1_400),
+        ("tr1", WITHDRAW, 600),
+        ("tr1", DEPOSIT, 200),
+        ("tr1", WITHDRAW, 600),
+        ("tr2", WITHDRAW, 200),
+        ("tr3", DEPOSIT, 100),
+        ("tr4", DEPOSIT, 100),
+        ("tr1", DEPOSIT, -100),
+        ("tr1", "transfer", 100),
+    ]
+    # 2. call exercise method
+    results = list(a_bank.apply_transactions(transactions, batch_size=4))
+    # 3. verification
+    assert results == [
+        TransactionResult.SUCCESS,
+        TransactionResult.SUCCESS,
+        TransactionResult.INSUFFICIENT_BALANCE,
+        TransactionResult.SUCCESS,
+        TransactionResult.SUCCESS,
+        TransactionResult.INSUFFICIENT_BALANCE,
+        TransactionResult.ACCOUNT_NOT_ACTIVE,
+        TransactionResult.UNKNOWN_ACCOUNT,
+        TransactionResult.INVALID_AMOUNT,
+        TransactionResult.UNKNOWN_OPERATION,
+    ]
+    assert a_bank.get_account("tr1").balance == 0
+    assert a_bank.get_account("tr2").balance == -400
+    assert a_bank.get_account("tr3").balance == 1_000
+
+
+def test_apply_transactions_should_report_invalid_amounts(a_bank, mocker):
+    a_bank.get_customer("1").add_account(Account("tr1", 1_000))
+    listener = mocker.Mock()
+    a_bank.add_listener(listener)
+    amounts = [100, None, "abc", True, float("nan"), float("inf"), Decimal("-Infinity"), "12.50"]
+    results = list(a_bank.apply_transactions([("tr1", DEPOSIT, amount) for amount in amounts]))
+    assert results == [TransactionResult.SUCCESS] + [TransactionResult.INVALID_AMOUNT] * 6 + \
+           [TransactionResult.SUCCESS]
+    assert listener.account_changed.call_count == 2
+    assert a_bank.get_account("tr1").balance == Money(111_250)
+
+
+def test_apply_transactions_should_consume_generator_lazily(a_bank):
+    a_bank.get_customer("1").add_account(Account("tr1", 0))
+    transactions = (("tr1", DEPOSIT, 1) for _ in range(10_000))
+    results = a_bank.apply_transactions(transactions, batch_size=100)
+    assert next(results) == TransactionResult.SUCCESS
+    assert a_bank.get_account("tr1").balance == 100
+    assert sum(1 for _ in results) == 9_999
+    assert a_bank.get_account("tr1").balance == 10_000
+
+
+def test_transfer_should_success(a_bank):
+    a_bank.get_customer("1").add_account(Account("tr1", 1_000))
+    a_bank.get_customer("2").add_account(Account("tr2", 1_000))
+    a_bank.transfer("tr1", "tr2", 400)
+    assert a_bank.get_account("tr1").balance == 600
+    assert a_bank.get_account("tr2").balance == 1_400
+
+
+def test_transfer_with_insufficient_balance_should_fail(a_bank):
+    a_bank.get_customer("1").add_account(Account("tr1", 1_000))
+    a_bank.get_customer("2").add_account(Account("tr2", 1_000))
+    with pytest.raises(InsufficientBalanceException):
+        a_bank.transfer("tr1", "tr2", 1_001)
+    assert a_bank.get_account("tr1").balance == 1_000
+    assert a_bank.get_account("tr2").balance == 1_000
+
+
+def test_transfer_to_inactive_account_should_fail(a_bank):
+    a_bank.get_customer("1").add_account(Account("tr1", 1_000))
+    a_bank.get_customer("2").add_account(Account("tr2", 1_000, AccountStatus.CLOSED))
+    with pytest.raises(ValueError):
+        a_bank.transfer("tr1", "tr2", 100)
+    assert a_bank.get_account("tr1").balance == 1_000
+    assert a_bank.get_account("tr2").balance == 1_000
+
+
+def test_transfer_with_unknown_account_should_fail(a_bank):
+    a_bank.get_customer("1").add_account(Account("tr1", 1_000))
+    with pytest.raises(ValueError):
+        a_bank.transfer("tr1", "tr7", 100)
+    with pytest.raises(ValueError):
+        a_bank.transfer("tr1", "tr1", 100)
+
+
+def test_concurrent_transfers_should_preserve_total_balance(a_bank):
+    jack = a_bank.get_customer("1")
+    ibans = [f"tr{i}" for i in range(5)]
+    for iban in ibans:
+        jack.add_account(Account(iban, 1_000))
+
+    def transfer_around(offset):
+        for i in range(2_000):
+            from_iban = ibans[(i + offset) % len(ibans)]
+            to_iban = ibans[(i + offset + 1 + i % 3) % len(ibans)]
+            try:
+                a_bank.transfer(from_iban, to_iban, 1 + i % 7)
+            except InsufficientBalanceException:
+                pass
+
+    threads = [Thread(target=transfer_around, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(a_bank.get_account(iban).balance for iban in ibans) == 5_000
+
+
+def test_slotted_bank_should_create_slotted_customers():
+    bank = SlottedBank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(SlottedAccount("tr1", 1_000))
+    assert not hasattr(bank, "__dict__")
+    assert not hasattr(jack, "__dict__")
+    assert bank.get_account("tr1").balance == 1_000
+    assert bank.get_customer("1").fullname == "jack bauer"
@@ -0,0 +1,149 @@
+import sys
+from threading import Barrier, Thread
+
+import pytest
+
+from banking.account import Account, AccountStatus, CheckingAccount, SlottedAccount
+from banking.bank import Bank, SlottedBank
+from banking.journal import Ledger
+from banking.money import Money
+from banking.transaction import DEPOSIT, TransactionResult
+
+
+@pytest.fixture
+def a_dump(tmp_path):
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", "1000.10"))
+    jack.add_account(CheckingAccount("tr2", -50, overdraft_amount=300))
+    kate = bank.create_customer("2", "kate austen")
+    kate.add_account(Account("tr3", 300, AccountStatus.BLOCKED))
+    bank.create_customer("3", "jack bauer")
+    path = tmp_path / "bank.dump"
+    bank.dump(path)
+    return path
+
+
+def test_load_should_restore_the_bank(a_dump):
+    bank = Bank.load(a_dump)
+    assert bank.name == "isbankasi"
+    assert [customer.identity for customer in bank.customers] == ["1", "2", "3"]
+    jack = bank.get_customer("1")
+    assert jack.fullname == "jack bauer"
+    assert [account.iban for account in jack.accounts] == ["tr1", "tr2"]
+    assert bank.get_account("tr1").balance == Money(100_010)
+    assert isinstance(bank.get_account("tr2"), CheckingAccount)
+    assert bank.get_account("tr2").available_balance == 250
+    assert bank.get_account("tr3").status == AccountStatus.BLOCKED
+    assert bank.get_customer("3").accounts == []
+
+
+def test_lazy_load_should_materialize_on_lookup(a_dump):
+    bank = Bank.load(a_dump, lazy=True)
+    assert bank._customers == []
+    assert bank.get_account("tr3").balance == 300
+    assert [customer.identity for customer in bank._customers] == ["2"]
+    assert bank.get_account("tr9") is None
+    assert bank.get_customer("9") is None
+    assert list(bank.apply_transactions([("tr1", DEPOSIT, 10)])) == [TransactionResult.SUCCESS]
+    assert [customer.identity for customer in bank.customers] == ["1", "2", "3"]
+
+
+def test_lazy_load_should_keep_changes_and_reject_duplicates(a_dump):
+    bank = Bank.load(a_dump, lazy=True)
+    with pytest.raises(ValueError):
+        bank.create_customer("1", "jack bauer")
+    kate = bank.get_customer("2")
+    with pytest.raises(ValueError):
+        kate.add_account(Account("tr1"))
+    kate.remove_account(bank.get_account("tr3"))
+    assert bank.get_account("tr3") is None
+    bank.create_customer("4", "sun kwon")
+    bank.get_account("tr1").deposit(10)
+    assert [customer.identity for customer in bank.customers] == ["1", "2", "3", "4"]
+    assert bank.get_account("tr1").balance == Money(101_010)
+
+
+def test_slotted_bank_should_load_slotted_accounts(a_dump):
+    bank = SlottedBank.load(a_dump)
+    assert type(bank.get_account("tr1")) is SlottedAccount
+
+
+def test_load_should_reject_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        Bank.load(path)
+
+
+def test_dump_should_keep_the_overdraft_of_recovered_accounts(tmp_path):
+    ledger = Ledger(tmp_path / "ledger")
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(CheckingAccount("tr1", 200, overdraft_amount=500))
+    jack.add_account(Account("tr2", 100))
+    ledger.attach(bank)
+    bank.get_account("tr1").withdraw(500)
+    ledger.close()
+    store = Ledger(tmp_path / "ledger").recover()
+    recovered = Bank("isbankasi")
+    kate = recovered.create_customer("1", "jack bauer")
+    kate.add_account(store.get_account("tr1"))
+    kate.add_account(store.get_account("tr2"))
+    recovered.dump(tmp_path / "bank.dump")
+    loaded = Bank.load(tmp_path / "bank.dump")
+    account = loaded.get_account("tr1")
+    assert isinstance(account, CheckingAccount)
+    assert account.balance == -300
+    assert account.available_balance == 200
+    assert not loaded.get_account("tr2").is_checking
+
+
+@pytest.mark.parametrize("identity, iban", [(1, "tr1"), ("1", 1), (None, "tr1")])
+def test_dump_should_reject_values_that_are_not_strings(tmp_path, identity, iban):
+    bank = Bank("isbankasi")
+    bank.create_customer(identity, "jack bauer").add_account(Account(iban, 100))
+    with pytest.raises(ValueError):
+        bank.dump(tmp_path / "bank.dump")
+    assert not (tmp_path / "bank.dump").exists()
+
+
+def test_lazy_bank_should_not_find_keys_that_are_not_strings(a_dump):
+    bank = Bank.load(a_dump, lazy=True)
+    assert bank.get_customer(1) is None
+    assert bank.get_account(2) is None
+    assert bank.get_customer("1").fullname == "jack bauer"
+
+
+def test_lazy_bank_should_materialize_each_customer_once_across_threads(tmp_path):
+    bank = Bank("isbankasi")
+    for i in range(200):
+        bank.create_customer(str(i), f"customer {i}").add_account(Account(f"tr{i}", i))
+    bank.dump(tmp_path / "bank.dump")
+    lazy_bank = Bank.load(tmp_path / "bank.dump", lazy=True)
+    barrier = Barrier(8)
+    found = [[] for _ in range(8)]
+
+    def look_up(thread):
+        barrier.wait()
+        for i in range(200):
+            found[thread].append(lazy_bank.get_account(f"tr{(i * (thread + 1)) % 200}"))
+
+    threads = [Thread(target=look_up, args=(thread,)) for thread in range(8)]
+    # switch threads as often as possible, so lookups of one customer overlap
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    accounts = {}
+    for accounts_found in found:
+        for account in accounts_found:
+            assert account is not None
+            assert accounts.setdefault(account.iban, account) is account
+    assert len(lazy_bank.customers) == 200
+    assert [customer.identity for customer in lazy_bank.customers] == [str(i) for i in range(200)]
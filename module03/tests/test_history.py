@@ -0,0 +1,60 @@
+from itertools import count
+
+import pytest
+
+from banking.account import Account, AccountStatus
+from banking.bank import Bank
+from banking.history import Entry, Statement, TransactionHistory
+from banking.transaction import DEPOSIT, WITHDRAW
+
+
+@pytest.fixture
+def a_bank():
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 1_000))
+    jack.add_account(Account("tr2", 500))
+    return bank
+
+
+@pytest.fixture
+def history(a_bank):
+    # every change happens one second after the previous one, starting at 1
+    history = TransactionHistory(clock=count(1).__next__)
+    history.attach(a_bank)
+    return history
+
+
+def test_changes_should_be_recorded_in_order(a_bank, history):
+    a_bank.get_account("tr1").deposit(100)
+    a_bank.get_account("tr1").withdraw(300)
+    a_bank.get_account("tr1").status = AccountStatus.BLOCKED
+    assert history.entries("tr1") == [Entry(1, 100, 1_100), Entry(2, -300, 800)]
+    assert history.entries("tr2") == []
+    assert history.entries("tr9") == []
+
+
+def test_entries_should_be_range_queried(a_bank, history):
+    account = a_bank.get_account("tr1")
+    for _ in range(5):
+        account.deposit(10)
+    assert [entry.timestamp for entry in history.entries("tr1", 2, 4)] == [2, 3]
+    assert [entry.timestamp for entry in history.entries("tr1", start=4)] == [4, 5]
+    assert history.entries("tr1", 6, 9) == []
+
+
+def test_statements_should_stream_per_account(a_bank, history):
+    a_bank.get_account("tr1").deposit(100)
+    a_bank.transfer("tr1", "tr2", 50)
+    list(a_bank.apply_transactions([("tr2", DEPOSIT, 5), ("tr2", WITHDRAW, 10_000)]))
+    statements = history.statements(2, 10)
+    assert next(statements) == Statement("tr1", 1_100, 1_050, [Entry(2, -50, 1_050)])
+    assert next(statements) == Statement("tr2", 500, 555, [Entry(3, 50, 550), Entry(4, 5, 555)])
+    assert next(statements, None) is None
+
+
+def test_removed_accounts_should_be_forgotten(a_bank, history):
+    jack = a_bank.get_customer("1")
+    jack.remove_account(a_bank.get_account("tr2"))
+    assert len(history) == 1
+    assert history.statement("tr2", 0, 10) is None
@@ -0,0 +1,127 @@
+import pytest
+
+from banking.account import Account, AccountStatus, CheckingAccount
+from banking.bank import Bank
+from banking.journal import DEPOSIT_CODE, OPEN, Journal, Ledger
+from banking.transaction import DEPOSIT, WITHDRAW
+
+
+@pytest.fixture
+def a_ledger(tmp_path):
+    ledger = Ledger(tmp_path / "ledger")
+    yield ledger
+    ledger.close()
+
+
+@pytest.fixture
+def a_bank(a_ledger):
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 1_000))
+    a_ledger.attach(bank)
+    jack.add_account(CheckingAccount("tr2", 500, overdraft_amount=300))
+    jack.add_account(Account("tr3", 100, AccountStatus.BLOCKED))
+    return bank
+
+
+def test_journal_should_append_and_grow(tmp_path):
+    journal = Journal(tmp_path / "journal.bin", chunk_records=2)
+    for i in range(5):
+        assert journal.append(DEPOSIT_CODE, i, f"tr{i}", amount=i) == i + 1
+    journal.close()
+    journal = Journal(tmp_path / "journal.bin")
+    records = journal.records()
+    assert len(journal) == 5
+    assert records["seq"].tolist() == [1, 2, 3, 4, 5]
+    assert records["iban"][4] == b"tr4"
+    assert journal.records(after=3)["amount"].tolist() == [3, 4]
+    del records
+    journal.close()
+
+
+def test_journal_should_reject_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 128)
+    with pytest.raises(ValueError):
+        Journal(path)
+
+
+def test_attach_should_journal_existing_accounts(a_ledger, a_bank):
+    records = a_ledger.journal.records()
+    assert records["operation"][0] == OPEN
+    assert records["iban"][:3].tolist() == [b"tr1", b"tr2", b"tr3"]
+    del records
+
+
+def test_recover_should_replay_journal(tmp_path, a_ledger, a_bank):
+    a_bank.get_account("tr1").deposit(500)
+    a_bank.get_account("tr2").withdraw(700)
+    a_bank.transfer("tr1", "tr2", 100)
+    a_bank.get_account("tr3").status = AccountStatus.ACTIVE
+    a_bank.get_account("tr2").overdraft_balance = 1_000
+    list(a_bank.apply_transactions([("tr3", DEPOSIT, 50), ("tr1", WITHDRAW, 5_000)]))
+    jack = a_bank.get_customer("1")
+    jack.remove_account(a_bank.get_account("tr1"))
+    jack.add_account(Account("tr1", 10))
+    a_ledger.close()
+    # 2. call exercise method
+    store = Ledger(tmp_path / "ledger").recover()
+    # 3. verification
+    assert sorted(store.ibans) == ["tr1", "tr2", "tr3"]
+    assert store.get_account("tr1").balance == 10
+    assert store.get_account("tr2").balance == -100
+    assert store.get_account("tr2").available_balance == 900
+    assert store.get_account("tr3").balance == 150
+    assert store.get_account("tr3").status == AccountStatus.ACTIVE
+
+
+def test_recover_should_load_snapshot_and_replay_tail(tmp_path):
+    ledger = Ledger(tmp_path / "ledger", snapshot_interval=10)
+    bank = Bank("isbankasi")
+    ledger.attach(bank)
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 0))
+    for _ in range(25):
+        bank.get_account("tr1").deposit(2)
+    assert (tmp_path / "ledger" / "snapshot.npz").exists()
+    ledger.close()
+    ledger = Ledger(tmp_path / "ledger")
+    store = ledger.recover()
+    assert store.get_account("tr1").balance == 50
+    # recovered accounts are not journaled again, new changes continue the journal
+    recovered_bank = Bank("isbankasi")
+    recovered_bank.create_customer("1", "jack bauer").add_account(store.get_account("tr1"))
+    ledger.attach(recovered_bank)
+    recovered_bank.get_account("tr1").withdraw(20)
+    ledger.close()
+    assert Ledger(tmp_path / "ledger").recover().get_account("tr1").balance == 30
+
+
+def test_attach_without_recover_should_not_reuse_account_ids(tmp_path):
+    ledger = Ledger(tmp_path / "ledger")
+    bank = Bank("isbankasi")
+    ledger.attach(bank)
+    bank.create_customer("1", "jack bauer").add_account(Account("tr1", 100))
+    bank.get_account("tr1").deposit(5)
+    ledger.close()
+    ledger = Ledger(tmp_path / "ledger")
+    other_bank = Bank("isbankasi")
+    ledger.attach(other_bank)
+    other_bank.create_customer("2", "kate austen").add_account(Account("tr2", 7))
+    ledger.close()
+    store = Ledger(tmp_path / "ledger").recover()
+    assert sorted(store.ibans) == ["tr1", "tr2"]
+    assert store.get_account("tr1").balance == 105
+    assert store.get_account("tr2").balance == 7
+
+
+def test_recover_should_keep_the_latest_status_and_overdraft(tmp_path, a_ledger, a_bank):
+    account = a_bank.get_account("tr2")
+    for overdraft in range(100, 0, -1):
+        account.overdraft_balance = overdraft
+    for status in [AccountStatus.BLOCKED, AccountStatus.CLOSED] * 50 + [AccountStatus.BLOCKED]:
+        account.status = status
+    a_ledger.close()
+    store = Ledger(tmp_path / "ledger").recover()
+    assert store.get_account("tr2").overdraft_balance == 1
+    assert store.get_account("tr2").status == AccountStatus.BLOCKED
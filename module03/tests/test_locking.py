@@ -0,0 +1,41 @@
+from threading import Thread
+
+import pytest
+
+from banking.locking import StripedLock
+
+
+def test_same_key_should_map_to_same_lock():
+    locks = StripedLock(16)
+    assert locks.lock_for("tr1") is locks.lock_for("tr1")
+    assert 0 <= locks.stripe("tr1") < locks.stripes
+
+
+def test_stripes_must_be_positive():
+    with pytest.raises(ValueError):
+        StripedLock(0)
+
+
+def test_locked_should_be_reentrant_for_keys_on_same_stripe():
+    locks = StripedLock(1)
+    with locks.locked(("tr1", "tr2")):
+        with locks.lock_for("tr1"):
+            pass
+
+
+def test_locked_in_opposite_order_should_not_deadlock():
+    locks = StripedLock(64)
+    counter = [0]
+
+    def increment(keys):
+        for _ in range(5_000):
+            with locks.locked(keys):
+                counter[0] += 1
+
+    threads = [Thread(target=increment, args=(keys,)) for keys in (("tr1", "tr2"), ("tr2", "tr1"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert not any(thread.is_alive() for thread in threads)
+    assert counter[0] == 10_000
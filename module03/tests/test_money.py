@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+import pytest
+
+from banking.account import Account, CheckingAccount, InsufficientBalanceException
+from banking.money import Money, to_cents
+
+
+def test_to_cents_should_round_half_to_even():
+    assert to_cents(10) == 1_000
+    assert to_cents(0.1) == 10
+    assert to_cents("0.125") == 12
+    assert to_cents(Decimal("0.135")) == 14
+    assert to_cents(Money(7)) == 7
+
+
+def test_money_arithmetic_and_comparisons():
+    a_money = Money.of("10.50")
+    assert a_money + 1 == Money(1_150)
+    assert 20 - a_money == Money(950)
+    assert a_money * 0.1 == Money(105)
+    assert -a_money < 0 < a_money
+    assert a_money == 10.5
+    assert a_money == Decimal("10.50")
+    assert hash(Money.of(10)) == hash(10)
+    assert hash(a_money) == hash(10.5) == hash(Decimal("10.50"))
+    assert str(Money(-5)) == "-0.05"
+
+
+def test_money_should_compare_exactly():
+    assert Money(950) != "9.50"
+    assert Money(0) != 0.004
+    assert Money(0) < 0.004
+    # 0.1 is not exactly a tenth as a float
+    assert Money(10) != 0.1
+    with pytest.raises(TypeError):
+        assert Money(0) < "1"
+
+
+def test_repeated_deposits_should_not_drift():
+    account = Account("tr1", 0)
+    for _ in range(10):
+        account.deposit(0.1)
+    assert account.balance == 1
+    assert account.balance.cents == 100
+
+
+def test_overdraft_math_should_be_exact():
+    account = CheckingAccount("tr1", 0.3, overdraft_amount=0.1)
+    assert account.withdraw(0.4) == Money(-10)
+    assert account.available_balance == 0
+    with pytest.raises(InsufficientBalanceException):
+        account.withdraw(0.01)
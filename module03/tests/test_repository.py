@@ -0,0 +1,102 @@
+import mongomock
+import pytest
+
+from banking.account import Account, AccountStatus, CheckingAccount
+from banking.bank import Bank
+from banking.repository import AccountRepository
+
+
+@pytest.fixture
+def a_collection():
+    return mongomock.MongoClient()["denizbank"]["accounts"]
+
+
+@pytest.fixture
+def a_repository(a_collection):
+    repository = AccountRepository(a_collection, batch_size=3, flush_interval=None)
+    yield repository
+    repository.close()
+
+
+def test_changes_should_be_written_behind(a_collection, a_repository):
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 1_000))
+    a_repository.attach(bank)
+    jack.add_account(CheckingAccount("tr2", 500, overdraft_amount=300))
+    bank.get_account("tr1").deposit(100)
+    bank.get_account("tr1").deposit(100)
+    # two dirty accounts: below batch size, nothing written yet
+    assert a_repository.dirty_count == 2
+    assert a_collection.count_documents({}) == 0
+    a_repository.flush()
+    assert a_collection.find_one({"_id": "tr1"}) == {"_id": "tr1", "balance": 1_200, "status": "ACTIVE"}
+    assert a_collection.find_one({"_id": "tr2"})["overdraft"] == 300
+
+
+def test_batch_size_should_trigger_flush(a_collection, a_repository):
+    for i in range(3):
+        a_repository.save(Account(f"tr{i}", 1_000))
+    assert a_collection.count_documents({}) == 3
+    assert a_repository.dirty_count == 0
+
+
+def test_find_should_load_and_cache(a_collection, a_repository):
+    a_collection.insert_one({"_id": "tr1", "balance": 1_000, "status": "BLOCKED"})
+    a_collection.insert_one({"_id": "tr2", "balance": 1_000, "status": "ACTIVE", "overdraft": 500})
+    account = a_repository.find("tr1")
+    assert account.status == AccountStatus.BLOCKED
+    assert a_repository.find("tr1") is account
+    assert a_repository.find("tr2").withdraw(1_500) == -500
+    assert a_repository.find("tr7") is None
+
+
+def test_changes_of_found_accounts_should_be_written_behind(a_collection, a_repository):
+    a_collection.insert_one({"_id": "tr1", "balance": 1_000, "status": "ACTIVE"})
+    a_repository.find("tr1").deposit(250)
+    assert a_repository.dirty_count == 1
+    a_repository.flush()
+    assert a_collection.find_one({"_id": "tr1"})["balance"] == 1_250
+
+
+def test_removed_accounts_should_be_deleted(a_collection, a_repository):
+    bank = Bank("isbankasi")
+    a_repository.attach(bank)
+    jack = bank.create_customer("1", "jack bauer")
+    account = Account("tr1", 1_000)
+    jack.add_account(account)
+    a_repository.flush()
+    jack.remove_account(account)
+    assert a_repository.find("tr1") is None
+    a_repository.flush()
+    assert a_collection.count_documents({}) == 0
+
+
+def test_close_should_flush(a_collection):
+    repository = AccountRepository(a_collection, batch_size=100, flush_interval=60)
+    repository.save(Account("tr1", 1_000))
+    repository.close()
+    assert a_collection.count_documents({}) == 1
+
+
+def test_evicted_dirty_account_should_still_be_found(a_collection):
+    repository = AccountRepository(a_collection, batch_size=100, flush_interval=None, cache_size=1)
+    first = Account("tr1", 1_000)
+    repository.save(first)
+    repository.save(Account("tr2", 1_000))
+    assert repository.find("tr1") is first
+    repository.close()
+
+
+def test_evicted_account_still_held_should_not_be_loaded_twice(a_collection):
+    a_collection.insert_many([{"_id": f"tr{i}", "balance": 1_000, "status": "ACTIVE"} for i in range(3)])
+    repository = AccountRepository(a_collection, flush_interval=None, cache_size=1)
+    held = repository.find("tr0")
+    repository.find("tr1")
+    repository.find("tr2")
+    assert repository.find("tr0") is held
+    held.deposit(100)
+    repository.find("tr1").deposit(10)
+    repository.close()
+    assert a_collection.find_one({"_id": "tr0"})["balance"] == 1_100
+    assert a_collection.find_one({"_id": "tr1"})["balance"] == 1_010
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from banking.account import Account, CheckingAccount
+from banking.bank import Bank
+from banking.journal import Ledger
+from banking.risk import OverdraftRisk, overdraft_risk
+from banking.store import AccountStore
+
+
+def test_overdraft_risk_should_report_overdrawn_accounts():
+    ibans = ["tr1", "tr2", "tr3", "tr4", "tr5"]
+    balances = np.array([-9_500, -2_000, 5_000, -100, -50_000])
+    overdrafts = np.array([10_000, 10_000, 10_000, 0, 40_000])
+    report = overdraft_risk(ibans, balances, overdrafts, bins=4, top_k=2, alert_ratio=0.9)
+    assert report.overdrawn == 3
+    assert report.exposure == 615
+    assert report.histogram.tolist() == [1, 0, 0, 2]
+    assert report.top == [("tr5", 500), ("tr1", 95)]
+    assert report.alerts == ["tr1", "tr5"]
+
+
+@pytest.mark.parametrize("top_k", [0, -1])
+def test_overdraft_risk_without_top_accounts(top_k):
+    balances = np.array([-9_500, -2_000, -50_000])
+    overdrafts = np.array([10_000, 10_000, 40_000])
+    report = overdraft_risk(["tr1", "tr2", "tr3"], balances, overdrafts, top_k=top_k)
+    assert report.top == []
+    assert report.overdrawn == 3
+
+
+def test_overdraft_risk_without_overdrawn_accounts():
+    report = overdraft_risk([], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    assert report.overdrawn == 0
+    assert report.exposure == 0
+    assert report.top == []
+
+
+def test_store_overdraft_risk():
+    store = AccountStore()
+    store.add("tr1", -150, overdraft_amount=200)
+    store.add("tr2", 100)
+    assert store.overdraft_risk(top_k=1).top == [("tr1", 150)]
+
+
+def test_overdraft_risk_should_follow_the_bank():
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(Account("tr1", 100))
+    jack.add_account(CheckingAccount("tr2", 100, overdraft_amount=500))
+    jack.add_account(CheckingAccount("tr3", 0, overdraft_amount=100))
+    risk = OverdraftRisk(capacity=1)
+    risk.attach(bank)
+    assert len(risk) == 2
+    bank.get_account("tr2").withdraw(400)
+    bank.get_account("tr3").withdraw(100)
+    assert risk.scan().top == [("tr2", 300), ("tr3", 100)]
+    bank.get_account("tr2").overdraft_balance = 300
+    assert risk.scan(alert_ratio=1).alerts == ["tr2", "tr3"]
+    jack.remove_account(bank.get_account("tr2"))
+    report = risk.scan()
+    assert (report.overdrawn, report.exposure, report.alerts) == (1, 100, ["tr3"])
+
+
+def test_overdraft_risk_listener_should_track_recovered_accounts(tmp_path):
+    ledger = Ledger(tmp_path / "ledger")
+    bank = Bank("isbankasi")
+    bank.create_customer("1", "jack bauer").add_account(CheckingAccount("tr1", -300, overdraft_amount=500))
+    ledger.attach(bank)
+    ledger.close()
+    store = Ledger(tmp_path / "ledger").recover()
+    recovered = Bank("isbankasi")
+    recovered.create_customer("1", "jack bauer").add_account(store.get_account("tr1"))
+    risk = OverdraftRisk()
+    risk.attach(recovered)
+    assert risk.scan().exposure == 300
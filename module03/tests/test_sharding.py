@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from banking.account import Account, AccountStatus, CheckingAccount
+from banking.bank import Bank
+from banking.sharding import ShardedBank, shard_of
+from banking.transaction import DEPOSIT, WITHDRAW, TransactionResult
+
+ibans = [f"tr{i}" for i in range(20)]
+
+
+@pytest.fixture(scope="module")
+def a_sharded_bank():
+    bank = ShardedBank(shards=3)
+    for i, iban in enumerate(ibans):
+        bank.open_account(str(i % 5), f"customer {i % 5}", iban, 1_000,
+                          AccountStatus.BLOCKED if i == 19 else AccountStatus.ACTIVE,
+                          overdraft_amount=500 if i % 2 else 0)
+    yield bank
+    bank.close()
+
+
+def test_shard_of_should_be_stable():
+    assert shard_of("tr1", 3) == shard_of("tr1", 3)
+    assert {shard_of(iban, 3) for iban in ibans} == {0, 1, 2}
+
+
+def test_open_account_with_existing_iban_should_fail(a_sharded_bank):
+    with pytest.raises(ValueError):
+        a_sharded_bank.open_account("1", "jack bauer", "tr1")
+
+
+def test_apply_transactions_should_match_single_bank(a_sharded_bank):
+    bank = Bank("isbankasi")
+    for i, iban in enumerate(ibans):
+        account = (CheckingAccount(iban, 1_000, overdraft_amount=500) if i % 2 else Account(iban, 1_000))
+        if i == 19:
+            account.status = AccountStatus.BLOCKED
+        (bank.get_customer(str(i % 5)) or bank.create_customer(str(i % 5), "")).add_account(account)
+    rnd = random.Random(3)
+    transactions = [(rnd.choice(ibans + ["tr99"]), rnd.choice((DEPOSIT, WITHDRAW)), rnd.randint(-50, 800))
+                    for _ in range(2_000)]
+    # 2. call exercise method
+    results = list(a_sharded_bank.apply_transactions(transactions, batch_size=128))
+    # 3. verification
+    assert results == list(bank.apply_transactions(transactions))
+    assert [a_sharded_bank.balance(iban) for iban in ibans] == [bank.get_account(iban).balance for iban in ibans]
+
+
+def find_ibans(same_shard, shards=3):
+    for first in ibans[:-1]:
+        for second in ibans[:-1]:
+            if first != second and (shard_of(first, shards) == shard_of(second, shards)) == same_shard:
+                return first, second
+
+
+@pytest.mark.parametrize("same_shard", [True, False])
+def test_transfer_should_move_money(a_sharded_bank, same_shard):
+    from_iban, to_iban = find_ibans(same_shard)
+    from_balance, to_balance = a_sharded_bank.balance(from_iban), a_sharded_bank.balance(to_iban)
+    assert a_sharded_bank.transfer(from_iban, to_iban, 100) == TransactionResult.SUCCESS
+    assert a_sharded_bank.balance(from_iban) == from_balance - 100
+    assert a_sharded_bank.balance(to_iban) == to_balance + 100
+
+
+@pytest.mark.parametrize("same_shard", [True, False])
+def test_failed_transfer_should_change_nothing(a_sharded_bank, same_shard):
+    from_iban, to_iban = find_ibans(same_shard)
+    from_balance, to_balance = a_sharded_bank.balance(from_iban), a_sharded_bank.balance(to_iban)
+    assert a_sharded_bank.transfer(from_iban, to_iban, 1_000_000) == TransactionResult.INSUFFICIENT_BALANCE
+    assert a_sharded_bank.transfer(from_iban, "tr99", 10) == TransactionResult.UNKNOWN_ACCOUNT
+    assert a_sharded_bank.balance(from_iban) == from_balance
+    assert a_sharded_bank.balance(to_iban) == to_balance
+
+
+def test_invalid_amounts_should_not_stop_the_workers(a_sharded_bank):
+    transactions = [(iban, DEPOSIT, amount) for iban in ibans[:3] for amount in (None, "abc", float("nan"))]
+    assert set(a_sharded_bank.apply_transactions(transactions)) == {TransactionResult.INVALID_AMOUNT}
+    from_iban, to_iban = find_ibans(False)
+    assert a_sharded_bank.transfer(from_iban, to_iban, None) == TransactionResult.INVALID_AMOUNT
+    assert a_sharded_bank.transfer(from_iban, to_iban, float("inf")) == TransactionResult.INVALID_AMOUNT
+    assert a_sharded_bank.balance(from_iban) is not None
+
+
+def test_transfer_to_inactive_account_should_be_aborted(a_sharded_bank):
+    from_iban = next(iban for iban in ibans if shard_of(iban, 3) != shard_of("tr19", 3))
+    balance = a_sharded_bank.balance(from_iban)
+    assert a_sharded_bank.transfer(from_iban, "tr19", 10) == TransactionResult.ACCOUNT_NOT_ACTIVE
+    assert a_sharded_bank.balance(from_iban) == balance
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from banking.account import AccountStatus, SlottedAccount, CheckingAccount, InsufficientBalanceException
+from banking.bank import Bank
+from banking.money import Money
+from banking.store import AccountStore
+
+
+@pytest.fixture
+def a_store():
+    store = AccountStore(capacity=2)
+    store.add("tr1", 1_000)
+    store.add("tr2", 1_000, AccountStatus.BLOCKED)
+    store.add("tr3", -200, overdraft_amount=500)
+    store.add_account(CheckingAccount("tr4", 100, overdraft_amount=50))
+    return store
+
+
+def test_add_should_grow_columns(a_store):
+    assert len(a_store) == 4
+    assert "tr4" in a_store
+    assert a_store.balances.tolist() == [100_000, 100_000, -20_000, 10_000]
+    assert a_store.statuses.tolist() == [100, 300, 100, 100]
+    assert a_store.overdrafts.tolist() == [0, 0, 50_000, 5_000]
+
+
+def test_add_with_existing_iban_should_fail(a_store):
+    with pytest.raises(ValueError):
+        a_store.add("tr1")
+
+
+def test_view_should_follow_account_rules(a_store):
+    account = a_store.get_account("tr3")
+    assert isinstance(account, SlottedAccount)
+    assert not hasattr(account, "__dict__")
+    assert account.withdraw(300) == -500
+    with pytest.raises(InsufficientBalanceException):
+        account.withdraw(1)
+    assert account.deposit(500) == 0
+    assert a_store.balances[2] == 0
+    with pytest.raises(ValueError):
+        a_store.get_account("tr2").deposit(100)
+    assert a_store.get_account("tr5") is None
+
+
+def test_view_with_an_overdraft_should_be_a_checking_account(a_store):
+    assert not a_store.get_account("tr1").is_checking
+    assert a_store.get_account("tr1").overdraft_balance == 0
+    assert a_store.get_account("tr3").is_checking
+    assert a_store.get_account("tr3").overdraft_balance == 500
+    copy = AccountStore()
+    copy.add_account(a_store.get_account("tr3"))
+    assert copy.overdrafts.tolist() == [50_000]
+
+
+def test_view_status_should_write_through(a_store):
+    account = a_store.get_account("tr1")
+    account.status = AccountStatus.CLOSED
+    assert a_store.statuses[0] == AccountStatus.CLOSED.value
+    assert a_store.get_account("tr1").status == AccountStatus.CLOSED
+    with pytest.raises(ValueError):
+        account.status = None
+
+
+def test_view_should_work_with_bank(a_store):
+    bank = Bank("isbankasi")
+    jack = bank.create_customer("1", "jack bauer")
+    jack.add_account(a_store.get_account("tr1"))
+    jack.add_account(a_store.get_account("tr3"))
+    bank.transfer("tr1", "tr3", 400)
+    assert a_store.balances[[0, 2]].tolist() == [60_000, 20_000]
+    jack.remove_account(a_store.get_account("tr1"))
+    assert bank.get_account("tr1") is None
+
+
+def test_accrue_interest_should_skip_inactive_and_negative_balances(a_store):
+    total = a_store.accrue_interest(0.01)
+    assert total == 11
+    assert a_store.balances.tolist() == [101_000, 100_000, -20_000, 10_100]
+
+
+def test_accrue_interest_with_mask(a_store):
+    a_store.accrue_interest(0.5, mask=np.array([False, True, True, True]))
+    assert a_store.balances.tolist() == [100_000, 100_000, -20_000, 15_000]
+
+
+def test_charge_fee_should_respect_overdraft(a_store):
+    charged = a_store.charge_fee(200)
+    assert charged.tolist() == [True, False, True, False]
+    assert a_store.balances.tolist() == [80_000, 100_000, -40_000, 10_000]
+    with pytest.raises(ValueError):
+        a_store.charge_fee(0)
+
+
+def test_accrue_interest_should_round_to_the_cent():
+    store = AccountStore()
+    store.add("tr1", "0.05")
+    assert store.accrue_interest(0.1) == 0
+    assert store.accrue_interest(0.3) == Money(2)
+    assert store.get_account("tr1").balance == Money(7)
+
+
+def test_charge_fee_with_status_filter(a_store):
+    a_store.get_account("tr2").status = AccountStatus.ACTIVE
+    charged = a_store.charge_fee(10, mask=a_store.status_mask(AccountStatus.ACTIVE) & (a_store.balances > 50_000))
+    assert charged.tolist() == [True, True, False, False]
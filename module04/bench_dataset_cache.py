@@ -0,0 +1,71 @@
+# run from module04: python bench_dataset_cache.py [employees]
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dataset_cache import DatasetCache
+
+DEPARTMENTS = ("Sales", "IT", "Finance", "HR")
+
+
+def employees(n, seed=42):
+    rnd = random.Random(seed)
+    return [(f"employee {i}", rnd.choice(DEPARTMENTS), rnd.randrange(50_000, 250_000), rnd.randrange(1950, 2005),
+             rnd.random() < 0.8) for i in range(n)]
+
+
+def read_csv(path):
+    with open(path, "rt", newline="") as file:
+        return [(name, department, int(salary), int(birth_year), full_time == "True")
+                for name, department, salary, birth_year, full_time in csv.reader(file)]
+
+
+def read_json(path):
+    with open(path, "rt") as file:
+        return json.load(file)
+
+
+def read_excel(path):
+    import pandas as pd
+    return pd.read_excel(path)
+
+
+def timed(fun):
+    t0 = time.perf_counter()
+    fun()
+    return time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = employees(n)
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        with open(directory / "employees.csv", "wt", newline="") as file:
+            csv.writer(file).writerows(rows)
+        with open(directory / "employees.json", "wt") as file:
+            json.dump(rows, file)
+        sources = [("csv", directory / "employees.csv", read_csv), ("json", directory / "employees.json", read_json)]
+        try:
+            import pandas as pd
+            pd.DataFrame(rows[:100_000], columns=["fullname", "department", "salary", "year", "fulltime"]).to_excel(
+                directory / "employees.xlsx")
+            sources.append(("xlsx (100k rows)", directory / "employees.xlsx", read_excel))
+        except ImportError:
+            print("pandas/openpyxl not installed: skipping xlsx")
+        cache = DatasetCache(directory / "cache")
+        print(f"{n:,} employees")
+        for name, path, parse in sources:
+            parse_time = timed(lambda: parse(path))
+            first_time = timed(lambda: cache.load(path, parse))
+            cached_time = timed(lambda: cache.load(path, parse))
+            print(f"{name:<17}: parse {parse_time:6.2f} sec, first load (parse + store) {first_time:6.2f} sec, "
+                  f"cached load {cached_time:6.2f} sec")
+
+
+if __name__ == "__main__":
+    main()
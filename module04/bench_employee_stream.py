@@ -0,0 +1,81 @@
+# run from module04: python bench_employee_stream.py [employees]
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import Process, Queue
+
+import employee_pb2
+from bench_serialization import PEAK_MEMORY, employees, peak_memory
+from employee_stream import read_employee, read_employees, write_employees
+
+SEEKS = 1_000
+
+
+def write_message(path, n):
+    # exercise11: one Employees message with every employee
+    employees_msg = employee_pb2.Employees()
+    for name, dept, salary, birth_year, full_time in employees(n):
+        emp = employees_msg.employees.add()
+        emp.name, emp.department, emp.salary, emp.birth_year, emp.full_time = name, dept, salary, birth_year, full_time
+    with open(path, "wb") as f:
+        f.write(employees_msg.SerializeToString())
+
+
+def read_message(path, n):
+    # exercise12
+    employees_msg = employee_pb2.Employees()
+    with open(path, "rb") as f:
+        employees_msg.ParseFromString(f.read())
+    return sum(emp.salary for emp in employees_msg.employees)
+
+
+def write_stream(path, n):
+    # employees(n) is a list here too, so only the encoding differs
+    write_employees(path, employees(n))
+
+
+def read_stream(path, n):
+    return sum(emp.salary for emp in read_employees(path))
+
+
+def _run(fun, path, n, results):
+    t0 = time.perf_counter()
+    fun(path, n)
+    elapsed = time.perf_counter() - t0
+    results.put((elapsed, peak_memory(lambda: fun(path, n)) / 2 ** 20))
+
+
+def measure(fun, path, n):
+    # a fresh process per run, for a per-run peak
+    results = Queue()
+    process = Process(target=_run, args=(fun, path, n, results))
+    process.start()
+    process.join()
+    return results.get()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        message_path = os.path.join(directory, "employees.bin")
+        stream_path = os.path.join(directory, "employees.stream")
+        print(f"{n:,} employees, peak: {PEAK_MEMORY}")
+        for name, fun, path in (("Employees message, write", write_message, message_path),
+                                ("Employees message, read", read_message, message_path),
+                                ("length-delimited, write", write_stream, stream_path),
+                                ("length-delimited, read", read_stream, stream_path)):
+            elapsed, peak = measure(fun, path, n)
+            print(f"{name:<26}: {elapsed:6.2f} sec, peak {peak:8.1f} MiB")
+        t0 = time.perf_counter()
+        for i in range(SEEKS):
+            read_employee(stream_path, (i * 7_919) % n)
+        print(f"record N via index        : {(time.perf_counter() - t0) / SEEKS * 1e6:8.1f} us")
+        os.remove(stream_path + ".idx")
+        t0 = time.perf_counter()
+        read_employee(stream_path, n - 1)
+        print(f"last record without index : {(time.perf_counter() - t0) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# run from module04: python bench_employee_table.py [employees]
+import os
+import random
+import sys
+import tempfile
+import time
+
+from bench_serialization import employees, text_decode, text_encode
+from employee_table import EmployeeFile, write_employee_file
+
+LOOKUPS = 10_000
+
+
+def timed(fun):
+    t0 = time.perf_counter()
+    result = fun()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = employees(n)
+    indexes = [random.randrange(n) for _ in range(LOOKUPS)]
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "employees.txt")
+        table_path = os.path.join(directory, "employees.tbl")
+        text_encode(rows, text_path)
+        write_employee_file(table_path, rows)
+        print(f"{n:,} employees: text {os.path.getsize(text_path) / 2 ** 20:.1f} MiB, "
+              f"fixed-width {os.path.getsize(table_path) / 2 ** 20:.1f} MiB")
+        # exercise02: every use starts by splitting and converting the whole file
+        parsed, parse_time = timed(lambda: text_decode(text_path))
+        mean, text_mean_time = timed(lambda: sum(row[2] for row in parsed) / len(parsed))
+        print(f"text: parse {parse_time:6.2f} sec, then mean salary {text_mean_time * 1e3:8.2f} ms")
+        with EmployeeFile(table_path, writable=True) as table:
+            _, open_time = timed(lambda: EmployeeFile(table_path).close())
+            _, lookup_time = timed(lambda: [table[i] for i in indexes])
+            table_mean, table_mean_time = timed(lambda: float(table.salaries.mean()))
+            assert table_mean == mean
+            _, update_time = timed(lambda: [table.update(i, salary=1) for i in indexes])
+            print(f"fixed-width: open {open_time * 1e3:6.2f} ms, employee i {lookup_time / LOOKUPS * 1e6:6.2f} us, "
+                  f"mean salary (NumPy view) {table_mean_time * 1e3:8.2f} ms, "
+                  f"in-place update {update_time / LOOKUPS * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# run from module04: python bench_parallel_csv.py [employees] [max processes]
+import os
+import sys
+import tempfile
+import time
+
+from bench_serialization import csv_decode, csv_encode, employees
+from parallel_csv import read_csv_parallel
+
+CHUNK_SIZE = 4 << 20
+
+
+def timed(fun):
+    t0 = time.perf_counter()
+    result = fun()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    cores = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "employees.csv")
+        csv_encode(employees(n), path)
+        print(f"{n:,} employees, {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        expected, single_time = timed(lambda: csv_decode(path))
+        print(f"csv.reader, one process : {single_time:6.2f} sec")
+        processes = sorted({1, *(2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores), cores})
+        for count in processes:
+            rows, elapsed = timed(lambda: [row for batch in read_csv_parallel(path, processes=count,
+                                                                              chunk_size=CHUNK_SIZE)
+                                           for row in batch])
+            assert rows == expected
+            print(f"read_csv_parallel, {count:>3} : {elapsed:6.2f} sec, {single_time / elapsed:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
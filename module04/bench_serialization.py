@@ -0,0 +1,237 @@
+# run from module04: python bench_serialization.py [employees] [--json results.json] [--markdown results.md]
+import argparse
+import csv
+import json
+import os
+import pickle
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from multiprocessing import Process, Queue
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEPARTMENTS = ("Sales", "IT", "Finance", "HR", "Marketing")
+# the row limit of an .xlsx sheet, minus the header
+EXCEL_ROWS = 1_048_575
+PEAK_MEMORY = ("resident memory, sampled with psutil" if psutil is not None else
+               "Python allocations (tracemalloc): native buffers, e.g. protobuf's, are not counted")
+
+
+def employees(n, seed=42):
+    rnd = random.Random(seed)
+    return [(f"employee {i}", rnd.choice(DEPARTMENTS), rnd.randrange(50_000, 250_000), rnd.randrange(1950, 2005),
+             rnd.random() < 0.8) for i in range(n)]
+
+
+# encode(employees, path) / decode(path) -> list of (full_name, department, salary, birth_year, full_time),
+# written the way the exercises do it, decoded back to typed tuples
+def text_encode(employees, path):
+    # exercise01
+    with open(path, "wt") as file:
+        for full_name, department, salary, birth_year, full_time in employees:
+            file.write(f"{full_name},{department},{salary},{birth_year},{full_time}\n")
+
+
+def text_decode(path):
+    employees = []
+    with open(path, "rt") as file:
+        for line in file:
+            full_name, department, salary, birth_year, full_time = line.rstrip("\n").split(",")
+            employees.append((full_name, department, int(salary), int(birth_year), full_time == "True"))
+    return employees
+
+
+def pickle_encode(employees, path):
+    # exercise03
+    with open(path, "wb") as file:
+        pickle.dump(employees, file)
+
+
+def pickle_decode(path):
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def json_encode(employees, path):
+    # exercise05
+    with open(path, "wt") as file:
+        json.dump(employees, file)
+
+
+def json_decode(path):
+    with open(path, "rt") as file:
+        return [tuple(employee) for employee in json.load(file)]
+
+
+def csv_encode(employees, path):
+    # exercise07
+    with open(path, "wt", newline="") as file:
+        csv.writer(file).writerows(employees)
+
+
+def csv_decode(path):
+    with open(path, "rt", newline="") as file:
+        return [(full_name, department, int(salary), int(birth_year), full_time == "True")
+                for full_name, department, salary, birth_year, full_time in csv.reader(file)]
+
+
+def excel_encode(employees, path):
+    # exercise09
+    import pandas as pd
+    pd.DataFrame(employees, columns=["fullname", "department", "salary", "year", "fulltime"]).to_excel(path,
+                                                                                                    index=False)
+
+
+def excel_decode(path):
+    import pandas as pd
+    return list(pd.read_excel(path).itertuples(index=False, name=None))
+
+
+def protobuf_encode(employees, path):
+    # exercise11
+    import employee_pb2
+    employees_msg = employee_pb2.Employees()
+    for name, dept, salary, birth_year, full_time in employees:
+        emp = employees_msg.employees.add()
+        emp.name = name
+        emp.department = dept
+        emp.salary = salary
+        emp.birth_year = birth_year
+        emp.full_time = full_time
+    with open(path, "wb") as f:
+        f.write(employees_msg.SerializeToString())
+
+
+def protobuf_decode(path):
+    # exercise12
+    import employee_pb2
+    employees_msg = employee_pb2.Employees()
+    with open(path, "rb") as f:
+        employees_msg.ParseFromString(f.read())
+    return [(emp.name, emp.department, emp.salary, emp.birth_year, emp.full_time) for emp in employees_msg.employees]
+
+
+FORMATS = {"text": (text_encode, text_decode, ".txt"), "pickle": (pickle_encode, pickle_decode, ".pkl"),
+           "json": (json_encode, json_decode, ".json"), "csv": (csv_encode, csv_decode, ".csv"),
+           "excel": (excel_encode, excel_decode, ".xlsx"), "protobuf": (protobuf_encode, protobuf_decode, ".bin")}
+
+
+def peak_memory(fun):
+    """
+    Bytes allocated at the peak of fun(), beyond what the process held
+    before: resident memory with psutil installed, Python allocations
+    (tracemalloc) without it. See PEAK_MEMORY.
+    """
+    if psutil is None:
+        tracemalloc.start()
+        try:
+            fun()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    # psutil has no portable peak: sample the resident set size while fun runs
+    process = psutil.Process()
+    before = peak = process.memory_info().rss
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(0.001):
+            peak = max(peak, process.memory_info().rss)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    try:
+        fun()
+    finally:
+        done.set()
+        sampler.join()
+    return max(peak, process.memory_info().rss) - before
+
+
+def _measure(phase, name, n, path, results):
+    # runs in a fresh process, so nothing from an earlier phase is in memory;
+    # timed once untraced, then run again for the peak, since tracing slows it down
+    encode, decode, _ = FORMATS[name]
+    if phase == "encode":
+        data = employees(n)
+        t0 = time.perf_counter()
+        encode(data, path)
+        elapsed = time.perf_counter() - t0
+        peak = peak_memory(lambda: encode(data, path))
+    else:
+        t0 = time.perf_counter()
+        data = decode(path)
+        elapsed = time.perf_counter() - t0
+        if len(data) != n or data[0] != employees(1)[0]:
+            raise AssertionError(f"{name} decoded different employees")
+        del data
+        peak = peak_memory(lambda: decode(path))
+    results.put((elapsed, max(peak, 0)))
+
+
+def measure(phase, name, n, path):
+    results = Queue()
+    process = Process(target=_measure, args=(phase, name, n, path, results))
+    process.start()
+    process.join()
+    if process.exitcode != 0:
+        raise RuntimeError(f"{name} {phase} failed")
+    return results.get()
+
+
+def run(n, names):
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            if name == "excel" and n > EXCEL_ROWS:
+                print(f"excel: skipped, {n:,} rows do not fit in one sheet")
+                continue
+            path = os.path.join(directory, "employees" + FORMATS[name][2])
+            encode_time, encode_peak = measure("encode", name, n, path)
+            decode_time, decode_peak = measure("decode", name, n, path)
+            rows.append({"format": name, "employees": n, "bytes": os.path.getsize(path),
+                         "encode_per_sec": n / encode_time, "decode_per_sec": n / decode_time,
+                         "encode_peak_bytes": encode_peak, "decode_peak_bytes": decode_peak,
+                         "peak_memory": PEAK_MEMORY})
+    return rows
+
+
+def markdown(rows):
+    lines = ["| format | size (MiB) | encode (rows/s) | decode (rows/s) | encode peak (MiB) | decode peak (MiB) |",
+             "|---|---:|---:|---:|---:|---:|"]
+    for row in rows:
+        lines.append(f"| {row['format']} | {row['bytes'] / 2 ** 20:.1f} | {row['encode_per_sec']:,.0f} "
+                     f"| {row['decode_per_sec']:,.0f} | {row['encode_peak_bytes'] / 2 ** 20:.1f} "
+                     f"| {row['decode_peak_bytes'] / 2 ** 20:.1f} |")
+    lines.append(f"\npeak: {PEAK_MEMORY}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Employee serialization formats compared")
+    parser.add_argument("employees", type=int, nargs="?", default=100_000)
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("--markdown", metavar="PATH", help="also write the table as Markdown")
+    arguments = parser.parse_args()
+
+    rows = run(arguments.employees, arguments.formats)
+    table = markdown(rows)
+    print(table)
+    if arguments.json:
+        with open(arguments.json, "w") as file:
+            json.dump(rows, file, indent=2)
+    if arguments.markdown:
+        with open(arguments.markdown, "w") as file:
+            file.write(table + "\n")
+
+
+if __name__ == "__main__":
+    main()
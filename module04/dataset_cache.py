@@ -0,0 +1,85 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+MAX_BYTES = 1 << 30
+
+
+class DatasetCache:
+    """
+    Parsed datasets pickled (protocol 5) into a cache directory, by default
+    .cache next to the source file. An entry is keyed by the source's
+    absolute path and the parse function, and is valid while the source's
+    size and mtime are unchanged, so a later load skips parsing entirely:
+
+    employees = DatasetCache().load("resources/employees.xlsx", pd.read_excel)
+
+    parse must be a module level function (or method), since its name is
+    part of the key; a lambda, closure or partial needs an explicit key=
+    naming what it parses to. Once the cache directory grows beyond
+    max_bytes, the least recently used entries are deleted.
+    """
+
+    def __init__(self, directory=None, max_bytes=MAX_BYTES):
+        self._directory = None if directory is None else Path(directory)
+        self._max_bytes = max_bytes
+
+    def load(self, path, parse, key=None):
+        path = Path(path).resolve()
+        stat = path.stat()
+        version = (str(path), stat.st_size, stat.st_mtime_ns)
+        directory = self._directory or path.parent / ".cache"
+        if key is None:
+            key = _function_key(parse)
+        key = hashlib.sha1(f"{path}\0{key}".encode()).hexdigest()[:16]
+        entry = directory / f"{path.name}.{key}.pkl"
+        try:
+            with open(entry, "rb") as file:
+                if pickle.load(file) == version:
+                    data = pickle.load(file)
+                    # the entry's mtime is its last use, for eviction
+                    os.utime(entry)
+                    return data
+        except Exception:
+            # missing, torn or stale (e.g. pickled with a class that no longer exists): a miss
+            pass
+        data = parse(path)
+        self._store(directory, entry, version, data)
+        return data
+
+    def _store(self, directory, entry, version, data):
+        directory.mkdir(parents=True, exist_ok=True)
+        temporary = entry.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            pickle.dump(version, file, protocol=5)
+            pickle.dump(data, file, protocol=5)
+        if temporary.stat().st_size > self._max_bytes:
+            # would evict everything else and still not fit
+            temporary.unlink()
+            return
+        os.replace(temporary, entry)
+        self._evict(directory)
+
+    def _evict(self, directory):
+        entries = []
+        for candidate in directory.glob("*.pkl"):
+            try:
+                stat = candidate.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, candidate))
+        total = sum(size for _, size, _ in entries)
+        for _, size, candidate in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            candidate.unlink(missing_ok=True)
+            total -= size
+
+
+def _function_key(parse):
+    # all lambdas share one name, and closures or partials with other arguments share their function's
+    name = getattr(parse, "__qualname__", None)
+    if name is None or "<lambda>" in name or "<locals>" in name:
+        raise ValueError('parse is not a module level function: pass key=')
+    return f"{parse.__module__}.{name}"
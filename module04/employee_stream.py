@@ -0,0 +1,135 @@
+import struct
+from array import array
+from contextlib import ExitStack
+from pathlib import Path
+
+import employee_pb2
+
+OFFSET = struct.Struct("<Q")
+BUFFER_SIZE = 1 << 16
+
+
+def write_employees(path, employees, index=True):
+    """
+    Writes each employee (an Employee message or a (name, department,
+    salary, birth_year, full_time) tuple) as its varint length followed by
+    the message bytes, one at a time, so memory does not grow with the
+    number of employees. With index=True, the byte offset of every record
+    also goes to the sidecar file path + ".idx" (little-endian uint64s).
+    Returns the number of employees written.
+    """
+    if not index:
+        # an index left from an earlier write would point into the wrong records
+        Path(_index_path(path)).unlink(missing_ok=True)
+    count = offset = 0
+    offsets = array("Q")
+    employee_msg = employee_pb2.Employee()
+    with open(path, "wb", buffering=BUFFER_SIZE) as file, ExitStack() as stack:
+        index_file = stack.enter_context(open(_index_path(path), "wb", buffering=BUFFER_SIZE)) if index else None
+        for employee in employees:
+            if not isinstance(employee, employee_pb2.Employee):
+                (employee_msg.name, employee_msg.department, employee_msg.salary, employee_msg.birth_year,
+                 employee_msg.full_time) = employee
+                employee = employee_msg
+            data = employee.SerializeToString()
+            header = _varint(len(data))
+            file.write(header)
+            file.write(data)
+            count += 1
+            if index_file is not None:
+                offsets.append(offset)
+                if len(offsets) == 4_096:
+                    index_file.write(offsets.tobytes())
+                    del offsets[:]
+            offset += len(header) + len(data)
+        if index_file is not None:
+            index_file.write(offsets.tobytes())
+    return count
+
+
+def read_employees(path, start=0):
+    """
+    Generator of the Employee messages of a file written by write_employees,
+    from record start on, parsed from buffered reads. The sidecar index, if
+    there is one, takes it straight to record start; otherwise the records
+    before it are skipped by their length prefixes, without being parsed.
+    """
+    with open(path, "rb", buffering=0) as file:
+        offset = _offset(path, start)
+        skip = 0
+        if offset is None:
+            offset, skip = 0, start
+        file.seek(offset)
+        buffer, position = b"", 0
+        while True:
+            header = _decode_varint(buffer, position)
+            if header is None:
+                chunk = file.read(BUFFER_SIZE)
+                if not chunk:
+                    if position < len(buffer):
+                        raise ValueError("Truncated employee record")
+                    return
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            length, body = header
+            if body + length > len(buffer):
+                # the record goes on past the buffer: read at least the rest of it
+                chunk = file.read(max(BUFFER_SIZE, body + length - len(buffer)))
+                if not chunk:
+                    raise ValueError("Truncated employee record")
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            position = body + length
+            if skip:
+                skip -= 1
+                continue
+            yield employee_pb2.Employee.FromString(buffer[body:position])
+
+
+def read_employee(path, n):
+    """
+    Employee number n (from 0), by the sidecar index if there is one.
+    """
+    employee = next(read_employees(path, n), None)
+    if employee is None:
+        raise IndexError('Employee index out of range')
+    return employee
+
+
+def _offset(path, n):
+    # offset of record n from the sidecar index, None if there is no index or n is past its end
+    try:
+        with open(_index_path(path), "rb") as index_file:
+            index_file.seek(n * OFFSET.size)
+            data = index_file.read(OFFSET.size)
+    except FileNotFoundError:
+        return None
+    return OFFSET.unpack(data)[0] if len(data) == OFFSET.size else None
+
+
+def _index_path(path):
+    return f"{path}.idx"
+
+
+def _varint(value):
+    # base 128, least significant group first, high bit set on every byte but the last
+    data = bytearray()
+    while value > 0x7F:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def _decode_varint(buffer, position):
+    # (value, position after it), or None if the buffer ends inside the varint
+    value = shift = 0
+    while position < len(buffer):
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+    return None
+
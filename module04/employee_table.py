@@ -0,0 +1,140 @@
+import mmap
+import struct
+
+import numpy as np
+
+MAGIC = b"EMPTBL01"
+# magic, employees, departments, name bytes, department bytes
+HEADER = struct.Struct("<8sQQQQ")
+# salary, name index, birth_year, department code, full_time, padding: 16 bytes
+RECORD = struct.Struct("<iIhH?3x")
+RECORD_DTYPE = np.dtype([("salary", "<i4"), ("name", "<u4"), ("birth_year", "<i2"), ("department", "<u2"),
+                         ("full_time", "?"), ("padding", "V3")])
+
+
+def write_employee_file(path, employees):
+    """
+    Writes (full_name, department, salary, birth_year, full_time) tuples as
+    fixed-size records after a header, followed by the string tables:
+    every name once, and every distinct department once (records hold its
+    code). Each table is a uint64 offset array plus the UTF-8 bytes.
+    """
+    departments = {}
+    names = []
+    records = bytearray()
+    for full_name, department, salary, birth_year, full_time in employees:
+        code = departments.setdefault(department, len(departments))
+        records += RECORD.pack(salary, len(names), birth_year, code, full_time)
+        names.append(full_name.encode())
+    name_offsets, name_bytes = _string_table(names)
+    department_offsets, department_bytes = _string_table([department.encode() for department in departments])
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(names), len(departments), len(name_bytes), len(department_bytes)))
+        for section in (records, name_offsets, department_offsets, name_bytes, department_bytes):
+            file.write(section)
+
+
+def _string_table(strings):
+    offsets = np.zeros(len(strings) + 1, dtype="<u8")
+    np.cumsum([len(string) for string in strings], out=offsets[1:])
+    return offsets.tobytes(), b"".join(strings)
+
+
+class EmployeeFile:
+    """
+    A file written by write_employee_file, opened through mmap: employee i
+    is one unpack at a fixed offset, salary/birth_year/full_time are
+    zero-copy NumPy views of the record columns, and with writable=True
+    updates go straight to the mapped file. Views must be dropped before close().
+    """
+
+    def __init__(self, path, writable=False):
+        with open(path, "r+b" if writable else "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, self._count, departments, name_bytes, department_bytes = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError('Not an employee file')
+        offset = HEADER.size + self._count * RECORD.size
+        self._name_offsets = np.frombuffer(self._mmap, dtype="<u8", count=self._count + 1, offset=offset)
+        offset += self._name_offsets.nbytes
+        department_offsets = np.frombuffer(self._mmap, dtype="<u8", count=departments + 1, offset=offset)
+        offset += department_offsets.nbytes
+        self._names_start = offset
+        offset += name_bytes
+        # few departments: decoded once
+        self._departments = [self._mmap[offset + start:offset + end].decode()
+                             for start, end in zip(department_offsets[:-1].tolist(), department_offsets[1:].tolist())]
+        self._department_codes = {department: code for code, department in enumerate(self._departments)}
+        self._records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=self._count, offset=HEADER.size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if not -self._count <= i < self._count:
+            raise IndexError('Employee index out of range')
+        i %= self._count
+        salary, name, birth_year, department, full_time = RECORD.unpack_from(self._mmap, HEADER.size + i * RECORD.size)
+        return self.name(name), self._departments[department], salary, birth_year, full_time
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    @property
+    def departments(self):
+        return list(self._departments)
+
+    @property
+    def salaries(self):
+        return self._records["salary"]
+
+    @property
+    def birth_years(self):
+        return self._records["birth_year"]
+
+    @property
+    def full_time(self):
+        return self._records["full_time"]
+
+    @property
+    def department_codes(self):
+        # indexes into departments
+        return self._records["department"]
+
+    def name(self, index):
+        start, end = self._name_offsets[index:index + 2].tolist()
+        return self._mmap[self._names_start + start:self._names_start + end].decode()
+
+    def update(self, i, department=None, salary=None, birth_year=None, full_time=None):
+        """
+        Changes employee i in place. Names cannot change (their bytes are
+        packed in the string table), and the department must be one the
+        file already has.
+        """
+        full_name, current_department, current_salary, current_birth_year, current_full_time = self[i]
+        if department is not None and department not in self._department_codes:
+            raise ValueError(f'Unknown department: {department}')
+        i %= self._count
+        RECORD.pack_into(self._mmap, HEADER.size + i * RECORD.size,
+                         current_salary if salary is None else salary,
+                         int(self._records["name"][i]),
+                         current_birth_year if birth_year is None else birth_year,
+                         self._department_codes[current_department if department is None else department],
+                         current_full_time if full_time is None else full_time)
+
+    def flush(self):
+        self._mmap.flush()
+
+    def close(self):
+        self._records = self._name_offsets = None
+        if not self._mmap.closed:
+            self._mmap.close()
@@ -1,4 +1,6 @@
 import pandas as pd
+from dataset_cache import DatasetCache
 
-df = pd.read_excel("resources/employees.xlsx")
+# parsed once, then loaded from .cache until employees.xlsx changes
+df = DatasetCache().load("resources/employees.xlsx", pd.read_excel)
 print(df)
@@ -0,0 +1,65 @@
+import csv
+import io
+import os
+from collections import deque
+from functools import partial
+from multiprocessing import Pool
+
+CHUNK_SIZE = 16 << 20
+
+
+def employee_row(row):
+    # exercise07's columns, typed
+    full_name, department, salary, birth_year, full_time = row
+    return full_name, department, int(salary), int(birth_year), full_time == "True"
+
+
+def read_csv_parallel(path, convert=employee_row, processes=None, chunk_size=CHUNK_SIZE):
+    """
+    Generator of lists of converted rows, one list per chunk, in file order.
+    The file is cut into chunks of about chunk_size bytes at line ends, and
+    the chunks are parsed and converted in a process pool while earlier
+    batches are being consumed. At most 2 * processes chunks are submitted
+    or parsed but not yet consumed, so memory stays bounded however large
+    the file is. Quoted fields must not contain line breaks.
+    convert must be picklable, i.e. a module level function.
+    """
+    ranges = _ranges(path, chunk_size)
+    parse = partial(_parse_range, path, convert)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        yield from map(parse, ranges)
+        return
+    with Pool(processes) as pool:
+        # not imap: it submits every chunk at once and buffers all results in this process
+        ranges = iter(ranges)
+        pending = deque(pool.apply_async(parse, (byte_range,)) for _, byte_range in zip(range(2 * processes), ranges))
+        while pending:
+            batch = pending.popleft().get()
+            byte_range = next(ranges, None)
+            if byte_range is not None:
+                pending.append(pool.apply_async(parse, (byte_range,)))
+            yield batch
+
+
+def _ranges(path, chunk_size):
+    # (start, end) byte ranges, every end just after a b"\n" (or at the end of the file)
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as file:
+        start = 0
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _parse_range(path, convert, byte_range):
+    start, end = byte_range
+    with open(path, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode()
+    return [convert(row) for row in csv.reader(io.StringIO(text, newline="")) if row]
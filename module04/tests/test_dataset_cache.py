@@ -0,0 +1,59 @@
+from functools import partial
+
+import pytest
+
+from dataset_cache import DatasetCache
+
+
+def read_text(path):
+    return path.read_text()
+
+
+def test_load_should_parse_once(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("first")
+    cache = DatasetCache(tmp_path / "cache")
+    calls = []
+
+    def parse(path):
+        calls.append(path)
+        return read_text(path)
+
+    assert cache.load(path, parse, key="text") == "first"
+    assert cache.load(path, parse, key="text") == "first"
+    assert len(calls) == 1
+    path.write_text("second version")
+    assert cache.load(path, parse, key="text") == "second version"
+
+
+def test_load_should_key_by_parse_function(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("text")
+    cache = DatasetCache(tmp_path / "cache")
+    assert cache.load(path, read_text) == "text"
+    assert cache.load(path, lambda p: "first", key="first") == "first"
+    assert cache.load(path, lambda p: "second", key="second") == "second"
+
+
+def test_load_should_reject_unnamed_parse_functions(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("text")
+    cache = DatasetCache(tmp_path / "cache")
+    with pytest.raises(ValueError):
+        cache.load(path, lambda p: "first")
+    with pytest.raises(ValueError):
+        cache.load(path, partial(read_text))
+
+
+class Gone:
+    pass
+
+
+def test_entry_that_cannot_be_unpickled_should_be_a_miss(tmp_path, monkeypatch):
+    path = tmp_path / "data.txt"
+    path.write_text("text")
+    cache = DatasetCache(tmp_path / "cache")
+    cache.load(path, lambda p: Gone(), key="gone")
+    # as if the class had been removed by an upgrade
+    monkeypatch.delattr(f"{__name__}.Gone")
+    assert cache.load(path, read_text, key="gone") == "text"
@@ -0,0 +1,63 @@
+import pytest
+
+import employee_pb2
+from bench_serialization import employees
+from employee_stream import read_employee, read_employees, write_employees
+
+
+def as_tuple(employee):
+    return employee.name, employee.department, employee.salary, employee.birth_year, employee.full_time
+
+
+def test_write_and_read_tuples(tmp_path):
+    path = tmp_path / "employees.stream"
+    rows = employees(1_000)
+    assert write_employees(path, rows) == 1_000
+    assert [as_tuple(employee) for employee in read_employees(path)] == rows
+    assert [as_tuple(employee) for employee in read_employees(path, 990)] == rows[990:]
+
+
+def test_write_and_read_messages(tmp_path):
+    path = tmp_path / "employees.stream"
+    messages = [employee_pb2.Employee(name="jack bauer", department="IT", salary=100_000, birth_year=1966,
+                                      full_time=True),
+                employee_pb2.Employee(name="kate austen", department="Sales" * 100)]
+    assert write_employees(path, messages) == 2
+    assert list(read_employees(path)) == messages
+
+
+def test_read_employee_with_and_without_index(tmp_path):
+    path = tmp_path / "employees.stream"
+    rows = employees(500)
+    write_employees(path, rows)
+    assert (tmp_path / "employees.stream.idx").stat().st_size == 500 * 8
+    assert as_tuple(read_employee(path, 0)) == rows[0]
+    assert as_tuple(read_employee(path, 321)) == rows[321]
+    (tmp_path / "employees.stream.idx").unlink()
+    assert as_tuple(read_employee(path, 321)) == rows[321]
+    assert as_tuple(read_employee(path, 499)) == rows[499]
+
+
+@pytest.mark.parametrize("index", [True, False])
+def test_read_employee_out_of_range_should_fail(tmp_path, index):
+    path = tmp_path / "employees.stream"
+    write_employees(path, employees(10), index=index)
+    with pytest.raises(IndexError):
+        read_employee(path, 10)
+
+
+def test_truncated_file_should_fail(tmp_path):
+    path = tmp_path / "employees.stream"
+    write_employees(path, employees(10))
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        list(read_employees(path))
+
+
+def test_write_without_index_should_delete_stale_index(tmp_path):
+    path = tmp_path / "employees.stream"
+    write_employees(path, employees(10))
+    rows = employees(20, seed=7)
+    write_employees(path, rows, index=False)
+    assert not (tmp_path / "employees.stream.idx").exists()
+    assert as_tuple(read_employee(path, 15)) == rows[15]
@@ -0,0 +1,76 @@
+import pytest
+
+from bench_serialization import employees
+from employee_table import EmployeeFile, write_employee_file
+
+
+@pytest.fixture
+def rows():
+    return employees(1_000)
+
+
+@pytest.fixture
+def a_file(tmp_path, rows):
+    path = tmp_path / "employees.tbl"
+    write_employee_file(path, rows)
+    return path
+
+
+def test_write_and_read_should_round_trip(a_file, rows):
+    with EmployeeFile(a_file) as employee_file:
+        assert len(employee_file) == 1_000
+        assert list(employee_file) == rows
+        assert employee_file[-1] == rows[-1]
+        assert employee_file[-1_000] == rows[0]
+        with pytest.raises(IndexError):
+            employee_file[1_000]
+        with pytest.raises(IndexError):
+            employee_file[-1_001]
+
+
+def test_column_views_should_match_records(a_file, rows):
+    with EmployeeFile(a_file) as employee_file:
+        assert employee_file.salaries.tolist() == [row[2] for row in rows]
+        assert employee_file.birth_years.tolist() == [row[3] for row in rows]
+        assert employee_file.full_time.tolist() == [row[4] for row in rows]
+        departments = employee_file.departments
+        assert [departments[code] for code in employee_file.department_codes.tolist()] == [row[1] for row in rows]
+        assert employee_file.name(123) == rows[123][0]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "employees.tbl"
+    write_employee_file(path, [])
+    with EmployeeFile(path) as employee_file:
+        assert len(employee_file) == 0
+        assert list(employee_file) == []
+        assert employee_file.departments == []
+        assert employee_file.salaries.tolist() == []
+
+
+def test_update_should_write_through_to_the_file(a_file, rows):
+    with EmployeeFile(a_file, writable=True) as employee_file:
+        department = rows[1][1]
+        employee_file.update(0, department=department, salary=1, full_time=not rows[0][4])
+        employee_file.update(-1, birth_year=2000)
+        assert employee_file.salaries[0] == 1
+        with pytest.raises(ValueError):
+            employee_file.update(1, department="Legal")
+        employee_file.flush()
+    with EmployeeFile(a_file) as employee_file:
+        assert employee_file[0] == (rows[0][0], department, 1, rows[0][3], not rows[0][4])
+        assert employee_file[-1] == rows[-1][:3] + (2000, rows[-1][4])
+        assert employee_file[1] == rows[1]
+
+
+def test_read_only_file_should_reject_updates(a_file):
+    with EmployeeFile(a_file) as employee_file:
+        with pytest.raises(TypeError):
+            employee_file.update(0, salary=1)
+
+
+def test_other_files_should_be_rejected(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        EmployeeFile(path)
@@ -0,0 +1,37 @@
+from multiprocessing.pool import Pool
+
+from bench_serialization import csv_decode, csv_encode, employees
+from parallel_csv import read_csv_parallel
+
+
+def test_read_csv_parallel_should_return_rows_in_file_order(tmp_path):
+    path = tmp_path / "employees.csv"
+    csv_encode(employees(1_000), path)
+    batches = list(read_csv_parallel(path, processes=2, chunk_size=1_000))
+    assert len(batches) > 1
+    assert [row for batch in batches for row in batch] == csv_decode(path)
+
+
+def test_read_csv_parallel_in_process(tmp_path):
+    path = tmp_path / "employees.csv"
+    csv_encode(employees(100), path)
+    assert [row for batch in read_csv_parallel(path, processes=1, chunk_size=500) for row in batch] == \
+           csv_decode(path)
+
+
+def test_read_csv_parallel_should_bound_submitted_chunks(tmp_path, monkeypatch):
+    path = tmp_path / "employees.csv"
+    csv_encode(employees(2_000), path)
+    submitted = []
+    apply_async = Pool.apply_async
+
+    def counting_apply_async(pool, *args, **kwargs):
+        submitted.append(args)
+        return apply_async(pool, *args, **kwargs)
+
+    monkeypatch.setattr(Pool, "apply_async", counting_apply_async)
+    batches = read_csv_parallel(path, processes=2, chunk_size=500)
+    next(batches)
+    assert len(submitted) <= 2 * 2 + 1
+    rest = sum(1 for _ in batches)
+    assert len(submitted) == rest + 1 > 2 * 2 + 1